@@ -0,0 +1,181 @@
+################################################################################
+"""
+PyCEV Benchmarks - Time Each Stage of Loading Synthetic CEV Records.
+
+Synthetic records (see `synthetic.py`) are generated across a range of
+sample rates, record lengths, analog channel counts, and Relay Word
+sizes; one parameter is varied at a time from a baseline record. Each
+record is loaded repeatedly with each backend, and the fastest time of
+every stage of `Cev.load_data` (splitting the rows, validating the
+checksums, parsing the header, decoding the samples, and evaluating
+the timestamps) is recorded from `Cev.load_stats`, along with the peak
+memory allocated while loading, overall and by each stage. Results are
+written as JSON, and may be compared with the results of an earlier run.
+
+Usage:
+    python benchmarks/bench_load.py [--output results.json]
+        [--compare baseline.json] [--repeat N] [--backend list numpy]
+        [--quick]
+"""
+################################################################################
+# pylint: disable=wrong-import-position, import-error
+
+import sys
+import json
+import platform
+import argparse
+import tracemalloc
+import datetime as dt
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import pycev
+from synthetic import synthetic_cev
+
+# Define the Baseline Record, and the Values Swept for Each Parameter
+BASELINE = {
+    "samples_per_cycle": 16,
+    "cycles": 60,
+    "analog_count": 8,
+    "status_bytes": 8,
+}
+SWEEP = {
+    "samples_per_cycle": [4, 16, 32, 64, 128, 256],
+    "cycles": [15, 60, 180, 600],
+    "analog_count": [4, 8, 16, 32],
+    "status_bytes": [2, 8, 32, 64],
+}
+QUICK_SWEEP = {
+    "samples_per_cycle": [4, 128],
+    "cycles": [15, 180],
+    "analog_count": [4, 32],
+    "status_bytes": [2, 64],
+}
+STAGES = ("split", "checksum", "header", "samples", "timestamps")
+
+
+# Define Function to Enumerate the Benchmark Cases
+def benchmark_cases(sweep):
+    """List Each Unique Case, Varying One Parameter at a Time."""
+    cases = [dict(BASELINE)]
+    for parameter, values in sweep.items():
+        for value in values:
+            case = dict(BASELINE, **{parameter: value})
+            if case not in cases:
+                cases.append(case)
+    return cases
+
+
+# Define Function to Time Each Stage of a Single Load
+def time_stages(data, backend):
+    """Load the Data Once, Timing Each Stage of `Cev.load_data`."""
+    record = pycev.Cev(data=data, backend=backend, profile=True)
+    return {
+        stage: stats.seconds for stage, stats in record.load_stats.items()
+    }
+
+
+# Define Function to Measure the Peak Memory of a Single Load
+def peak_memory(data, backend):
+    """Load the Data Once, Returning the Peak Bytes Allocated."""
+    tracemalloc.start()
+    try:
+        pycev.Cev(data=data, backend=backend)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+# Define Function to Measure the Peak Memory of Each Stage of a Single Load
+def stage_peak_memory(data, backend):
+    """Load the Data Once, Returning the Peak Bytes Allocated by Stage."""
+    record = pycev.Cev(data=data, backend=backend, profile_memory=True)
+    return {
+        stage: stats.peak_memory for stage, stats in record.load_stats.items()
+    }
+
+
+# Define Function to Benchmark a Single Case
+def run_case(case, backend, repeat):
+    """Benchmark the Load of One Synthetic Record with One Backend."""
+    data = synthetic_cev(**case)
+    runs = [time_stages(data, backend) for _ in range(repeat)]
+    stages = {stage: min(run[stage] for run in runs) for stage in STAGES}
+    return {
+        "case": case,
+        "backend": backend,
+        "bytes": len(data),
+        "rows": case["samples_per_cycle"] * case["cycles"],
+        "stages": stages,
+        "total": sum(stages.values()),
+        "peak_memory": peak_memory(data, backend),
+        "stage_peak_memory": stage_peak_memory(data, backend),
+    }
+
+
+# Define Function to Compare Results with an Earlier Run
+def compare(results, baseline):
+    """Print the Ratio of Each Total Time to that of the Baseline."""
+    earlier = {
+        (json.dumps(result["case"], sort_keys=True), result["backend"]):
+        result for result in baseline["results"]
+    }
+    for result in results:
+        key = (json.dumps(result["case"], sort_keys=True), result["backend"])
+        if key not in earlier:
+            continue
+        ratio = result["total"] / earlier[key]["total"]
+        print(f"{result['backend']:>6} {key[0]}: {ratio:.2f}x baseline time")
+
+
+# Define Command-Line Interface
+def main(argv=None):
+    """Run the Benchmarks, and Write the Results."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument("--output", default="bench-results.json",
+                        help="path of the JSON results to write")
+    parser.add_argument("--compare", default=None,
+                        help="path of earlier JSON results to compare")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="number of loads timed for each case")
+    parser.add_argument("--backend", nargs="+", default=None,
+                        choices=pycev.SUPPORTED_BACKENDS)
+    parser.add_argument("--quick", action="store_true",
+                        help="benchmark only the extremes of each sweep")
+    args = parser.parse_args(argv)
+    backends = args.backend or [
+        backend for backend in pycev.SUPPORTED_BACKENDS
+        if backend != pycev.BACKEND_NUMPY or pycev.np is not None
+    ]
+    results = []
+    for case in benchmark_cases(QUICK_SWEEP if args.quick else SWEEP):
+        for backend in backends:
+            result = run_case(case, backend, args.repeat)
+            results.append(result)
+            print(
+                f"{backend:>6} {json.dumps(case)}: "
+                f"{result['total'] * 1000:.2f} ms, "
+                f"{result['peak_memory'] / 1024:.0f} KiB peak"
+            )
+    report = {
+        "pycev_version": pycev.__version__,
+        "python": platform.python_version(),
+        "numpy": getattr(pycev.np, "__version__", None),
+        "platform": platform.platform(),
+        "created": dt.datetime.now().isoformat(timespec="seconds"),
+        "stages": list(STAGES),
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            compare(results, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
+
+# END
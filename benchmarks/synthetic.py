@@ -0,0 +1,123 @@
+################################################################################
+"""
+PyCEV Benchmarks - Generate Synthetic CEV Records.
+
+Records are formed from sinusoidal analog channels and pseudo-random
+status channels with `pycev.Cev.from_channels`, so that they may be
+generated at any sample rate, length, or channel count, and are always
+valid (every row passes checksum validation).
+
+Usage:
+    python benchmarks/synthetic.py OUTPUT.CEV [--samples-per-cycle N]
+        [--cycles N] [--analogs N] [--status-bytes N] [--seed N]
+"""
+################################################################################
+# pylint: disable=wrong-import-position, import-error
+
+import sys
+import math
+import random
+import argparse
+import datetime as dt
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pycev
+
+
+# Define Function to Build a Synthetic Record
+def synthetic_record(samples_per_cycle=16, cycles=60, analog_count=8,
+                     status_bytes=8, frequency=60.0, seed=0, **kwargs):
+    """
+    Build a synthetic record.
+
+    Parameters
+    ----------
+    samples_per_cycle:  int, optional
+                        Number of samples per cycle, default is 16.
+    cycles:             int, optional
+                        Number of cycles in the record, default is 60.
+    analog_count:       int, optional
+                        Number of analog channels, default is 8.
+    status_bytes:       int, optional
+                        Number of bytes of packed status (Relay Word)
+                        data in each row; each byte holds eight status
+                        channels, default is 8.
+    frequency:          float, optional
+                        Nominal system frequency, default is 60.0.
+    seed:               int, optional
+                        Seed of the pseudo-random status channels.
+    **kwargs:           dict, optional
+                        Additional optional parameters, as accepted by
+                        `pycev.Cev`.
+
+    Returns
+    -------
+    record:     pycev.Cev
+                The synthetic record.
+    """
+    generator = random.Random(seed)
+    sample_count = samples_per_cycle * cycles
+    analogs = {}
+    for i in range(analog_count):
+        name = f"I{i}" if i % 2 == 0 else f"V{i}(kV)"
+        magnitude = 1000.0 if i % 2 == 0 else 66.4
+        angle = -2 * math.pi * (i % 3) / 3
+        analogs[name] = [
+            round(magnitude * math.sin(
+                2 * math.pi * n / samples_per_cycle + angle
+            ), 3)
+            for n in range(sample_count)
+        ]
+    statuses = {}
+    for i in range(status_bytes * 8):
+        # Each Status Asserts Once, at Some Point in the Record
+        start = generator.randrange(sample_count + 1)
+        statuses[f"RW{i}"] = [int(n >= start) for n in range(sample_count)]
+    return pycev.Cev.from_channels(
+        analogs=analogs,
+        statuses=statuses,
+        trigger_time=dt.datetime(2023, 1, 16, 10, 20, 30, 125000),
+        trigger_row=sample_count // 4,
+        frequency=frequency,
+        samples_per_cycle=samples_per_cycle,
+        fid="SEL-351S-SYNTHETIC",
+        header={"EVENT": "AG T", "TARGETS": "TRIP"},
+        settings='\r\n' + pycev.append_row_checksum('"[1]"') + '\r\n',
+        **kwargs
+    )
+
+
+# Define Function to Generate Synthetic CEV Data
+def synthetic_cev(**kwargs):
+    """Generate the text of a synthetic CEV; see `synthetic_record`."""
+    return synthetic_record(**kwargs).dumps()
+
+
+# Define Command-Line Interface
+def main(argv=None):
+    """Write a Synthetic CEV File."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument("output", help="path of the CEV file to write")
+    parser.add_argument("--samples-per-cycle", type=int, default=16)
+    parser.add_argument("--cycles", type=int, default=60)
+    parser.add_argument("--analogs", type=int, default=8)
+    parser.add_argument("--status-bytes", type=int, default=8)
+    parser.add_argument("--frequency", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    synthetic_record(
+        samples_per_cycle=args.samples_per_cycle,
+        cycles=args.cycles,
+        analog_count=args.analogs,
+        status_bytes=args.status_bytes,
+        frequency=args.frequency,
+        seed=args.seed,
+    ).dump(args.output)
+
+
+if __name__ == "__main__":
+    main()
+
+# END
@@ -41,12 +41,36 @@ SOFTWARE.
 
 # Standard Imports
 import os
+import io
 import re
-import inspect
+import sys
+import copy
+import contextlib
+import json
+import math
+import time
+import mmap
+import array
+import codecs
+import struct
+import pickle
+import hashlib
+import sqlite3
+import tempfile
+import tracemalloc
+import itertools
+import concurrent.futures
 from typing import Union
 import warnings
 import datetime as dt
 from collections import namedtuple
+from collections.abc import Mapping, Sequence
+
+# Optional Imports
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # Describe Package for External Interpretation
 _name_ = "pycev"
@@ -61,6 +85,58 @@ DIGITAL_SAMPLES = "SAM/CYC_D"
 TRIGGER_KEY_CHAR = ">"
 FREQUENCY_KEY = "FREQ"
 
+# Define Supported Storage Backends
+BACKEND_LIST = "list"
+BACKEND_NUMPY = "numpy"
+SUPPORTED_BACKENDS = (BACKEND_LIST, BACKEND_NUMPY)
+
+# Define Supported Checksum Validation Modes
+CHECKSUM_WARN = "warn"
+CHECKSUM_STRICT = "strict"
+CHECKSUM_DEFERRED = "deferred"
+CHECKSUM_OFF = "off"
+CHECKSUM_MODES = (
+    CHECKSUM_WARN, CHECKSUM_STRICT, CHECKSUM_DEFERRED, CHECKSUM_OFF
+)
+
+# Define Binary Record Format Descriptors
+BINARY_MAGIC = b"PYCEVBIN"
+BINARY_FORMAT_VERSION = 1
+BINARY_ALIGNMENT = 64  # Byte Boundary of Each Binary Section
+DEFAULT_CACHE_SIZE = 1 << 30  # Maximum Size of the Record Cache (1 GiB)
+
+# Define Supported COMTRADE Data Formats
+COMTRADE_ASCII = "ASCII"
+COMTRADE_BINARY = "BINARY"
+COMTRADE_BINARY32 = "BINARY32"
+COMTRADE_FORMATS = (COMTRADE_ASCII, COMTRADE_BINARY, COMTRADE_BINARY32)
+COMTRADE_LIMITS = {  # Greatest Magnitude of the Scaled Analog Samples
+    COMTRADE_ASCII: 32767,
+    COMTRADE_BINARY: 32767,
+    COMTRADE_BINARY32: 2147483647,
+}
+
+
+# Define Structures used for Decoded Data
+Row = namedtuple('Row', ['data', 'validity'])
+EventData = namedtuple('EventData', ['record', 'settings'])
+LoadResult = namedtuple('LoadResult', ['path', 'record', 'error', 'warnings'])
+StageStats = namedtuple(
+    'StageStats', ['stage', 'seconds', 'lines', 'bytes', 'peak_memory']
+)
+ConvertResult = namedtuple(
+    'ConvertResult', ['path', 'files', 'error', 'warnings']
+)
+DataBlock = namedtuple(
+    'DataBlock',
+    ['analogs', 'trigger_row', 'status', 'status_stride']
+)
+ChannelLayout = namedtuple(
+    'ChannelLayout',
+    ['analog_channel_ids', 'status_channel_ids', 'status_bits',
+     'ignored_channels', 'trig_column', 'analog_index', 'status_index']
+)
+
 
 # Custom Exceptions and Warnings
 class MalformedChecksumFailure(UserWarning):
@@ -69,6 +145,9 @@ class MalformedChecksumFailure(UserWarning):
 class UnexpectedFileExtension(UserWarning):
     """File does not appear to use expected "CEV" extension."""
 
+class SerialLoadFallback(UserWarning):
+    """Load options cannot be pickled, files are loaded serially instead."""
+
 class MalformedHeadingDataMismatch(Exception):
     """CEV is Malformed - Heading and Data Section Lengths do not Match."""
 
@@ -78,6 +157,9 @@ class MalformedNoFIDFound(Exception):
 class MalformedNoSampleNumberFound(Exception):
     """CEV is Malformed - Number of Samples Could not be Located."""
 
+class MalformedBinaryRecord(Exception):
+    """Binary Record is Malformed - Format Could not be Interpreted."""
+
 
 # Define Function to Interpret Row-Wise Checksum for Validity
 def row_wise_checksum(row_data, constrain=True):
@@ -107,8 +189,6 @@ def row_wise_checksum(row_data, constrain=True):
                 and validity marker in the form of:
                 Row('data':str, 'validity':bool)
     """
-    # Define the namedtuple Structure used for Return
-    Row = namedtuple('Row', ['data', 'validity'])
     # Clean Input Data
     row_data = row_data.replace('\r', '')
     row_data = row_data.replace('\n', '')
@@ -122,6 +202,19 @@ def row_wise_checksum(row_data, constrain=True):
         signed=False
     )
     # Evaluate the Checksum
+    checksum = _row_sum(row_contents, constrain=constrain)
+    # Remove Trailing Comma if Present
+    if row_contents.endswith(','):
+        row_contents = row_contents[:-1]  # Trim Comma
+    # Pack Structure
+    valid = checksum == checksum_int
+    row = Row(data=row_contents, validity=valid)
+    return row
+
+
+# Define Function to Sum the Characters of a Row
+def _row_sum(row_contents, constrain=True):
+    """Sum the Characters of the Row Contents to Form its Checksum."""
     if isinstance(row_contents, str):
         checksum = sum(map(ord, row_contents))
     else:
@@ -129,13 +222,120 @@ def row_wise_checksum(row_data, constrain=True):
     # Cap the Value if Needed
     if constrain:
         checksum = checksum & 0xffff  # Bit-wise AND with 16-bit maximum
-    # Remove Trailing Comma if Present
+    return checksum
+
+
+# Define Function to Append the Checksum to a Row
+def append_row_checksum(row_contents):
+    """
+    Append the checksum to the contents of a row.
+
+    This function forms a row of a CEV from its contents, such that
+    the row may be validated by `row_wise_checksum`, as:
+
+    "some,data,in,the,event","checksum"
+
+    Parameters
+    ----------
+    row_contents:   str
+                    The contents of the row, without the trailing comma
+                    or the checksum.
+
+    Returns
+    -------
+    row_data:       str
+                    The row, with the trailing comma and the checksum.
+    """
+    row_contents += ','
+    return f'{row_contents}"{_row_sum(row_contents):04X}"'
+
+
+# Define Function to Remove the Checksum from a Row
+def _strip_checksum(row_data):
+    """Remove the Checksum Characters and Trailing Comma from a Row."""
+    row_contents = row_data[:-6]  # Remove Checksum Characters
     if row_contents.endswith(','):
         row_contents = row_contents[:-1]  # Trim Comma
-    # Pack Structure
-    valid = checksum == checksum_int
-    row = Row(data=row_contents, validity=valid)
-    return row
+    return row_contents
+
+
+# Define Function to Validate the Checksums of Every Row in a Record
+def validate_record_checksums(record: Union[str, bytes]):
+    """
+    Validate the row-wise checksums of an entire record at once.
+
+    Where `row_wise_checksum` validates a single row, this function
+    evaluates every row of a record (or of a relay settings section)
+    in one pass over the raw bytes. When NumPy is available, a
+    cumulative byte-sum is taken over the whole buffer and each row's
+    sum is found from the offsets of the row boundaries, otherwise the
+    rows are summed directly as bytes. Empty rows are ignored.
+
+    Parameters
+    ----------
+    record:     [str, bytes]
+                The record text, whose rows are each of the form:
+                "some,data,in,the,event","checksum"
+
+    Returns
+    -------
+    invalid:    set of int
+                The (one-based) line numbers of the rows which fail
+                checksum validation; empty when every row is valid.
+    """
+    if isinstance(record, str):
+        try:
+            record = record.encode('latin-1')
+        except UnicodeEncodeError:
+            # Characters Beyond a Single Byte, Validate Each Row Directly
+            return {
+                i + 1 for i, line in enumerate(record.split('\n'))
+                if line.replace('\r', '') not in ('', ' ') and
+                not row_wise_checksum(line).validity
+            }
+    if not record:
+        return set()
+    if np is None:
+        invalid = set()
+        for i, line in enumerate(record.split(b'\n')):
+            line = line.replace(b'\r', b'')
+            if line in (b'', b' '):
+                continue
+            try:
+                checksum = int(line[-5:-1], base=16)
+            except ValueError:
+                checksum = -1
+            if (sum(line[:-6]) & 0xffff) != checksum:
+                invalid.add(i + 1)
+        return invalid
+    # Locate the Row Boundaries Throughout the Buffer
+    buffer = np.frombuffer(record, dtype=np.uint8)
+    stops = np.append(np.flatnonzero(buffer == 0x0A), len(buffer))
+    starts = np.concatenate(([0], stops[:-1] + 1))
+    # Exclude Trailing Carriage Returns from Each Row
+    has_cr = (stops > starts) & (buffer[np.maximum(stops - 1, 0)] == 0x0D)
+    stops = stops - has_cr
+    lengths = stops - starts
+    first_chars = buffer[np.minimum(starts, len(buffer) - 1)]
+    is_blank = (lengths == 0) | ((lengths == 1) & (first_chars == 0x20))
+    # Evaluate Every Row Sum from the Cumulative Sum of the Buffer
+    # (the 16-bit accumulator wraps exactly as the checksum is constrained)
+    cumulative = np.zeros(len(buffer) + 1, dtype=np.uint16)
+    np.cumsum(buffer, dtype=np.uint16, out=cumulative[1:])
+    sized = lengths >= 6
+    content_stops = np.where(sized, stops - 6, starts)
+    sums = cumulative[content_stops] - cumulative[starts]
+    # Decode the Four Hexadecimal Checksum Characters of Every Row
+    positions = np.where(sized, stops - 5, 0)[:, None] + np.arange(4)
+    chars = buffer[np.minimum(positions, len(buffer) - 1)].astype(np.int32)
+    digits = np.where(chars <= 0x39, chars - 0x30, (chars | 0x20) - 0x57)
+    hex_valid = np.all((digits >= 0) & (digits <= 15), axis=1)
+    checksums = (
+        (digits[:, 0] << 12) | (digits[:, 1] << 8) |
+        (digits[:, 2] << 4) | digits[:, 3]
+    )
+    failed = ~is_blank & ~(sized & hex_valid & (sums == checksums))
+    return set((np.flatnonzero(failed) + 1).tolist())
 
 
 # Define Function to Split Event Data from Relay Settings
@@ -163,8 +363,6 @@ def split_event_and_relay_data(data):
                 where 'record' is the event information, and 'settings'
                 is the relay's configuration settings.
     """
-    # Define the namedtuple Structure used for Return
-    EventData = namedtuple('EventData', ['record', 'settings'])
     # Gather the Components from the Event Record
     record, settings = data.split(EVENT_SETTINGS_SEP)
     # Prepare Structure
@@ -172,680 +370,4516 @@ def split_event_and_relay_data(data):
     return event
 
 
-# Define the Primary Class
-class Cev():
+# Define Function to Decode the Sample Rows of an Event Record
+def decode_data_block(data_lines, analog_count, use_numpy=False,
+                      analog_columns=None, status_columns=None):
     """
-    SEL CEV File Reader.
+    Decode all sample rows of an event record in one bulk pass.
 
-    This class serves to provide functionality to read SEL (Schweitzer
-    Engineering Laboratories) Compressed EVent records (CEV files) and
-    grant pragmatic access to the key components of these records. The
-    methods, attributes, and properties of this class serve to expose
-    data in a manner that supports scientific analysis and allow common
-    data-science tools such as NumPy, Matplotlib, Pandas, and others to
-    conveniently interpret information. This all is in an effort to
-    support data scientists and engineers to make empowered, intelligent
-    decisions about the power systems which they are responsible for.
+    The sample rows which follow the channel heading row are each
+    formed as:
 
-    Within this module, this class (`Cev`) is also aliased as CEV for
-    programming convenience, and to allow users to access the functionality
-    in a format that is consistent with their work.
+    analog_1,...,analog_n,"trig","hex-status"
+
+    Rather than interpreting these rows one-by-one, all rows are joined
+    and split once, each analog channel is converted as a single column,
+    and every hex-status string is decoded with a single `bytes.fromhex`
+    call. Any columns which follow the hex-status of a row are ignored.
+    The resulting data is returned as a namedtuple of the form:
+    DataBlock('analogs', 'trigger_row':int, 'status', 'status_stride':int)
 
     Parameters
     ----------
-    file:       str, optional
-                String describing the relative or fully qualified path to
-                the CEV file that should be read. Optionally used during
-                class initialization, may also be loaded using the `load`
-                method.
-    data:       str, optional
-                String describing all contents of the CEV file as read.
-                Optionally used during class initialization to pre-load
-                the contents of the CEV file.
-    **kwargs:   dict, optional
-                Additional optional parameters which may be specified
-                during class initialization. Common arguments include:
+    data_lines:     list of str
+                    The checksum-stripped sample rows of the record.
+    analog_count:   int
+                    Number of analog channels which lead each row.
+    use_numpy:      bool, optional
+                    Control to return the analogs as a 2-D NumPy array
+                    (channels x samples), and the status as a 2-D array
+                    of uint8 (samples x bytes), default is False.
+    analog_columns: list of int, optional
+                    Column indices of the analog channels which should
+                    be converted (in the order they should be returned),
+                    default is to convert all analog channels.
+    status_columns: list of int, optional
+                    Indices of the packed status bytes which should be
+                    retained (in the order they should be returned),
+                    default is to retain all status bytes.
 
-                    - encoding:     str, file encoding such as 'utf-8'
-                    - decode_opt:   str, file decoding option such as
-                                    'strict', 'ignore', 'replace', or
-                                    'backslashreplace' as defined by
-                                    standard str.decode method.
-                    - ignore_warnings: bool, control to ignore warnings
+    Returns
+    -------
+    block:          namedtuple
+                    The namedtuple containing the analog channels, the
+                    index of the trigger row (None when no row carries
+                    the trigger marker), the packed status bytes, and
+                    the number of status bytes in each row.
 
-                Class initialization may include one or more kwargs,
-                but none are required.
+    Raises
+    ------
+    MalformedHeadingDataMismatch
+        If any of the rows contains fewer columns than are described by
+        the channel heading.
+    """
+    num_rows = len(data_lines)
+    stride = analog_count + 2  # Analogs, Trigger Column, and Hex Status
+    fields = ','.join(data_lines).split(',') if num_rows else []
+    if len(fields) != num_rows * stride:
+        # Extra Trailing Columns are Tolerated, and Ignored
+        rows = [line.split(',') for line in data_lines]
+        if any(len(row) < stride for row in rows):
+            raise MalformedHeadingDataMismatch(
+                "CEV may be malformed, channel heading and data length "
+                "don't match"
+            )
+        fields = [field for row in rows for field in row[:stride]]
+    if analog_columns is None:
+        analog_columns = range(analog_count)
+    # Convert Each Analog Channel as a Whole Column
+    if use_numpy:
+        analogs = np.empty((len(analog_columns), num_rows), dtype=np.float64)
+        for i, column in enumerate(analog_columns):
+            analogs[i] = fields[column::stride]
+    else:
+        analogs = [
+            list(map(float, fields[column::stride]))
+            for column in analog_columns
+        ]
+    # Identify Trigger Data Row
+    trigger_row = None
+    for i, value in enumerate(fields[analog_count::stride]):
+        if TRIGGER_KEY_CHAR in value:
+            trigger_row = i
+            break
+    # Decode all Hex Status Strings at Once, Leave them Packed
+    status = bytes.fromhex(
+        ''.join(fields[analog_count + 1::stride]).replace('"', '')
+    )
+    status_stride = len(status) // num_rows if num_rows else 0
+    if status_columns is not None:
+        # Retain Only the Requested Bytes of Each Row
+        selected = bytearray(num_rows * len(status_columns))
+        for i, column in enumerate(status_columns if num_rows else ()):
+            selected[i::len(status_columns)] = status[column::status_stride]
+        status = bytes(selected)
+        status_stride = len(status_columns)
+    if use_numpy:
+        status = np.frombuffer(status, dtype=np.uint8).reshape(
+            num_rows, status_stride
+        )
+    return DataBlock(
+        analogs=analogs,
+        trigger_row=trigger_row,
+        status=status,
+        status_stride=status_stride,
+    )
 
-    Attributes
-    ----------
-    analog_channels:        list of list of float
-                            List of lists containing the analog samples
-                            for each channel.
-    analog_channel_ids:     list of str
-                            List of the analog channel names whose index
-                            values correspond directly to the channel
-                            datasets in `analog_channels`.
-    analog_count:           int
-                            Number of analog channels present in CEV.
-    channels_count:         int
-                            Total number of analog and digital (status)
-                            channels in CEV.
-    data:                   str
-                            Full string context of the entire CEV record;
-                            includes both the event information and relay
-                            settings that were included with the record.
-    digital_channels:       list of list of bool
-                            List of lists containing boolean states for
-                            each digital (status) channel present in CEV.
-                            This list presents itself as an alias to the
-                            `status_channels` class attribute.
-    digital_channel_ids:    list of str
-                            List of the digital (status) channel names
-                            whose index values correspond directly to the
-                            channel datasets in `digital_channels`. This
-                            list presents itself as an alias to the
-                            `status_channel_ids` class attribute.
-    digital_count:          int
-                            Number of digital channels present in the CEV.
-    fid:                    str
-                            Relay firmware identification string; does not
-                            include the 'FID=' specifier.
-    frequency:              float
-                            The recorded nominal frequency present in the
-                            CEV.
-    raw_fid:                str
-                            "Raw" relay firmware identification string;
-                            includes the 'FID=' specifier to lead the string.
-    record:                 str
-                            Event record data-sub-section contents; contains
-                            only the event-related data and heading fields of
-                            the CEV that was loaded.
-    record_lines:           list of str
-                            Row-wise split contents of the record with all
-                            newline and carriage-return characters removed.
-    settings:               str
-                            Relay settings data-sub-section contents; contains
-                            only the relay settings portion of the CEV that
-                            was loaded.
-    status_channels:        list of list of bool
-                            List of lists containing boolean states for
-                            each status (digital) channel present in CEV.
-                            This list is aliased to the `digital_channels`
-                            class attribute.
-    status_channel_ids:     list of str
-                            List of the status (digital) channel names
-                            whose index values correspond directly to the
-                            channel datasets in `status_channels`. This
-                            list is aliased to the `digital_channel_ids`
-                            class attribute.
-    status_count:           int
-                            Number of status channels present in the CEV.
-    trigger_time:           datetime
-                            Date-time structure indicating when the event
-                            was "triggered" by protection logic in the relay.
 
-    Examples
-    --------
-    >>> from pycev import CEV
-    >>> # Load a file and parse, directly.
-    >>> record = CEV(file="./event-report.cev")
-    >>> print("Trigger time = {}s".format(record.trigger_time))
+# Define Lazy Sequence of Packed Status Channels
+class PackedStatusChannels(Sequence):
     """
+    Lazily Unpacked Status (Digital) Channels.
 
-    def __init__(self, file: str = None, data: Union[str, bytes] = None,
-                 **kwargs):
-        """
-        Prepare CEV Reader.
+    Sequence presenting the status channels of a `Cev` as though they
+    were a list of lists, while the underlying data remains stored as
+    packed bytes (one row of bytes per sample). Each channel is unpacked
+    only when it is indexed, and unused ('*') bits are never unpacked.
 
-        Class initialization with optional data input methods for file-path
-        and raw data as either a string or bytes.
-        """
-        # Handle Encoding Type if Provided
-        if "encoding" in kwargs:
-            encoding = kwargs['encoding']
-        else:
-            encoding = None
+    Parameters
+    ----------
+    record:     Cev
+                The parsed record whose packed status data should be
+                presented.
+    """
 
-        # Handle Decoding Option if Provided
-        if "decode_opt" in kwargs:
-            self._decode_opt = kwargs['decode_opt']
-        elif "decode_option" in kwargs:
-            self._decode_opt = kwargs['decode_option']
-        else:
-            self._decode_opt = 'strict'
+    def __init__(self, record):
+        """Prepare the Lazy Status Sequence."""
+        self._record = record
 
-        # Handle Warnings Override
-        if "ignore_warnings" in kwargs:
-            self.ignore_warnings = kwargs["ignore_warnings"]
-        else:
-            self.ignore_warnings = False
+    def __len__(self):
+        """Return the Number of Named Status Channels."""
+        return len(self._record._status_bits)
 
-        # Prepare Defaults
-        self.data = ''
-        self.record = ''
-        self.settings = ''
-        self.record_lines = []
-        self.fid = ''
-        self.raw_fid = ''
-        self.time = []
-        self.trigger_time = dt.datetime(1970, 1, 1)  # Default to Epoch
-        self.channels_count = 0
-        self.analog_channels = []
-        self.analog_channel_ids = []
-        self.status_channels = []
-        self.status_channel_ids = []
-        self.digital_channels = self.status_channels  # Alias the Digitals
-        self.digital_channel_ids = self.status_channel_ids  # Alias Digitals
-        self.analog_count = 0
-        self.status_count = 0
-        self.digital_count = 0
-        self.frequency = 0.0
+    def __getitem__(self, index):
+        """Unpack the Status Channel(s) at the Index."""
+        # pylint: disable=protected-access
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self._record._unpack_status(self._record._status_bits[index])
 
-        self.year = 1970
-        self.month = 1
-        self.day = 1
-        self.hour = 0
-        self.min = 0
-        self.sec = 0
-        self.msec = 0
 
-        self._ignored_channels = []
-        self._trig_column = -1
-        self._trig_row = 0
-        self._analog_samp_timedelta = None
-        self._digital_samp_timedelta = None
-        self._properties = {}  # Empty Dictionary of the Keys
+# Define Lazy Sequence of Memory-Mapped Analog Channels
+class MappedAnalogChannels(Sequence):
+    """
+    Lazily Read Analog Channels of a Binary Record.
 
-        # Prepare Data or File if Provided
-        if isinstance(file, (str, bytes)):
-            self.load(file=file, encoding=encoding)
-        elif hasattr(file, "read"): # Probably a file-like object?
-            self.load_data(data=file.read(), encoding=encoding)
-        elif isinstance(data, (str, bytes)):
-            self.load_data(data=data, encoding=encoding)
+    Sequence presenting the analog channels of a binary record (see
+    `Cev.save` and `Cev.open_binary`) as though they were a list of
+    lists, while the samples remain in the memory-mapped file. Each
+    channel is stored contiguously, so indexing a channel reads only
+    the pages of the file which hold that channel.
 
-    # Define Simple Method to Identify Class Keys
-    def _keys(self):
-        """Capture Class Attributes as Keys."""
-        return self.__dict__.keys()
+    Parameters
+    ----------
+    buffer:         memoryview
+                    The analog section of the mapped binary record,
+                    holding each channel in turn as little-endian
+                    doubles.
+    count:          int
+                    Number of analog channels.
+    sample_count:   int
+                    Number of samples in each channel.
 
-    # Define Simple File Extension Validator
-    def _validate_extension(self, file):
-        """Validate Extension is of *.CEV Format."""
-        if not os.path.exists(file):
-            raise FileNotFoundError(
-                "Argument `file` must be a valid file-path to a CEV file."
-            )
-        _, ext = os.path.splitext(file)
-        if 'CEV' not in ext.upper():
-            # Throw Warning to User
-            if not self.ignore_warnings:
-                # Capture Pertinent Information
-                parent = inspect.stack()[2]
-                callfile = parent.filename
-                lineno = parent.lineno
-                warnings.showwarning(
-                    message=(
-                        'File does not appear to use "CEV" extension,' +
-                        f' instead is "{ext}".'
-                    ),
-                    category=UnexpectedFileExtension,
-                    filename=callfile,
-                    lineno=lineno,
-                )
-        # Proceed Without Exception
+    Notes
+    -----
+    The mapped buffer cannot be pickled, so the sequence is pickled as
+    the list of channels it presents; a record returned from a worker
+    process therefore holds its analog channels in memory.
+    """
 
-    # Define Simple Decoder for Data
-    def _decode(self, data, encoding):
-        """Simply Decode the Data Using the Specified Encoding Format."""
-        if encoding is not None:
-            return data.decode(encoding, self._decode_opt)
-        else:
-            return data
+    def __init__(self, buffer, count, sample_count):
+        """Prepare the Lazy Analog Sequence."""
+        self._buffer = buffer
+        self._count = count
+        self._sample_count = sample_count
 
-    # Define Function to Prepare Record and Validate Checksums
-    def _prepare_and_validate_record(self):
+    def __len__(self):
+        """Return the Number of Analog Channels."""
+        return self._count
+
+    def __getitem__(self, index):
+        """Read the Analog Channel(s) at the Index."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = range(self._count)[index]
+        first = index * self._sample_count * 8
+        values = array.array('d')
+        values.frombytes(
+            self._buffer[first:first + self._sample_count * 8]
+        )
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return values.tolist()
+
+    def __reduce__(self):
+        """Pickle the Channels as a List, Read from the Mapped File."""
+        return (list, (self[:],))
+
+
+# Define Lazy Arithmetic Time Axis
+class TimeAxis(Sequence):
+    """
+    Lazily Evaluated Sample Time Axis.
+
+    Sequence presenting the timestamps of uniformly spaced samples as
+    though they were a list of `datetime` objects, while storing only
+    a reference time, the offset of the first sample from it, the
+    sample period, and the number of samples. Each timestamp is computed
+    directly from its index, so no rounding error accumulates along the
+    axis, and slicing produces a new `TimeAxis` without evaluating any
+    timestamps.
+
+    Parameters
+    ----------
+    reference:  datetime
+                Reference time (such as the trigger time) from which
+                the samples are offset.
+    period:     float
+                Time between samples, in seconds.
+    count:      int
+                Number of samples.
+    offset:     float, optional
+                Time of the first sample relative to the reference, in
+                seconds, default is 0.0.
+
+    Examples
+    --------
+    >>> import datetime as dt
+    >>> from pycev import TimeAxis
+    >>> axis = TimeAxis(dt.datetime(2023, 1, 16), period=0.001, count=4)
+    >>> axis[3]
+    datetime.datetime(2023, 1, 16, 0, 0, 0, 3000)
+    """
+
+    def __init__(self, reference: dt.datetime, period: float, count: int,
+                 offset: float = 0.0):
+        """Prepare the Time Axis."""
+        self.reference = reference
+        self.period = period
+        self.count = count
+        self.offset = offset
+
+    def __len__(self):
+        """Return the Number of Samples along the Time Axis."""
+        return self.count
+
+    def __getitem__(self, index):
+        """Evaluate the Timestamp(s) at the Index."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.count)
+            return TimeAxis(
+                reference=self.reference,
+                period=self.period * step,
+                count=len(range(start, stop, step)),
+                offset=self.offset + start * self.period,
+            )
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("TimeAxis index out of range")
+        return self.reference + dt.timedelta(
+            seconds=self.offset + index * self.period
+        )
+
+    def __repr__(self):
+        """Represent the Time Axis."""
+        return (
+            f"TimeAxis(reference={self.reference!r}, period={self.period!r}, "
+            f"count={self.count!r}, offset={self.offset!r})"
+        )
+
+    def to_seconds(self, origin: dt.datetime = None):
+        """
+        *Evaluate the time axis as seconds*.
+
+        Parameters
+        ----------
+        origin:     datetime, optional
+                    Time from which the seconds should be measured,
+                    default is the reference time of the axis.
+
+        Returns
+        -------
+        seconds:    list of float
+                    The time of each sample in seconds relative to the
+                    origin; when NumPy is installed, this is an array of
+                    float.
+        """
+        offset = self.offset
+        if origin is not None:
+            offset += (self.reference - origin).total_seconds()
+        if np is not None:
+            return np.arange(self.count) * self.period + offset
+        return [i * self.period + offset for i in range(self.count)]
+
+    def to_numpy(self):
+        """
+        *Evaluate the time axis as an array of datetime64*.
+
+        Returns
+        -------
+        time:       numpy.ndarray
+                    The timestamp of each sample with nanosecond
+                    resolution, as an array of `datetime64[ns]`.
+        """
+        if np is None:
+            raise ImportError(
+                "Evaluating the time axis as an array requires NumPy."
+            )
+        offsets = np.rint(
+            (np.arange(self.count) * self.period + self.offset) * 1e9
+        )
+        return (
+            np.datetime64(self.reference, 'ns') +
+            offsets.astype('timedelta64[ns]')
+        )
+
+
+# Define Function to Map Each Channel Name to its Index
+def _channel_index_map(channel_ids):
+    """Map Each Channel Name to its Index, Keeping the First of Any Repeat."""
+    index = {}
+    for i, channel in enumerate(channel_ids):
+        index.setdefault(channel, i)
+    return index
+
+
+# Define Function to Classify the Columns of the Channel Heading
+def _channel_layout(heading):
+    """Identify the Analog and Digital Channel Names of the Heading."""
+    # Split on either a comma (',') or a space (' ')
+    channels = re.split(r',| ', heading)
+    is_analog = True  # First Channel from Left is Analog
+    analog_channel_ids = []
+    status_channel_ids = []
+    status_bits = []  # Packed Bit Position of Each Status Channel
+    ignored_channels = set()
+    trig_column = -1
+
+    # Identify Channel Names as Analog or Digital
+    bit_position = 0  # Position of Digital Bit in Packed Status Data
+    for i, channel in enumerate(channels):
+        # Check if Trig Channel
+        if '"TRIG"' == channel:
+            is_analog = False
+            ignored_channels.add(i)
+            trig_column = i
+            continue  # Don't Track the TRIP Channel
+        # Remove Double Quotes
+        channel = channel.replace('"', '')
+        if '' == channel:
+            continue  # Don't Track Empty Channel Names
+        if is_analog:
+            # Channel Must be Valid, Append Name to Analogs
+            analog_channel_ids.append(channel)
+            continue
+        # Every Remaining Name Occupies One Bit of the Packed Digitals
+        if '*' == channel:
+            ignored_channels.add(i)
+        else:
+            status_channel_ids.append(channel)
+            status_bits.append(bit_position)
+        bit_position += 1
+    # Resolve the Layout Completely, so Records may Share it As-Is
+    return ChannelLayout(
+        analog_channel_ids=tuple(analog_channel_ids),
+        status_channel_ids=tuple(status_channel_ids),
+        status_bits=tuple(status_bits),
+        ignored_channels=tuple(sorted(ignored_channels)),
+        trig_column=trig_column,
+        analog_index=_channel_index_map(analog_channel_ids),
+        status_index=_channel_index_map(status_channel_ids),
+    )
+
+
+# Define Function to Warn on Behalf of the Caller of this Module
+def _warn(message, category):
+    """Warn, Attributing the Warning to the First Caller Outside pycev."""
+    # Walk the Frames (Without Reading Source) to Find the Stack Level
+    frame = sys._getframe(1)  # pylint: disable=protected-access
+    stacklevel = 2
+    while frame is not None and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+        stacklevel += 1
+    warnings.warn(message, category, stacklevel=stacklevel)
+
+
+# Define Structured Report of the Problems Found while Loading
+class ValidationReport():
+    """
+    Validation Report of a Loaded CEV.
+
+    Structured summary of the problems found while loading a record,
+    such that they may be inspected programmatically (for example, by
+    a batch job) rather than by capturing warnings. Each `Cev` holds its
+    report as its `validation` attribute.
+
+    Attributes
+    ----------
+    invalid_lines:  list of int
+                    Sorted (one-based) line numbers of the record which
+                    fail checksum validation; None when the checksums
+                    have not been evaluated (such as in the 'deferred'
+                    checksum mode, until first accessed, or when checksum
+                    validation is 'off').
+    extension:      str
+                    The file extension, when it is not the expected
+                    ".CEV" extension; otherwise None.
+    anomalies:      list of str
+                    Descriptions of other inconsistencies found in the
+                    record, such as a missing trigger row, or a number
+                    of samples which does not agree with the header.
+    """
+
+    def __init__(self, invalid_lines: list = None, extension: str = None,
+                 anomalies: list = None):
+        """Prepare the Report."""
+        self.invalid_lines = invalid_lines
+        self.extension = extension
+        self.anomalies = anomalies if anomalies is not None else []
+
+    @property
+    def ok(self):
+        """True when No Problems were Found."""
+        return not (self.invalid_lines or self.extension or self.anomalies)
+
+    def __repr__(self):
+        """Describe the Report."""
+        return (
+            f"ValidationReport(invalid_lines={self.invalid_lines!r}, "
+            f"extension={self.extension!r}, anomalies={self.anomalies!r})"
+        )
+
+
+# Define Indexed, Lazily Parsed Relay Settings
+class RelaySettings(Mapping):
+    """
+    Indexed Relay Settings of a CEV.
+
+    Mapping presenting the relay settings section of a CEV (following
+    the '"SETTINGS"' row) by setting name. On first access, the section
+    is indexed once, locating the row of each setting within its group
+    (such as '[1]' for the first settings group, or '[INFO]'), but each
+    value is parsed only when it is accessed. Settings which appear in
+    several groups are found by name in the first group which holds
+    them, or by a (group, name) tuple in any group.
+
+    Parameters
+    ----------
+    settings:   str
+                The relay settings section of the CEV, as split by
+                `split_event_and_relay_data`.
+
+    Attributes
+    ----------
+    text:       str
+                The relay settings section of the CEV.
+
+    Examples
+    --------
+    >>> from pycev import CEV
+    >>> record = CEV(file="./event-report.cev")
+    >>> record.settings_map["51PP"]
+    '1.50'
+    >>> record.settings_map["2", "51PP"]
+    '2.00'
+    """
+
+    def __init__(self, settings: str):
+        """Prepare the Settings Mapping."""
+        self.text = settings
+        self._rows = None  # Map of (Group, Name) to Row Offsets
+        self._names = None  # Map of Name to its First (Group, Name)
+        self._groups = None
+        self._values = {}  # Values Parsed So Far
+
+    def _index(self):
+        """Locate the Row of Each Setting in a Single Pass."""
+        text = self.text
+        self._rows = {}
+        self._names = {}
+        self._groups = []
+        group = ''
+        start = 0
+        while start < len(text):
+            stop = text.find('\n', start)
+            if stop == -1:
+                stop = len(text)
+            end = stop - 1 if text[stop - 1:stop] == '\r' else stop
+            # Each Row Appears as: "NAME,""VALUE""","XXXX" or "[GROUP]"
+            if end - start > 6 and text[start] == '"':
+                if text[start + 1] == '[':
+                    group = text[start + 2:end].split(']')[0]
+                    self._groups.append(group)
+                else:
+                    name_stop = min(
+                        position for position in (
+                            text.find(',', start, end),
+                            text.find('=', start, end),
+                            end,
+                        ) if position != -1
+                    )
+                    name = text[start + 1:name_stop]
+                    self._rows.setdefault((group, name), (name_stop, end))
+                    self._names.setdefault(name, (group, name))
+            start = stop + 1
+
+    def _key(self, key):
+        """Identify the (Group, Name) of a Setting."""
+        if self._rows is None:
+            self._index()
+        if isinstance(key, tuple):
+            if key not in self._rows:
+                raise KeyError(key)
+            return key
+        return self._names[key]
+
+    def __getitem__(self, key):
+        """Parse the Value of the Setting."""
+        key = self._key(key)
+        if key not in self._values:
+            name_stop, end = self._rows[key]
+            # Remove the Checksum, Trailing Comma, and Enclosing Quotes
+            value = self.text[name_stop + 1:end - 6].rstrip(',')[:-1]
+            if self.text[name_stop] == ',':
+                # Quoted Value, Whose Quotes are Doubled
+                value = value.replace('""', '"')
+                if len(value) > 1 and value[0] == value[-1] == '"':
+                    value = value[1:-1]
+            self._values[key] = value
+        return self._values[key]
+
+    def __contains__(self, key):
+        """Test whether the Setting is Present."""
+        try:
+            self._key(key)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        """Iterate over the Distinct Setting Names."""
+        if self._names is None:
+            self._index()
+        return iter(self._names)
+
+    def __len__(self):
+        """Return the Number of Distinct Setting Names."""
+        if self._names is None:
+            self._index()
+        return len(self._names)
+
+    @property
+    def groups(self):
+        """Names of the Settings Groups, in Order of Appearance."""
+        if self._groups is None:
+            self._index()
+        return list(self._groups)
+
+    def group(self, group: str):
+        """
+        *Parse the settings of one group*.
+
+        Parameters
+        ----------
+        group:      str
+                    Name of the settings group, such as '1' or 'INFO'.
+
+        Returns
+        -------
+        settings:   dict
+                    Map of each setting name in the group to its value.
+        """
+        if self._rows is None:
+            self._index()
+        if group not in self._groups:
+            raise KeyError(group)
+        return {
+            name: self[group, name]
+            for group_name, name in self._rows if group_name == group
+        }
+
+    @property
+    def invalid_lines(self):
+        """
+        Line numbers of the settings which fail checksum validation.
+
+        Sorted list of the (one-based) line numbers, counted from the
+        start of the settings section.
+        """
+        return sorted(validate_record_checksums(self.text))
+
+
+# Define Content-Addressed Store of Relay Settings
+class SettingsStore(Mapping):
+    """
+    Deduplicated Store of Relay Settings.
+
+    Mapping of the SHA-256 digest of each distinct relay settings section
+    to the single copy of its text which is retained. Records which share
+    a store (see the `settings_store` option of `Cev`, `load_many`, and
+    `CevCollection`) each reference the stored copy of their settings,
+    so that the memory held for settings grows with the number of
+    distinct settings, rather than the number of records. Records whose
+    `settings_digest` are equal hold identical settings.
+
+    Examples
+    --------
+    >>> import pycev
+    >>> store = pycev.SettingsStore()
+    >>> events = pycev.CevCollection("./events", settings_store=store)
+    >>> print(len(events), "events with", len(store), "distinct settings")
+    >>> events[0].settings_digest == events[-1].settings_digest
+    True
+    """
+
+    def __init__(self):
+        """Prepare the Empty Store."""
+        self._settings = {}
+
+    @staticmethod
+    def digest(settings: str):
+        """Evaluate the Hexadecimal SHA-256 Digest of the Settings."""
+        return hashlib.sha256(
+            settings.encode('utf-8', 'surrogateescape')
+        ).hexdigest()
+
+    def add(self, settings: str):
+        """
+        *Store the settings, unless already stored*.
+
+        Parameters
+        ----------
+        settings:   str
+                    The relay settings section of a CEV.
+
+        Returns
+        -------
+        digest:     str
+                    The digest by which the settings are stored.
+        """
+        digest = self.digest(settings)
+        self._settings.setdefault(digest, settings)
+        return digest
+
+    def share(self, record):
+        """
+        *Replace the settings of the record with the stored copy*.
+
+        Parameters
+        ----------
+        record:     [Cev, CompactCev]
+                    The record whose settings should be stored.
+
+        Returns
+        -------
+        digest:     str
+                    The digest by which the settings are stored.
+        """
+        # pylint: disable=protected-access
+        digest = self.add(record.settings)
+        record.settings = self._settings[digest]
+        record._settings_digest = (record.settings, digest)
+        return digest
+
+    def __getitem__(self, digest):
+        """Return the Stored Settings with the Digest."""
+        return self._settings[digest]
+
+    def __iter__(self):
+        """Iterate over the Digests of the Stored Settings."""
+        return iter(self._settings)
+
+    def __len__(self):
+        """Return the Number of Distinct Settings Stored."""
+        return len(self._settings)
+
+
+# Define Function to Identify the Engineering Unit of an Analog Channel
+def _comtrade_unit(channel_name):
+    """Identify the Unit of an Analog Channel from its Name."""
+    unit = re.search(r'\((.+)\)', channel_name)
+    if unit:
+        return unit.group(1)
+    if channel_name.upper().startswith(FREQUENCY_KEY):
+        return "Hz"
+    if channel_name.upper().startswith('I'):
+        return "A"
+    if channel_name.upper().startswith('V'):
+        return "kV"
+    return ""
+
+
+# Define Function to Align a Binary Section Offset
+def _align(offset):
+    """Round an Offset Up to the Next Section Boundary."""
+    return -(-offset // BINARY_ALIGNMENT) * BINARY_ALIGNMENT
+
+
+# Define Content-Addressed Cache of Parsed Records
+class _RecordCache():
+    """
+    Directory of Parsed Records, Keyed on the Content of each CEV File.
+
+    Each record is stored in the binary form written by `Cev.save`,
+    named by the SHA-256 hash of the file's content along with the
+    pycev version and the options which affect parsing.
+    Small reference files map a file's path and status (size, and
+    modification time) to that key, so that a file which is unchanged
+    need not be read again to be found. Entries are written to a
+    temporary file and atomically renamed into place, so that several
+    processes may share the directory, and the least recently used
+    entries and references are removed once the directory exceeds
+    `max_size` bytes.
+    """
+
+    entry_suffix = ".cevb"
+    reference_suffix = ".ref"
+
+    def __init__(self, directory, max_size=DEFAULT_CACHE_SIZE):
+        """Prepare the Cache Directory."""
+        self.directory = os.fspath(directory)
+        self.max_size = max_size
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(raw, options):
+        """Evaluate the Key of a File's Content."""
+        digest = hashlib.sha256(raw)
+        digest.update(
+            json.dumps([_version_, BINARY_FORMAT_VERSION, options]).encode()
+        )
+        return digest.hexdigest()
+
+    def _reference_path(self, file, status, options):
+        """Evaluate the Path of a File's Reference to its Content Key."""
+        digest = hashlib.sha256(json.dumps([
+            os.path.abspath(file), status.st_size, status.st_mtime_ns,
+            status.st_ino, _version_, options,
+        ]).encode())
+        return os.path.join(
+            self.directory, digest.hexdigest() + self.reference_suffix
+        )
+
+    def _entry_path(self, key):
+        """Evaluate the Path of the Entry for a Key."""
+        return os.path.join(self.directory, key + self.entry_suffix)
+
+    def _write_atomic(self, path, write):
+        """Write a File in Place of Another, such that it is Never Partial."""
+        descriptor, temp_path = tempfile.mkstemp(
+            dir=self.directory, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(descriptor, 'wb') as file_obj:
+                write(file_obj)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def lookup(self, file, status, options):
+        """Identify the Key for a File which was Seen Before, if Any."""
+        path = self._reference_path(file, status, options)
+        try:
+            with open(path) as ref:
+                key = ref.read().strip() or None
+            os.utime(path)  # Mark the Reference as Recently Used
+        except OSError:
+            return None
+        return key
+
+    def link(self, file, status, options, key):
+        """Record the Key for a File's Path and Status, then Evict."""
+        try:
+            self._write_atomic(
+                self._reference_path(file, status, options),
+                lambda file_obj: file_obj.write(key.encode('ascii')),
+            )
+        except OSError:
+            return  # The Cache is Only an Optimization
+        self.evict()
+
+    def load(self, key, record):
+        """Load the Entry for a Key into the Record, if it is Present."""
+        path = self._entry_path(key)
+        try:
+            record._read_binary(path)  # pylint: disable=protected-access
+        except (OSError, MalformedBinaryRecord):
+            return False
+        # Mark the Entry as Recently Used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return True
+
+    def store(self, key, record):
+        """Store the Record as the Entry for a Key, to be Linked."""
+        try:
+            self._write_atomic(self._entry_path(key), record.save)
+        except OSError:
+            pass  # The Cache is Only an Optimization
+
+    def evict(self):
+        """Remove the Least Recently Used Files Beyond the Size Limit."""
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                # References are Evicted Too, or they would Grow Unbounded
+                if not entry.name.endswith(
+                        (self.entry_suffix, self.reference_suffix)):
+                    continue
+                try:
+                    status = entry.stat()
+                except OSError:
+                    continue  # Removed by Another Process
+                entries.append((status.st_mtime, status.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # Removed by Another Process, or Still Mapped
+            total -= size
+
+
+# Define the Accessors Shared by Each Form of Parsed Record
+class _RecordAccessors():
+    """
+    Channel Accessors Shared by the Parsed Record Classes.
+
+    Mixin providing the channel look-up, unpacking, and time-slicing
+    methods of both `Cev` and `CompactCev`, relying only upon their
+    parsed channel attributes.
+    """
+
+    __slots__ = ()
+
+    # Declare the Parsed Attributes upon which the Accessors Rely
+    backend: str
+    frequency: float
+    trigger_time: dt.datetime
+    settings: str
+    time: TimeAxis
+    digital_time: TimeAxis
+    analog_channels: list
+    analog_channel_ids: list
+    status_channels: PackedStatusChannels
+    status_channel_ids: list
+    status_count: int
+    _analog_index: dict
+    _status_index: dict
+    _status_bits: list
+    _status_packed: bytes
+    _status_stride: int
+    _sample_count: int
+    _trig_row: int
+    _analog_samp_period: float
+    _digital_samp_period: float
+    _settings_digest: tuple
+
+    # Alias the Status Channel Attributes as Digitals
+    @property
+    def digital_channels(self):
+        """Alias of `status_channels`."""
+        return self.status_channels
+
+    @property
+    def digital_channel_ids(self):
+        """Alias of `status_channel_ids`."""
+        return self.status_channel_ids
+
+    @property
+    def digital_count(self):
+        """Alias of `status_count`."""
+        return self.status_count
+
+    # Define Method to Unpack a Single Digital Bit from the Packed Status
+    def _unpack_status(self, bit_position):
+        """Unpack the Samples of One Digital Bit from the Packed Data."""
+        byte_index, bit_index = divmod(bit_position, 8)
+        shift = 7 - bit_index  # Bits are Packed Most-Significant First
+        if self.backend == BACKEND_NUMPY:
+            return (self._status_packed[:, byte_index] >> shift) & 1
+        return [
+            (byte >> shift) & 1
+            for byte in self._status_packed[byte_index::self._status_stride]
+        ]
+
+    # Define Method to Unpack Several Digital Bits for a Range of Samples
+    def _unpack_statuses(self, bits, first: int = 0, stop: int = None):
+        """Unpack the Samples of Several Digital Bits in a Single Pass."""
+        if stop is None:
+            stop = self._sample_count
+        if self.backend == BACKEND_NUMPY:
+            byte_indices = np.array([bit // 8 for bit in bits], dtype=np.intp)
+            shifts = np.array([7 - bit % 8 for bit in bits], dtype=np.uint8)
+            packed = self._status_packed[first:stop]
+            return ((packed[:, byte_indices] >> shifts) & 1).T
+        stride = self._status_stride
+        packed = self._status_packed[first * stride:stop * stride]
+        return [
+            [(byte >> (7 - bit % 8)) & 1 for byte in packed[bit // 8::stride]]
+            for bit in bits
+        ]
+
+    # Define Property to Identify the Relay Settings
+    @property
+    def settings_digest(self):
+        """
+        Hexadecimal SHA-256 digest of the relay settings.
+
+        Records whose digests are equal hold identical settings, see
+        `SettingsStore`.
+        """
+        if self._settings_digest is None or (
+            self._settings_digest[0] is not self.settings
+        ):
+            self._settings_digest = (
+                self.settings, SettingsStore.digest(self.settings)
+            )
+        return self._settings_digest[1]
+
+    # Define Method to Identify a Channel Index by Name
+    @staticmethod
+    def _channel_index(channel_index, channel_name, kind):
+        """Look Up a Channel Index, Failing as `list.index` Would."""
+        try:
+            return channel_index[channel_name]
+        except KeyError:
+            raise ValueError(
+                f"{channel_name!r} is not a known {kind} channel in the CEV"
+            ) from None
+
+    # Define Method to Count the Digital Samples within a Span of Time
+    def _digital_count(self, seconds: float):
+        """Count the Digital Samples which Fall within the Seconds."""
+        # Tolerate Floating-Point Error at Sample Boundaries
+        return math.ceil(seconds / self._digital_samp_period - 1e-9)
+
+    # Define Method to Present a Range of Samples as a New Record
+    def _slice_samples(self, first: int, stop: int):
+        """Shallow-Copy the Record, Retaining Only a Range of Samples."""
+        first = min(max(first, 0), self._sample_count)
+        stop = min(max(stop, first), self._sample_count)
+        sliced = copy.copy(self)
+        if self.backend == BACKEND_NUMPY:
+            sliced.analog_channels = self.analog_channels[:, first:stop]
+            sliced._status_packed = self._status_packed[first:stop]
+        else:
+            sliced.analog_channels = [
+                channel[first:stop] for channel in self.analog_channels
+            ]
+            sliced._status_packed = self._status_packed[
+                first * self._status_stride:stop * self._status_stride
+            ]
+        sliced.analog_channel_ids = list(self.analog_channel_ids)
+        sliced.status_channel_ids = list(self.status_channel_ids)
+        sliced.status_channels = PackedStatusChannels(sliced)
+        sliced.time = self.time[first:stop]
+        if self._digital_samp_period:
+            # Slice the Digital Samples by the Time of the Analog Rows
+            start = self.time.offset - self.digital_time.offset
+            period = self._analog_samp_period
+            sliced.digital_time = self.digital_time[
+                self._digital_count(start + first * period):
+                self._digital_count(start + stop * period)
+            ]
+        sliced._sample_count = stop - first
+        sliced._trig_row = self._trig_row - first
+        return sliced
+
+    # Define Method to Extract a Time-Window of the Record
+    def window(self, start, end):
+        """
+        *Extract the samples within a window of time*.
+
+        Use this method to return a record which presents only the
+        samples recorded from the `start` time up to (but not including)
+        the `end` time. The sample indices are computed arithmetically
+        from the trigger row and the sample period. When the 'numpy'
+        backend is used, the channels of the returned record are views
+        into the channels of this record, rather than copies.
+
+        Parameters
+        ----------
+        start:      [float, datetime]
+                    Start of the window; either a datetime, or the
+                    number of seconds relative to the trigger time
+                    (negative values precede the trigger).
+        end:        [float, datetime]
+                    End of the window; either a datetime, or the number
+                    of seconds relative to the trigger time.
+
+        Returns
+        -------
+        record:     Cev
+                    Record presenting only the samples in the window,
+                    with its `time` and `digital_time` sliced to match.
+
+        See Also
+        --------
+        cycles      : Extract the samples surrounding the trigger by the
+                      number of cycles.
+
+        Examples
+        --------
+        >>> from pycev import CEV
+        >>> record = CEV(file="./event-report.cev")
+        >>> # Extract 10 milliseconds either side of the trigger.
+        >>> fault = record.window(-0.010, 0.010)
+        """
+        if isinstance(start, dt.datetime):
+            start = (start - self.trigger_time).total_seconds()
+        if isinstance(end, dt.datetime):
+            end = (end - self.trigger_time).total_seconds()
+        period = self._analog_samp_period
+        if not period:
+            return self._slice_samples(0, 0)
+        # Tolerate Floating-Point Error at Sample Boundaries
+        first = self._trig_row + math.ceil(start / period - 1e-9)
+        stop = self._trig_row + math.ceil(end / period - 1e-9)
+        return self._slice_samples(first, stop)
+
+    # Define Method to Extract Cycles Surrounding the Trigger
+    def cycles(self, pre: float = 2, post: float = 6):
+        """
+        *Extract the cycles surrounding the trigger*.
+
+        Use this method to return a record which presents only the
+        samples from `pre` cycles before the trigger, up to `post`
+        cycles after the trigger, as determined from the nominal system
+        frequency.
+
+        Parameters
+        ----------
+        pre:        float, optional
+                    Number of cycles preceding the trigger, default is 2.
+        post:       float, optional
+                    Number of cycles following the trigger, default is 6.
+
+        Returns
+        -------
+        record:     Cev
+                    Record presenting only the samples surrounding the
+                    trigger.
+
+        See Also
+        --------
+        window      : Extract the samples within a window of time.
+
+        Examples
+        --------
+        >>> from pycev import CEV
+        >>> record = CEV(file="./event-report.cev")
+        >>> fault = record.cycles(pre=2, post=6)
+        >>> fault.get_analog("IA")
+        [...]
+        """
+        return self.window(-pre / self.frequency, post / self.frequency)
+
+    # Define Method to Access the Analog Channel by Name
+    def get_analog(self, channel_name: str):
+        """
+        *Extract an analog channel by name*.
+
+        Use this method to return the list of analog values
+        associated with the particular analog channel with
+        the specified name.
+
+        Parameters
+        ----------
+        channel_name:   str
+                        Name of the analog channel which
+                        should be extracted.
+
+        Returns
+        -------
+        channel:    list of float
+                    The analog channel values in a zero-based
+                    list. When the 'numpy' backend is used, this
+                    is a zero-copy 1-D view into `analog_channels`.
+
+        See Also
+        --------
+        get_status  : Collect the digital channel status for a
+                      specified name.
+        get_digital : Collect the digital channel status for a
+                      specified name.
+
+        Examples
+        --------
+        >>> from pycev import CEV
+        >>> # Load a file and parse, directly.
+        >>> record = CEV() # Create the parser instance
+        >>> record.load(file="./event-report.cev")
+        >>> record.get_analog("FREQ")
+        [...]
+        """
+        # Identify the Analog Channel Index
+        channel_index = self._channel_index(
+            self._analog_index, channel_name, "analog"
+        )
+        # Return the Analog Channel
+        return self.analog_channels[channel_index]
+
+    # Define Method to Access Many Analog Channels by Name
+    def get_analogs(self, channel_names: list):
+        """
+        *Extract many analog channels by name*.
+
+        Use this method to return the analog values associated
+        with each of the analog channels with the specified
+        names, in the order they are named.
+
+        Parameters
+        ----------
+        channel_names:  list of str
+                        Names of the analog channels which
+                        should be extracted.
+
+        Returns
+        -------
+        channels:   list of list of float
+                    The analog channel values for each channel.
+                    When the 'numpy' backend is used, this is a
+                    2-D array shaped as (channels, samples); it is
+                    a zero-copy view into `analog_channels` when the
+                    named channels are adjacent and in order.
+
+        See Also
+        --------
+        get_analog      : Collect the analog channel for a specified
+                          name.
+        get_statuses    : Collect the digital channels for the
+                          specified names.
+
+        Examples
+        --------
+        >>> from pycev import CEV
+        >>> record = CEV(file="./event-report.cev", backend="numpy")
+        >>> record.get_analogs(["IA", "IB", "IC"])
+        array([...])
+        """
+        indices = [
+            self._channel_index(self._analog_index, name, "analog")
+            for name in channel_names
+        ]
+        if self.backend == BACKEND_NUMPY:
+            if indices and indices == list(
+                range(indices[0], indices[0] + len(indices))
+            ):
+                # Adjacent Channels may be Presented as a View
+                return self.analog_channels[indices[0]:indices[-1] + 1]
+            return self.analog_channels[indices]
+        return [self.analog_channels[index] for index in indices]
+
+    # Define Method to Access the Digital Channel by Name
+    def get_status(self, channel_name: str):
+        """
+        *Extract an digital channel by name*.
+
+        Use this method to return the list of digital values
+        associated with the particular digital channel with
+        the specified name.
+
+        Parameters
+        ----------
+        channel_name:   str
+                        Name of the digital channel which
+                        should be extracted.
+
+        Returns
+        -------
+        channel:    list of int
+                    The digital channel values (0 or 1) in a
+                    zero-based list. Values are unpacked from the
+                    packed status data on each call. When the
+                    'numpy' backend is used, this is a 1-D array
+                    of uint8.
+
+        See Also
+        --------
+        get_analog  : Collect the analog channel status for a
+                      specified name.
+        get_status  : Collect the digital channel status for a
+                      specified name.
+        get_digital : Collect the digital channel status for a
+                      specified name.
+
+        Examples
+        --------
+        >>> from pycev import CEV
+        >>> # Load a file and parse, directly.
+        >>> record = CEV() # Create the parser instance
+        >>> record.load(file="./event-report.cev")
+        >>> record.get_status("TRIPLED")
+        [...]
+        >>> record.get_digital("TRIPLED")
+        [...]
+        """
+        # Identify the Digital Channel Index
+        channel_index = self._channel_index(
+            self._status_index, channel_name, "status"
+        )
+        # Unpack and Return Only the Requested Digital Channel
+        return self._unpack_status(self._status_bits[channel_index])
+
+    # Alias `get_status` to `get_digital`
+    get_digital = get_status
+
+    # Define Method to Access Many Digital Channels by Name
+    def get_statuses(self, channel_names: list):
+        """
+        *Extract many digital channels by name*.
+
+        Use this method to return the digital values associated
+        with each of the digital channels with the specified
+        names, in the order they are named.
+
+        Parameters
+        ----------
+        channel_names:  list of str
+                        Names of the digital channels which
+                        should be extracted.
+
+        Returns
+        -------
+        channels:   list of list of int
+                    The digital channel values (0 or 1) for each
+                    channel. When the 'numpy' backend is used, this
+                    is a 2-D array of uint8 shaped as (channels,
+                    samples), unpacked in a single pass.
+
+        See Also
+        --------
+        get_status  : Collect the digital channel status for a
+                      specified name.
+        get_analogs : Collect the analog channels for the specified
+                      names.
+
+        Examples
+        --------
+        >>> from pycev import CEV
+        >>> record = CEV(file="./event-report.cev")
+        >>> record.get_statuses(["TRIP", "50P1"])
+        [[...], [...]]
+        >>> record.get_digitals(["TRIP", "50P1"])
+        [[...], [...]]
+        """
+        bits = [
+            self._status_bits[
+                self._channel_index(self._status_index, name, "status")
+            ]
+            for name in channel_names
+        ]
+        return self._unpack_statuses(bits)
+
+    # Alias `get_statuses` to `get_digitals`
+    get_digitals = get_statuses
+
+
+# Define the Primary Class
+class Cev(_RecordAccessors):
+    """
+    SEL CEV File Reader.
+
+    This class serves to provide functionality to read SEL (Schweitzer
+    Engineering Laboratories) Compressed EVent records (CEV files) and
+    grant pragmatic access to the key components of these records. The
+    methods, attributes, and properties of this class serve to expose
+    data in a manner that supports scientific analysis and allow common
+    data-science tools such as NumPy, Matplotlib, Pandas, and others to
+    conveniently interpret information. This all is in an effort to
+    support data scientists and engineers to make empowered, intelligent
+    decisions about the power systems which they are responsible for.
+
+    Within this module, this class (`Cev`) is also aliased as CEV for
+    programming convenience, and to allow users to access the functionality
+    in a format that is consistent with their work.
+
+    Parameters
+    ----------
+    file:       str, optional
+                String describing the relative or fully qualified path to
+                the CEV file that should be read. Optionally used during
+                class initialization, may also be loaded using the `load`
+                method.
+    data:       str, optional
+                String describing all contents of the CEV file as read.
+                Optionally used during class initialization to pre-load
+                the contents of the CEV file.
+    **kwargs:   dict, optional
+                Additional optional parameters which may be specified
+                during class initialization. Common arguments include:
+
+                    - encoding:     str, file encoding such as 'utf-8'
+                    - decode_opt:   str, file decoding option such as
+                                    'strict', 'ignore', 'replace', or
+                                    'backslashreplace' as defined by
+                                    standard str.decode method.
+                    - ignore_warnings: bool, control to ignore warnings
+                    - backend:      str, channel storage backend, either
+                                    'list' (default) or 'numpy'; the
+                                    'numpy' backend stores the analog
+                                    channels as a single 2-D array and
+                                    requires NumPy to be installed.
+                    - checksum:     str, checksum validation mode, one
+                                    of 'warn' (default) to validate
+                                    every line and warn of failures,
+                                    'strict' to raise on the first
+                                    failing line, 'deferred' to
+                                    validate on first access to
+                                    `validity` or `invalid_lines`, or
+                                    'off' to skip validation of
+                                    trusted records.
+                    - analogs:      list of str, names of the analog
+                                    channels which should be parsed;
+                                    all others are never converted,
+                                    default is to parse all analogs.
+                    - digitals:     list of str, names of the digital
+                                    (status) channels which should be
+                                    parsed, default is to parse all.
+                    - header_only:  bool, control to read only the header
+                                    and channel heading rows, skipping
+                                    the samples and settings entirely;
+                                    see `Cev.scan`.
+                    - cache_dir:    str, directory of a cache of parsed
+                                    records; when a file path is
+                                    loaded, the record is stored in a
+                                    binary form keyed on the file's
+                                    content, and later loads of the
+                                    same content are memory-mapped
+                                    from the cache rather than parsed;
+                                    the raw text is read again from
+                                    the file only when it is first
+                                    accessed (and only if the file is
+                                    unchanged), see `keep_raw`.
+                    - cache_size:   int, maximum total size (in bytes)
+                                    of the cache, the least recently
+                                    used records are evicted beyond
+                                    this size, default is 1 GiB.
+                    - profile:      bool, control to measure each stage
+                                    of the load, see `load_stats`.
+                    - profile_memory: bool, control to also measure the
+                                    peak memory allocated by each stage
+                                    with `tracemalloc` (resetting its
+                                    peak, if already tracing); implies
+                                    `profile`.
+                    - profile_hook: callable, function called with the
+                                    StageStats of each stage as it is
+                                    completed; implies `profile`.
+                    - keep_raw:     bool, control to retain the raw text
+                                    (`data`, `record`, and the sample
+                                    rows of `record_lines`) once the
+                                    record is parsed, default is True;
+                                    when False, only the header rows
+                                    are kept, and any 'deferred'
+                                    checksums are evaluated first.
+                    - keep_settings: bool, control to retain the relay
+                                    `settings` text, default is True.
+                    - parser:       CevParser, parser whose cache of
+                                    channel layouts should be shared,
+                                    see `CevParser`.
+                    - settings_store: SettingsStore, store holding the
+                                    single copy of each distinct relay
+                                    settings section, which the record
+                                    then references.
+
+                Class initialization may include one or more kwargs,
+                but none are required.
+
+    Attributes
+    ----------
+    analog_channels:        list of list of float
+                            List of lists containing the analog samples
+                            for each channel. When the 'numpy' backend is
+                            used, this is a contiguous 2-D array of float
+                            shaped as (channels, samples).
+    analog_channel_ids:     list of str
+                            List of the analog channel names whose index
+                            values correspond directly to the channel
+                            datasets in `analog_channels`.
+    analog_count:           int
+                            Number of analog channels present in CEV.
+    backend:                str
+                            Name of the channel storage backend in use,
+                            either 'list' or 'numpy'.
+    channels_count:         int
+                            Total number of analog and digital (status)
+                            channels in CEV.
+    checksum_mode:          str
+                            Name of the checksum validation mode in use,
+                            one of 'warn', 'strict', 'deferred', or 'off'.
+    data:                   str
+                            Full string context of the entire CEV record;
+                            includes both the event information and relay
+                            settings that were included with the record.
+    digital_channels:       PackedStatusChannels
+                            List-like sequence containing the states for
+                            each digital (status) channel present in CEV.
+                            This list presents itself as an alias to the
+                            `status_channels` class attribute.
+    digital_channel_ids:    list of str
+                            List of the digital (status) channel names
+                            whose index values correspond directly to the
+                            channel datasets in `digital_channels`. This
+                            list presents itself as an alias to the
+                            `status_channel_ids` class attribute.
+    digital_count:          int
+                            Number of digital channels present in the CEV.
+    digital_time:           TimeAxis
+                            List-like sequence of the timestamp for each
+                            digital sample, evaluated from the digital
+                            sample period ('SAM/CYC_D') over the span of
+                            the analog samples in `time`.
+    fid:                    str
+                            Relay firmware identification string; does not
+                            include the 'FID=' specifier.
+    frequency:              float
+                            The recorded nominal frequency present in the
+                            CEV.
+    header_only:            bool
+                            Control indicating that only the header and
+                            channel heading rows were read, and no sample
+                            data or settings are present.
+    load_stats:             dict of StageStats
+                            Map of the name of each stage of the load
+                            ('read', 'cache', 'split', 'checksum',
+                            'header', 'samples', 'timestamps') to the
+                            namedtuple measuring it, of the form:
+                            StageStats('stage':str, 'seconds':float,
+                            'lines':int, 'bytes':int, 'peak_memory':int)
+                            where 'peak_memory' is None unless memory
+                            is profiled. Empty unless profiling is
+                            enabled.
+    raw_fid:                str
+                            "Raw" relay firmware identification string;
+                            includes the 'FID=' specifier to lead the string.
+    record:                 str
+                            Event record data-sub-section contents; contains
+                            only the event-related data and heading fields of
+                            the CEV that was loaded.
+    record_lines:           list of str
+                            Row-wise split contents of the record with all
+                            newline and carriage-return characters removed.
+    settings:               str
+                            Relay settings data-sub-section contents; contains
+                            only the relay settings portion of the CEV that
+                            was loaded.
+    settings_map:           RelaySettings
+                            Mapping of the relay settings by setting name,
+                            indexed on first access and parsed lazily.
+    status_channels:        PackedStatusChannels
+                            List-like sequence containing the states for
+                            each status (digital) channel present in CEV;
+                            channels are unpacked from the packed status
+                            bytes only when they are indexed.
+                            This list is aliased to the `digital_channels`
+                            class attribute.
+    status_channel_ids:     list of str
+                            List of the status (digital) channel names
+                            whose index values correspond directly to the
+                            channel datasets in `status_channels`. This
+                            list is aliased to the `digital_channel_ids`
+                            class attribute.
+    status_count:           int
+                            Number of status channels present in the CEV.
+    time:                   TimeAxis
+                            List-like sequence of the timestamp for each
+                            analog sample, evaluated arithmetically from
+                            the trigger time and the analog sample period.
+    trigger_time:           datetime
+                            Date-time structure indicating when the event
+                            was "triggered" by protection logic in the relay.
+    validation:             ValidationReport
+                            Structured report of the problems found while
+                            loading the record, such as the lines which
+                            fail checksum validation.
+
+    Examples
+    --------
+    >>> from pycev import CEV
+    >>> # Load a file and parse, directly.
+    >>> record = CEV(file="./event-report.cev")
+    >>> print("Trigger time = {}s".format(record.trigger_time))
+    """
+
+    def __init__(self, file: str = None, data: Union[str, bytes] = None,
+                 **kwargs):
+        """
+        Prepare CEV Reader.
+
+        Class initialization with optional data input methods for file-path
+        and raw data as either a string or bytes.
+        """
+        # Handle Encoding Type if Provided
+        if "encoding" in kwargs:
+            encoding = kwargs['encoding']
+        else:
+            encoding = None
+
+        # Handle Decoding Option if Provided
+        if "decode_opt" in kwargs:
+            self._decode_opt = kwargs['decode_opt']
+        elif "decode_option" in kwargs:
+            self._decode_opt = kwargs['decode_option']
+        else:
+            self._decode_opt = 'strict'
+
+        # Handle Warnings Override
+        if "ignore_warnings" in kwargs:
+            self.ignore_warnings = kwargs["ignore_warnings"]
+        else:
+            self.ignore_warnings = False
+
+        # Handle Channel Selection
+        self._analog_selection = kwargs.get("analogs")
+        self._digital_selection = kwargs.get("digitals")
+
+        # Handle Header-Only Scanning
+        self.header_only = kwargs.get("header_only", False)
+
+        # Handle a Shared Parser, Caching the Channel Layouts
+        self._parser = kwargs.get("parser")
+
+        # Handle a Shared Store of the Relay Settings
+        self._settings_store = kwargs.get("settings_store")
+
+        # Handle Retention of the Raw Text after Parsing
+        self._keep_raw = kwargs.get("keep_raw", True)
+        self._keep_settings = kwargs.get("keep_settings", True)
+
+        # Handle Load Profiling
+        self._profile_hook = kwargs.get("profile_hook")
+        self._profile_memory = kwargs.get("profile_memory", False)
+        self._profiling = bool(
+            kwargs.get("profile", False) or self._profile_hook or
+            self._profile_memory
+        )
+        self.load_stats = {}
+
+        # Handle the Parsed Record Cache
+        self._cache = None
+        if kwargs.get("cache_dir") is not None:
+            self._cache = _RecordCache(
+                kwargs["cache_dir"],
+                max_size=kwargs.get("cache_size", DEFAULT_CACHE_SIZE),
+            )
+
+        # Handle Checksum Validation Mode
+        self.checksum_mode = kwargs.get("checksum", CHECKSUM_WARN)
+        if self.checksum_mode not in CHECKSUM_MODES:
+            raise ValueError(
+                f"Unsupported checksum mode {self.checksum_mode!r}, expected "
+                "one of: " + ", ".join(CHECKSUM_MODES)
+            )
+
+        # Handle Storage Backend Selection
+        self.backend = kwargs.get("backend", BACKEND_LIST)
+        if self.backend not in SUPPORTED_BACKENDS:
+            raise ValueError(
+                f"Unsupported backend {self.backend!r}, expected one of: " +
+                ", ".join(SUPPORTED_BACKENDS)
+            )
+        if self.backend == BACKEND_NUMPY and np is None:
+            raise ImportError(
+                "The 'numpy' backend requires NumPy to be installed."
+            )
+
+        # Prepare Defaults
+        self.data = ''
+        self.record = ''
+        self.settings = ''
+        self.record_lines = []
+        self.fid = ''
+        self.raw_fid = ''
+        self.time = TimeAxis(dt.datetime(1970, 1, 1), 0.0, 0)
+        self.digital_time = TimeAxis(dt.datetime(1970, 1, 1), 0.0, 0)
+        self.trigger_time = dt.datetime(1970, 1, 1)  # Default to Epoch
+        self.channels_count = 0
+        self.analog_channels = []
+        self.analog_channel_ids = []
+        self.status_channels = []
+        self.status_channel_ids = []
+        self.analog_count = 0
+        self.status_count = 0
+        self.frequency = 0.0
+
+        self.year = 1970
+        self.month = 1
+        self.day = 1
+        self.hour = 0
+        self.min = 0
+        self.sec = 0
+        self.msec = 0
+
+        self._ignored_channels = []
+        self._status_bits = []  # Packed Bit Position of Each Status Channel
+        self._analog_index = {}  # Map of Analog Channel Name to Index
+        self._status_index = {}  # Map of Status Channel Name to Index
+        self._status_packed = b''
+        self._status_stride = 0  # Number of Packed Bytes per Sample
+        self._trig_column = -1
+        self._analog_columns = None  # Heading Columns of Selected Analogs
+        self._analog_column_count = 0  # Number of Analogs in Each Row
+        self._status_columns = None  # Packed Bytes of Selected Digitals
+        self._trig_row = 0
+        self._sample_count = 0
+        self._analog_samp_timedelta = None
+        self._digital_samp_timedelta = None
+        self._analog_samp_period = 0.0  # Seconds Between Analog Samples
+        self._digital_samp_period = 0.0  # Seconds Between Digital Samples
+        self._properties = {}  # Empty Dictionary of the Keys
+        self.validation = ValidationReport()
+        self._invalid_lines = None  # Checksums Not Yet Evaluated
+        self._known_invalid_lines = None  # Failures Evaluated Elsewhere
+        self._heading_row = 0  # Index of Channel Heading in `record_lines`
+        self._settings_map = None  # Settings Not Yet Indexed
+        self._settings_digest = None  # Settings Not Yet Hashed
+
+        # Prepare Data or File if Provided
+        if isinstance(file, (str, bytes)):
+            self.load(file=file, encoding=encoding)
+        elif hasattr(file, "read"): # Probably a file-like object?
+            if self.header_only:
+                self._load_header_only(file, encoding=encoding)
+            else:
+                self.load_data(data=file.read(), encoding=encoding)
+        elif isinstance(data, (str, bytes)):
+            self.load_data(data=data, encoding=encoding)
+
+    def __getattr__(self, name):
+        """Restore the Raw Text of a Cached Record upon First Access."""
+        if (name in ('data', 'record', 'record_lines') and
+                '_raw_source' in self.__dict__):
+            self._restore_raw()
+            return self.__dict__[name]
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    # Define Simple Method to Identify Class Keys
+    def _keys(self):
+        """Capture Class Attributes as Keys."""
+        return self.__dict__.keys()
+
+    # Define Simple File Extension Validator
+    def _validate_extension(self, file):
+        """Validate Extension is of *.CEV Format."""
+        if not os.path.exists(file):
+            raise FileNotFoundError(
+                "Argument `file` must be a valid file-path to a CEV file."
+            )
+        _, ext = os.path.splitext(file)
+        if 'CEV' not in ext.upper():
+            self.validation.extension = ext
+            # Throw Warning to User
+            if not self.ignore_warnings:
+                _warn(
+                    'File does not appear to use "CEV" extension,' +
+                    f' instead is "{ext}".',
+                    UnexpectedFileExtension,
+                )
+        # Proceed Without Exception
+
+    # Define Simple Decoder for Data
+    def _decode(self, data, encoding):
+        """Simply Decode the Data Using the Specified Encoding Format."""
+        if encoding is not None:
+            return data.decode(encoding, self._decode_opt)
+        else:
+            return data
+
+    # Define Function to Prepare Record and Validate Checksums
+    def _prepare_and_validate_record(self):
         """Simply Split the Record and Settings, then Evaluate Checksums."""
-        # Split Data
-        self.record, self.settings = split_event_and_relay_data(self.data)
-        invalid_lines = {}
-        # Evaluate Record Checksums
-        for i, line in enumerate(self.record.split('\n')):
-            if line == '' or (line is None) or line == ' ':
+        with self._measure_stage("split") as stage:
+            # Split Data
+            self.record, self.settings = split_event_and_relay_data(self.data)
+            self._collect_record_lines()
+            stage["lines"] = len(self.record_lines)
+            stage["bytes"] = len(self.data)
+        # Evaluate Record Checksums According to the Checksum Mode
+        if self.checksum_mode in (CHECKSUM_DEFERRED, CHECKSUM_OFF):
+            return True  # Validation is Deferred, or Not Required
+        with self._measure_stage("checksum") as stage:
+            stage["lines"] = len(self.record_lines)
+            stage["bytes"] = len(self.record)
+            return self._validate_checksums()
+
+    # Define Method to Collect the Rows of the Record
+    def _collect_record_lines(self):
+        """Collect the Line Data of the Record, without the Checksums."""
+        for line in self.record.split('\n'):
+            line = line.replace('\r', '')
+            if line == '' or line == ' ':
                 continue
-            # Collect Line Data and
-            content, validity = row_wise_checksum(line)
-            self.record_lines.append(content)
-            if not validity:
-                invalid_lines[i + 1] = content
+            self.record_lines.append(_strip_checksum(line))
+
+    # Define Function to Load Only the Header Information
+    def _load_header_only(self, lines, encoding=None):
+        """Read Rows Only Until the Channel Heading, then Parse Metadata."""
+        raw_lines = []
+        data_rows = 0
+        for line in lines:
+            if isinstance(line, bytes):
+                line = line.decode(encoding or 'ascii', self._decode_opt)
+            line = line.replace('\r', '').replace('\n', '')
+            if line.startswith(EVENT_SETTINGS_SEP):
+                break  # No Sample Rows Present, Settings Reached
+            # Retain Blank Rows, so Failures Report their Physical Lines
+            raw_lines.append(line)
+            if line == '' or line == ' ':
+                continue
+            self.record_lines.append(_strip_checksum(line))
+            # Only the Sample Rows Follow One Another without a Header
+            data_rows = data_rows + 1 if self._is_data(
+                self.record_lines[-1]
+            ) else 0
+            if data_rows == 2:
+                break
+        self.record = '\n'.join(raw_lines)
+        # Evaluate Checksums for the Rows which were Read
+        if self.checksum_mode not in (CHECKSUM_DEFERRED, CHECKSUM_OFF):
+            self._validate_checksums()
+        # Parse Only the Header Information and Channel Names
+        iRow = self._parse_header(self.record_lines)
+        self._parse_channel_heading(self.record_lines[iRow])
+        del self.record_lines[iRow + 1:]  # Don't Retain any Sample Rows
+        self._eval_trigger_time()
+        self._eval_frequency()
+        self._clean_fid()
+        self._eval_samples_per_cycle()
+
+    # Define Method to Evaluate the Record Checksums
+    def _validate_checksums(self):
+        """Evaluate Record Checksums, then Warn or Raise for Failures."""
+        if self._known_invalid_lines is not None:
+            # Failures were Already Evaluated, such as when Cached
+            self._invalid_lines = set(self._known_invalid_lines)
+        else:
+            self._invalid_lines = validate_record_checksums(self.record)
+        return self._report_invalid_lines()
+
+    # Define Method to Report the Lines which Failed Checksum Validation
+    def _report_invalid_lines(self):
+        """Warn or Raise for the Lines which Failed Checksum Validation."""
+        invalid_lines = sorted(self._invalid_lines)
+        self.validation.invalid_lines = invalid_lines
+        # Fail on the First Malformed Line in Strict Mode
+        if invalid_lines and self.checksum_mode == CHECKSUM_STRICT:
+            raise MalformedChecksumFailure(
+                "Record data appears to be malformed, and fails checksum "
+                f"validation for line: {invalid_lines[0]}"
+            )
         # Throw Warning to User
         if invalid_lines and (not self.ignore_warnings):
-            # Capture Pertinent Information
-            parent = inspect.stack()[2]
-            callfile = parent.filename
-            lineno = parent.lineno
-            warnings.showwarning(
-                message=(
-                    'Record data appears to be malformed, '
-                    'and fails checksum validation for lines: '
-                    ", ".join([str(ind) for ind in invalid_lines])
-                ),
-                category=MalformedChecksumFailure,
-                filename=callfile,
-                lineno=lineno,
+            _warn(
+                'Record data appears to be malformed, '
+                'and fails checksum validation for lines: ' +
+                ", ".join([str(ind) for ind in invalid_lines]),
+                MalformedChecksumFailure,
+            )
+        # Return the Validity Signal
+        return len(invalid_lines) == 0
+
+    # Define Property to Report the Record Checksum Validity
+    @property
+    def validity(self):
+        """
+        Record checksum validity.
+
+        True when every row of the record passes checksum validation.
+        When the 'deferred' checksum mode is used, the checksums are
+        evaluated (and any warning raised) upon first access. When
+        checksum validation is 'off', this is None.
+        """
+        if self.checksum_mode == CHECKSUM_OFF:
+            return None
+        if self._invalid_lines is None:
+            self._validate_checksums()
+        return len(self._invalid_lines) == 0
+
+    # Define Property to Report the Lines which Failed Checksum Validation
+    @property
+    def invalid_lines(self):
+        """
+        Line numbers of the record which fail checksum validation.
+
+        Sorted list of the (one-based) line numbers. When the 'deferred'
+        checksum mode is used, the checksums are evaluated upon first
+        access. When checksum validation is 'off', this is empty.
+        """
+        if self.checksum_mode == CHECKSUM_OFF:
+            return []
+        if self._invalid_lines is None:
+            self._validate_checksums()
+        return sorted(self._invalid_lines)
+
+    # Define Property to Present the Indexed Relay Settings
+    @property
+    def settings_map(self):
+        """
+        Relay settings, indexed by setting name.
+
+        `RelaySettings` mapping of the relay settings section, formed
+        upon first access; each value is parsed only when accessed. The
+        checksums of the settings section are validated when it is
+        formed, according to the checksum mode, as for the record.
+        """
+        if self._settings_map is None or (
+            self._settings_map.text is not self.settings
+        ):
+            self._settings_map = RelaySettings(self.settings)
+            if self.checksum_mode in (CHECKSUM_WARN, CHECKSUM_STRICT):
+                self._report_invalid_settings()
+        return self._settings_map
+
+    # Define Method to Report the Settings Checksum Failures
+    def _report_invalid_settings(self):
+        """Warn or Raise for Settings Lines which Fail Validation."""
+        invalid_lines = self._settings_map.invalid_lines
+        if invalid_lines and self.checksum_mode == CHECKSUM_STRICT:
+            raise MalformedChecksumFailure(
+                "Relay settings appear to be malformed, and fail checksum "
+                f"validation for settings line: {invalid_lines[0]}"
+            )
+        if invalid_lines and (not self.ignore_warnings):
+            _warn(
+                'Relay settings appear to be malformed, '
+                'and fail checksum validation for settings lines: ' +
+                ", ".join([str(ind) for ind in invalid_lines]),
+                MalformedChecksumFailure,
+            )
+
+    # Define Internal Test to Identify Header
+    def _is_header(self, row_data):
+        """Test Function to Evaluate Whether Row is Header."""
+        if row_data.startswith('"') and row_data.endswith('"'):
+            return True
+        else:
+            return False
+
+    # Define Internal Test to Identify Data Row
+    def _is_data(self, row_data):
+        """Test Function to Evaluate Whether Row isn't Header."""
+        return not self._is_header(row_data=row_data)
+
+    # Define Primary Parsing Function
+    def _parse_record(self):
+        """Primary Parsing Function to Interpret the CEV."""
+        with self._measure_stage("header") as stage:
+            # Interpret the Header Information and Channel Names
+            iRow = self._parse_header(self.record_lines)
+            self._parse_channel_heading(self.record_lines[iRow])
+            stage["lines"] = iRow + 1
+            if self._profiling:
+                stage["bytes"] = sum(map(len, self.record_lines[:iRow + 1]))
+        with self._measure_stage("samples") as stage:
+            # Interpret the Sample Rows Following the Channel Heading
+            self._parse_samples(self.record_lines[iRow + 1:])
+            stage["lines"] = self._sample_count
+            if self._profiling:
+                stage["bytes"] = sum(map(len, self.record_lines[iRow + 1:]))
+
+    # Define Header Parsing Function
+    def _parse_header(self, record_lines):
+        """Interpret Header Row-Pairs, Return Index of Channel Heading."""
+        # Treat Rows Beyond those Available as Empty
+        def row(index):
+            return record_lines[index] if index < len(record_lines) else ''
+        # Operate on "Row-Pairs" with two Rows at Once to Pair Key with Value
+        # Start with Row-Index-Zero (first row), and Assuming Header
+        iRow = 0
+        # Only Validate the First Row, Since Second Row Should Contain FID
+        header = self._is_header(row(iRow))
+
+        # Manage the Initial Record Data
+        while header:
+            # Clean and Split the Heading and Content
+            heading_row = row(iRow).replace('"', '').split(',')
+            content_row = row(iRow + 1)
+            content_row = content_row.replace('"', '').split(',')
+            if not len(heading_row) == len(content_row):
+                raise MalformedHeadingDataMismatch(
+                    "CEV may be malformed, heading and data length don't "
+                    f"match for heading {heading_row} and data {content_row}"
+                )
+            # Load the Data into Class Keys
+            for key, value in zip(heading_row, content_row):
+                self._load_property(key, value)
+
+            # Check Next Group
+            header = (
+                self._is_header(row(iRow + 2)) and
+                self._is_data(row(iRow + 3)) and
+                self._is_header(row(iRow + 4))
+            )
+            # Increment Row Index
+            iRow += 2
+
+        # Following the Primary Header Content, a Single Header Remains
+        # with the Analog and Digital Channel Names.
+        self._heading_row = iRow
+        return iRow
+
+    # Define Method to Load a Single Header Property
+    def _load_property(self, key, value):
+        """Store a Header Value as a Property, and as an Attribute."""
+        # Verify Attribute and Load
+        key_lower = key.lower()
+        if key_lower in self._keys():
+            if callable(self.__dict__[key_lower]):
+                return  # Don't Overwrite a Callable!
+        if (key.find('/') == -1) and (key.find('(') == -1):
+            # Valid Class Variable Name, Load Directly
+            self.__dict__[key_lower] = value
+        # Store the Data as a Property
+        self._properties[key] = value
+
+    # Define Channel Heading Parsing Function
+    def _parse_channel_heading(self, heading):
+        """Identify the Analog and Digital Channel Names."""
+        # Records from the Same Relay Share their Layout through the Parser
+        if self._parser is not None:
+            layout = self._parser.channel_layout(
+                self._properties.get("FID", ''), heading
+            )
+        else:
+            layout = _channel_layout(heading)
+        # Public Names are Copied, while the Rest of the Layout is Shared
+        self.analog_channel_ids = list(layout.analog_channel_ids)
+        self.status_channel_ids = list(layout.status_channel_ids)
+        self._status_bits = layout.status_bits
+        self._ignored_channels = layout.ignored_channels
+        self._trig_column = layout.trig_column
+        self._analog_index = layout.analog_index
+        self._status_index = layout.status_index
+
+        # Retain Only the Selected Channels, if Any were Requested
+        self._analog_columns = None
+        self._analog_column_count = len(self.analog_channel_ids)
+        if self._analog_selection is not None:
+            self._analog_columns = self._resolve_selection(
+                self.analog_channel_ids, self._analog_selection, "Analog"
+            )
+            self.analog_channel_ids = list(self._analog_selection)
+            self._analog_index = _channel_index_map(self.analog_channel_ids)
+        if self._digital_selection is not None:
+            indices = self._resolve_selection(
+                self.status_channel_ids, self._digital_selection, "Digital"
+            )
+            self.status_channel_ids = list(self._digital_selection)
+            self._status_bits = [self._status_bits[i] for i in indices]
+            # Retain Only the Packed Bytes Holding Selected Digitals
+            self._status_columns = sorted(
+                {bit // 8 for bit in self._status_bits}
+            )
+            self._status_bits = [
+                self._status_columns.index(bit // 8) * 8 + bit % 8
+                for bit in self._status_bits
+            ]
+            self._status_index = _channel_index_map(self.status_channel_ids)
+
+        # Characterize Number of Channels
+        self.analog_count = len(self.analog_channel_ids)
+        self.status_count = len(self.status_channel_ids)
+
+    # Define Method to Index the Channels by Name
+    def _index_channels(self):
+        """Count the Channels, and Map Each Channel Name to its Index."""
+        # Characterize Number of Channels
+        self.analog_count = len(self.analog_channel_ids)
+        self.status_count = len(self.status_channel_ids)
+
+        # Map Each Channel Name to its Index
+        self._analog_index = _channel_index_map(self.analog_channel_ids)
+        self._status_index = _channel_index_map(self.status_channel_ids)
+
+    # Define Method to Resolve the Positions of Selected Channels
+    @staticmethod
+    def _resolve_selection(channel_ids, selection, kind):
+        """Identify Index of Each Selected Channel Name in the Heading."""
+        missing = [name for name in selection if name not in channel_ids]
+        if missing:
+            raise ValueError(
+                f"{kind} channel(s) not present in CEV: " + ", ".join(missing)
+            )
+        return [channel_ids.index(name) for name in selection]
+
+    # Define Sample Parsing Function
+    def _parse_samples(self, data_lines):
+        """Decode the Analog and Digital Samples from the Data Rows."""
+        # Decode All Data Rows in a Single Bulk Pass
+        block = decode_data_block(
+            data_lines,
+            analog_count=self._analog_column_count,
+            use_numpy=(self.backend == BACKEND_NUMPY),
+            analog_columns=self._analog_columns,
+            status_columns=self._status_columns,
+        )
+        self.analog_channels = block.analogs
+        self._sample_count = len(data_lines)
+        self._trig_row = block.trigger_row or 0
+        self._status_packed = block.status
+        self._status_stride = block.status_stride
+        if not self._status_stride:
+            self._size_empty_status()
+        self.status_channels = PackedStatusChannels(self)
+        self._check_samples(trigger_found=block.trigger_row is not None)
+
+    # Define Method to Size the Packed Status of a Record without Samples
+    def _size_empty_status(self):
+        """Size the Packed Status by the Status Bits, as No Row Can."""
+        self._status_stride = max(self._status_bits, default=-1) // 8 + 1
+        if self.backend == BACKEND_NUMPY:
+            self._status_packed = np.empty(
+                (0, self._status_stride), dtype=np.uint8
+            )
+        else:
+            self._status_packed = b''
+
+    # Define Method to Identify Anomalies in the Samples
+    def _check_samples(self, trigger_found):
+        """Note any Inconsistency of the Samples with the Header."""
+        if self._sample_count and not trigger_found:
+            self.validation.anomalies.append(
+                f"No trigger row ('{TRIGGER_KEY_CHAR}') was found among the "
+                "samples; the first sample is treated as the trigger"
+            )
+        try:
+            expected = round(
+                float(self._properties["NUM_OF_CYC"]) *
+                float(self._properties[ANALOG_SAMPLES])
+            )
+        except (KeyError, ValueError):
+            return  # Number of Cycles is Not Described
+        if expected != self._sample_count:
+            self.validation.anomalies.append(
+                f"Record holds {self._sample_count} samples, but the header "
+                f"describes {expected} (NUM_OF_CYC x {ANALOG_SAMPLES})"
+            )
+
+    # Define Event Trigger Time Evaluator
+    def _eval_trigger_time(self):
+        """Use Time Information to Identify Trigger Time."""
+        usec = int(self.msec) * 1000
+        self.trigger_time = dt.datetime(
+            year=int(self.year),
+            month=int(self.month),
+            day=int(self.day),
+            hour=int(self.hour),
+            minute=int(self.min),
+            second=int(self.sec),
+            microsecond=usec
+        )
+
+    # Define Frequency Identifier
+    def _eval_frequency(self):
+        """Identify and load the system nominal frequency."""
+        self.frequency = float(self._properties.get(FREQUENCY_KEY, 60.0))
+
+    # Define FID Cleaner
+    def _clean_fid(self):
+        """Store the 'raw' FID in a New Variable, and Clean Existing FID."""
+        try:
+            self.raw_fid = self.fid
+            self.fid = self.fid.split('=')[1]
+        except Exception as err:
+            raise MalformedNoFIDFound(
+                "Failed to load relay FID from CEV"
+            ) from err
+
+    # Define Samples-Per-Cycle Evaluator
+    def _eval_samples_per_cycle(self):
+        """Identify the Samples/Cycle Indicators, Calculate the Deltas."""
+        try:
+            # Extract the Number of Samples per Cycle, Evaluate Milliseconds
+            ms_per_cyc = 1000 / self.frequency
+            analog_ms = ms_per_cyc / float(self._properties[ANALOG_SAMPLES])
+            digital_ms = ms_per_cyc / float(self._properties[DIGITAL_SAMPLES])
+        except KeyError as err:
+            raise MalformedNoSampleNumberFound(
+                "Failed to identify number of samples per cycle"
+            ) from err
+        # Prepare the TimeDeltas
+        self._analog_samp_timedelta = dt.timedelta(milliseconds=analog_ms)
+        self._digital_samp_timedelta = dt.timedelta(milliseconds=digital_ms)
+        self._analog_samp_period = analog_ms / 1000
+        self._digital_samp_period = digital_ms / 1000
+
+    # Define Timestamp Loader
+    def _eval_timestamps(self):
+        """Evaluate event timestamps."""
+        # Describe the Time Axes from the Trigger Time and Sample Periods
+        self.time = TimeAxis(
+            reference=self.trigger_time,
+            period=self._analog_samp_period,
+            count=self._sample_count,
+            offset=-self._analog_samp_period * self._trig_row,
+        )
+        # Digital Samples Span the Same Time as the Analog Rows
+        self.digital_time = TimeAxis(
+            reference=self.trigger_time,
+            period=self._digital_samp_period,
+            count=self._digital_count(
+                self._analog_samp_period * self._sample_count
+            ) if self._digital_samp_period else 0,
+            offset=-self._analog_samp_period * self._trig_row,
+        )
+
+    # Define Header-Only Scanning Constructor
+    @classmethod
+    def scan(cls, file, **kwargs):
+        """
+        *Scan the header information of a CEV file*.
+
+        Use this method to quickly gather the metadata of a CEV file
+        (such as `trigger_time`, `fid`, `frequency`, the sample rates,
+        and the channel names) without reading or parsing the samples
+        or relay settings. Reading stops at the row which follows the
+        channel heading, so only the first few kilobytes of the file
+        are read. Only the rows which are read are checksum-validated.
+
+        The resulting `Cev` carries no channel data, and its `time`
+        is empty.
+
+        Parameters
+        ----------
+        file:       [str, file-like]
+                    String describing the relative or fully qualified path
+                    to the CEV file that should be scanned, or an open
+                    file-like object.
+        **kwargs:   dict, optional
+                    Additional optional parameters, as accepted by `Cev`.
+
+        Returns
+        -------
+        record:     Cev
+                    The header-only record.
+
+        Examples
+        --------
+        >>> from pycev import CEV
+        >>> record = CEV.scan("./event-report.cev")
+        >>> print("Trigger time = {}s".format(record.trigger_time))
+        """
+        kwargs["header_only"] = True
+        return cls(file=file, **kwargs)
+
+    # Define File Loader Method
+    def load(self, file: str, encoding: str = None):
+        """
+        *CEV File Loader Method*.
+
+        Use this method to load a CEV file, and parse its contents into the
+        valuable class attributes and structure.
+
+        Parameters
+        ----------
+        file:       str
+                    String describing the relative or fully qualified path to
+                    the CEV file that should be read. Optionally used during
+                    class initialization, may also be loaded using the `load`
+                    method.
+        encoding:   str, optional
+                    String specifying the encoding format (if required) in
+                    which the file is stored. This may be used for files of
+                    format 'utf-8', for example.
+
+        See Also
+        --------
+        load_data       : Load data which has already been read from a file,
+                          or is presented as a stream.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the file cannot be located on the system
+        MalformedHeadingDataMismatch
+            If the file contains a header and content row pair which do not
+            share an equal number of columns.
+        MalformedChecksumFailure
+            If the 'strict' checksum mode is used, and any of the CEV
+            line-wise checksums do not evaluate successfully.
+
+        Warns
+        -----
+        UnexpectedFileExtension
+            If the uppercase-cast file extension is not ".CEV"
+        MalformedChecksumFailure
+            If any of the CEV line-wise checksums do not evaluate successfully
+
+        Examples
+        --------
+        >>> from pycev import CEV
+        >>> # Load a file and parse, directly.
+        >>> record = CEV() # Create the parser instance
+        >>> record.load(file="./event-report.cev")
+        >>> print("Trigger time = {}s".format(record.trigger_time))
+        """
+        # Switch between Handling File-Path, or File-Like-Object
+        if isinstance(file, str):
+            # Validate file Extension
+            self._validate_extension(file)
+            if self._cache is not None and not self.header_only:
+                self._load_cached(file, encoding=encoding)
+                return
+            # Read File with Encoding
+            with open(file, 'r', encoding=encoding,
+                      errors=self._decode_opt) as file_obj:
+                if self.header_only:
+                    # Read No Further than the Channel Heading
+                    self._load_header_only(file_obj)
+                    return
+                with self._measure_stage("read") as stage:
+                    self.data = file_obj.read()  # Gather ALL Data From File
+                    stage["bytes"] = len(self.data)
+        elif hasattr(file, "read"):
+            if self.header_only:
+                self._load_header_only(file, encoding=encoding)
+                return
+            self.data = file.read()
+        # Process the Data and Load Record
+        self.load_data(data=None)
+
+    # Define Data Loader Method
+    def load_data(self, data: Union[str, bytes], encoding: str = None):
+        """
+        *CEV Data Loader Method*.
+
+        Use this method to load the data from a CEV file which has already been
+        read, or data which is being streamed to the class (i.e., an active
+        connection to a relay). This method will parse the data and load the
+        class attributes and structures appropriately.
+
+        Parameters
+        ----------
+        data:       [str, bytes]
+                    String of the full file content.
+        encoding:   str, optional
+                    String specifying the encoding format (if required) in
+                    which the file is stored. This may be used for files of
+                    format 'utf-8', for example.
+
+        See Also
+        --------
+        load            : Load data from a CEV file.
+
+        Raises
+        ------
+        MalformedHeadingDataMismatch
+            If the file contains a header and content row pair which do not
+            share an equal number of columns.
+        MalformedChecksumFailure
+            If the 'strict' checksum mode is used, and any of the CEV
+            line-wise checksums do not evaluate successfully.
+
+        Warns
+        -----
+        MalformedChecksumFailure
+            If any of the CEV line-wise checksums do not evaluate successfully
+
+        Examples
+        --------
+        >>> from pycev import CEV
+        >>> # Load a file and parse, directly.
+        >>> record = CEV() # Create the parser instance
+        >>> with open("./event-report.cev", 'r') as file:
+        ...     data = file.read()
+        >>> record.load_data(data=data)
+        >>> print("Trigger time = {}s".format(record.trigger_time))
+        """
+        # Method is Called Internally with `data=None`
+        # Don't Try Loading in this Case
+        if data is not None:
+            # Decode Data As Needed
+            self.data = self._decode(data, encoding=encoding)
+            if self.header_only:
+                # Iterate Lines Lazily, Only Reading the Header Rows
+                self._load_header_only(io.StringIO(self.data))
+                self.data = ''
+                return
+        # Prepare Record Information
+        self._prepare_and_validate_record()
+        # Parse the Record
+        self._parse_record()
+        with self._measure_stage("timestamps"):
+            # Determine the Trigger Time
+            self._eval_trigger_time()
+            # Identify Nominal System Frequency
+            self._eval_frequency()
+            # Clean FID
+            self._clean_fid()
+            # Rationalize Number of Samples per Cycle
+            self._eval_samples_per_cycle()
+            # Evaluate the Timestamps
+            self._eval_timestamps()
+        # Drop the Raw Text, if Not Retained
+        self._release_raw()
+        self._share_settings()
+
+    # Define Method to Drop the Raw Text of a Parsed Record
+    def _release_raw(self):
+        """Release the Raw Text (and Settings) which are Not Retained."""
+        if not self._keep_raw:
+            # Deferred Checksums Can No Longer be Evaluated Later
+            if (self.checksum_mode == CHECKSUM_DEFERRED and self.record and
+                    self._invalid_lines is None and
+                    self._known_invalid_lines is None):
+                self._known_invalid_lines = validate_record_checksums(
+                    self.record
+                )
+            self.data = ''
+            self.record = ''
+            self.record_lines = self.record_lines[:self._heading_row + 1]
+        if not self._keep_settings:
+            self.settings = ''
+
+    # Define Method to Reference the Stored Copy of the Settings
+    def _share_settings(self):
+        """Replace the Settings with those of the Store, if Any."""
+        if self._settings_store is not None:
+            self._settings_store.share(self)
+
+    # Define Context to Measure a Stage of the Load
+    @contextlib.contextmanager
+    def _measure_stage(self, stage):
+        """Measure the Time (and Memory) of a Stage, when Profiling."""
+        counts = {"lines": 0, "bytes": 0}
+        if not self._profiling:
+            yield counts
+            return
+        tracing = self._profile_memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        if self._profile_memory:
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            elif not tracing:
+                # Python 3.8 Cannot Reset the Peak, so Restart the Tracing
+                limit = tracemalloc.get_traceback_limit()
+                tracemalloc.stop()
+                tracemalloc.start(limit)
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield counts
+            seconds = time.perf_counter() - start
+            peak_memory = None
+            if self._profile_memory:
+                peak_memory = tracemalloc.get_traced_memory()[1] - baseline
+        finally:
+            if tracing:
+                tracemalloc.stop()
+        stats = StageStats(
+            stage=stage,
+            seconds=seconds,
+            lines=counts["lines"],
+            bytes=counts["bytes"],
+            peak_memory=peak_memory,
+        )
+        self.load_stats[stage] = stats
+        if self._profile_hook is not None:
+            self._profile_hook(stats)
+
+    # Define Method to Load a File by way of the Record Cache
+    def _load_cached(self, file, encoding=None):
+        """Load the Record from the Cache, or Parse and Store it."""
+        options = [
+            encoding, self._decode_opt,
+            self._analog_selection, self._digital_selection,
+        ]
+        if not self._keep_settings:
+            options.append("without-settings")  # Stored without Settings
+        status = os.stat(file)
+        # Files Already Seen are Identified by their Path and Status Alone
+        with self._measure_stage("cache") as stage:
+            key = self._cache.lookup(file, status, options)
+            hit = key is not None and self._cache.load(key, self)
+            stage["bytes"] = status.st_size
+        if not hit:
+            raw = self._read_cached_file(file)
+            key = self._cache.key(raw, options)
+            if not self._cache.load(key, self):
+                # Parse the Record as Usual, then Store it
+                self.data = self._decode_text(raw, encoding)
+                self.load_data(data=None)
+                self._cache.store(key, self)
+                self._cache.link(file, status, options, key)
+                return
+            self._cache.link(file, status, options, key)
+        # Report Checksum Failures Recorded with the Cached Record
+        if self.checksum_mode not in (CHECKSUM_DEFERRED, CHECKSUM_OFF):
+            self._validate_checksums()
+        self._release_raw()
+        self._share_settings()
+        if self._keep_raw:
+            # The Cache Holds No Raw Text, so Restore it Only if Accessed
+            self._raw_source = (file, status, encoding, self.record_lines)
+            del self.data, self.record, self.record_lines
+
+    # Define Method to Restore the Raw Text of a Record Loaded from Cache
+    def _restore_raw(self):
+        """Read the Raw Text Again, if the File is Unchanged."""
+        file, status, encoding, header_lines = self.__dict__.pop(
+            '_raw_source'
+        )
+        self.data = ''
+        self.record = ''
+        self.record_lines = header_lines
+        try:
+            current = os.stat(file)
+            if (current.st_size, current.st_mtime_ns) != (
+                    status.st_size, status.st_mtime_ns):
+                return  # Changed Since it was Loaded
+            with open(file, 'rb') as file_obj:
+                raw = file_obj.read()
+        except OSError:
+            return  # Removed Since it was Loaded
+        self.data = self._decode_text(raw, encoding)
+        self.record, _ = split_event_and_relay_data(self.data)
+        self.record_lines = []
+        self._collect_record_lines()
+
+    # Define Method to Read the Bytes of a File Loaded by way of the Cache
+    def _read_cached_file(self, file):
+        """Read the Raw Bytes of the File, Measured as the Read Stage."""
+        with self._measure_stage("read") as stage:
+            with open(file, 'rb') as file_obj:
+                raw = file_obj.read()
+            stage["bytes"] = len(raw)
+        return raw
+
+    # Define Method to Decode Raw Bytes as a File Read in Text Mode Would
+    def _decode_text(self, raw, encoding):
+        """Decode the Raw Bytes, Translating the Newlines as `open` Does."""
+        return io.TextIOWrapper(
+            io.BytesIO(raw), encoding=encoding, errors=self._decode_opt
+        ).read()
+
+    # Define Method to Write the Parsed Record in Binary Form
+    def _write_binary(self, file_obj):
+        """Write the Header, Settings, and Channels as Binary Sections."""
+        invalid_lines = self._invalid_lines
+        if invalid_lines is None:
+            invalid_lines = self._known_invalid_lines
+        if invalid_lines is None and self.record:
+            invalid_lines = validate_record_checksums(self.record)
+        sample_count = self._sample_count
+        stride = self._status_stride
+        settings = self.settings.encode('utf-8', 'surrogateescape')
+        # Locate Each Section Relative to the End of the Metadata
+        sections = {}
+        offset = 0
+        for name, size in (
+            ("analogs", self.analog_count * sample_count * 8),
+            ("status", stride * sample_count),
+            ("settings", len(settings)),
+        ):
+            sections[name] = [offset, size]
+            offset = _align(offset + size)
+        metadata = json.dumps({
+            "format": BINARY_FORMAT_VERSION,
+            "version": _version_,
+            "properties": list(self._properties.items()),
+            "record_lines": self.record_lines[:self._heading_row + 1],
+            "analog_channel_ids": self.analog_channel_ids,
+            "status_channel_ids": self.status_channel_ids,
+            "status_bits": self._status_bits,
+            "status_stride": stride,
+            "ignored_channels": self._ignored_channels,
+            "trig_column": self._trig_column,
+            "trig_row": self._trig_row,
+            "sample_count": sample_count,
+            "anomalies": self.validation.anomalies,
+            "invalid_lines": (
+                None if invalid_lines is None else sorted(invalid_lines)
+            ),
+            "sections": sections,
+        }).encode('utf-8')
+        file_obj.write(BINARY_MAGIC)
+        file_obj.write(struct.pack('<I', len(metadata)))
+        file_obj.write(metadata)
+        base = _align(len(BINARY_MAGIC) + 4 + len(metadata))
+        file_obj.write(bytes(base - len(BINARY_MAGIC) - 4 - len(metadata)))
+
+        # Write the Analogs as Little-Endian Doubles, One Channel at a Time
+        if self.backend == BACKEND_NUMPY:
+            file_obj.write(np.ascontiguousarray(
+                self.analog_channels, dtype='<f8'
+            ).tobytes())
+        else:
+            for channel in self.analog_channels:
+                values = array.array('d', channel)
+                if sys.byteorder == 'big':
+                    values.byteswap()
+                file_obj.write(values.tobytes())
+        file_obj.write(bytes(sections["status"][0] - sections["analogs"][1]))
+
+        # Write the Packed Status Bytes, One Byte Column at a Time
+        if self.backend == BACKEND_NUMPY:
+            file_obj.write(np.ascontiguousarray(
+                self._status_packed.T, dtype=np.uint8
+            ).tobytes())
+        else:
+            for column in range(stride):
+                file_obj.write(self._status_packed[column::stride])
+        file_obj.write(bytes(
+            sections["settings"][0] - sum(sections["status"])
+        ))
+        file_obj.write(settings)
+
+    # Define Method to Read the Parsed Record from Binary Form
+    def _read_binary(self, file):
+        """Memory-Map a Binary Record, and Load its Header and Channels."""
+        with open(file, 'rb') as file_obj:
+            try:
+                mapped = mmap.mmap(
+                    file_obj.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError as err:  # Empty File Cannot be Mapped
+                raise MalformedBinaryRecord(
+                    "Binary record is empty"
+                ) from err
+        try:
+            start = len(BINARY_MAGIC) + 4
+            if mapped[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+                raise MalformedBinaryRecord("Binary record marker not found")
+            (size,) = struct.unpack_from('<I', mapped, len(BINARY_MAGIC))
+            metadata = json.loads(mapped[start:start + size].decode('utf-8'))
+            if metadata["format"] != BINARY_FORMAT_VERSION:
+                raise MalformedBinaryRecord(
+                    f"Unsupported binary record format {metadata['format']}"
+                )
+            base = _align(start + size)
+            sections = {
+                name: (base + offset, length)
+                for name, (offset, length) in metadata["sections"].items()
+            }
+            if max(sum(section) for section in sections.values()) > len(
+                mapped
+            ):
+                raise MalformedBinaryRecord("Binary record is truncated")
+        except (struct.error, ValueError, KeyError, TypeError) as err:
+            mapped.close()
+            raise MalformedBinaryRecord(
+                "Binary record could not be interpreted"
+            ) from err
+
+        # Present the Channels from the Mapped Sections
+        sample_count = metadata["sample_count"]
+        stride = metadata["status_stride"]
+        analog_count = len(metadata["analog_channel_ids"])
+        offset, length = sections["analogs"]
+        if self.backend == BACKEND_NUMPY:
+            # Read-Only Views, Touching Only the Pages which are Indexed
+            self.analog_channels = np.frombuffer(
+                mapped, dtype='<f8', count=length // 8, offset=offset
+            ).reshape(analog_count, sample_count)
+        else:
+            self.analog_channels = MappedAnalogChannels(
+                memoryview(mapped)[offset:offset + length],
+                count=analog_count,
+                sample_count=sample_count,
+            )
+        offset, length = sections["status"]
+        if self.backend == BACKEND_NUMPY:
+            self._status_packed = np.frombuffer(
+                mapped, dtype=np.uint8, count=length, offset=offset
+            ).reshape(stride, sample_count).T
+        else:
+            # Interleave the Byte Columns Back into Sample-Major Order
+            packed = bytearray(length)
+            for column in range(stride):
+                first = offset + column * sample_count
+                packed[column::stride] = mapped[first:first + sample_count]
+            self._status_packed = bytes(packed)
+        offset, length = sections["settings"]
+        self.settings = mapped[offset:offset + length].decode(
+            'utf-8', 'surrogateescape'
+        )
+
+        # Restore the Header Information
+        self._properties = {}
+        for key, value in metadata["properties"]:
+            self._load_property(key, value)
+        self.record_lines = metadata["record_lines"]
+        self._heading_row = len(self.record_lines) - 1
+        self.analog_channel_ids = metadata["analog_channel_ids"]
+        self.status_channel_ids = metadata["status_channel_ids"]
+        self._status_bits = metadata["status_bits"]
+        self._status_stride = stride
+        self._ignored_channels = metadata["ignored_channels"]
+        self._trig_column = metadata["trig_column"]
+        self._trig_row = metadata["trig_row"]
+        self._sample_count = sample_count
+        self._analog_column_count = analog_count
+        self.validation.anomalies = list(metadata.get("anomalies", []))
+        if metadata["invalid_lines"] is not None:
+            self._known_invalid_lines = set(metadata["invalid_lines"])
+        self._index_channels()
+        self.status_channels = PackedStatusChannels(self)
+        self._eval_trigger_time()
+        self._eval_frequency()
+        self._clean_fid()
+        self._eval_samples_per_cycle()
+        self._eval_timestamps()
+
+    # Define Method to Form the Compact Record
+    def compact(self, keep_settings: bool = True):
+        """
+        *Form the compact, memory-lean form of the parsed record*.
+
+        The compact record shares the parsed channels of this record, but
+        holds none of its raw text, and stores its attributes in fixed
+        slots. Any 'deferred' checksums are evaluated first.
+
+        Parameters
+        ----------
+        keep_settings:  bool, optional
+                        Control to retain the relay settings text, default
+                        is True.
+
+        Returns
+        -------
+        record:     CompactCev
+                    The compact record.
+
+        Examples
+        --------
+        >>> from pycev import CEV
+        >>> record = CEV(file="./event-report.cev").compact()
+        >>> print("Trigger time = {}s".format(record.trigger_time))
+        """
+        return CompactCev(self, keep_settings=keep_settings)
+
+    # Define Method to Save the Parsed Record in Binary Form
+    def save(self, file):
+        """
+        *Save the parsed record in a compact binary form*.
+
+        Use this method to persist the parsed record such that it may be
+        re-opened with `Cev.open_binary` without parsing the CEV again.
+        The binary form is columnar; it holds a JSON description of the
+        header information, channel names, and section offsets, followed
+        by the analog channels (each channel stored contiguously as
+        little-endian doubles), the packed status bytes (each byte column
+        stored contiguously), and the relay settings. Each section starts
+        on a 64-byte boundary, so that the file may be memory-mapped.
+
+        The checksum failures of the record are retained, but the raw
+        `data` and `record` text is not.
+
+        Parameters
+        ----------
+        file:       [str, file-like]
+                    String describing the relative or fully qualified path
+                    of the file which should be written, or an open
+                    binary file-like object.
+
+        See Also
+        --------
+        open_binary     : Open a record saved in the binary form.
+
+        Examples
+        --------
+        >>> from pycev import CEV
+        >>> record = CEV(file="./event-report.cev")
+        >>> record.save("./event-report.cevb")
+        """
+        if hasattr(file, "write"):
+            self._write_binary(file)
+            return
+        with open(file, 'wb') as file_obj:
+            self._write_binary(file_obj)
+
+    # Define Constructor to Open a Record Saved in Binary Form
+    @classmethod
+    def open_binary(cls, file, **kwargs):
+        """
+        *Open a record saved in the binary form*.
+
+        Use this method to open a record which was written by `save`.
+        The file is memory-mapped, rather than read, so that reading
+        one channel of a large record touches only the pages of the file
+        which hold that channel. When the 'numpy' backend is used, the
+        analog channels and packed status data are read-only arrays
+        viewing the mapped file; otherwise the analog channels are a
+        `MappedAnalogChannels` sequence, read as each channel is indexed.
+
+        Parameters
+        ----------
+        file:       str
+                    String describing the relative or fully qualified path
+                    to the binary record.
+        **kwargs:   dict, optional
+                    Additional optional parameters, as accepted by `Cev`
+                    (such as `backend` or `checksum`).
+
+        Returns
+        -------
+        record:     Cev
+                    The record, as it was parsed before being saved.
+
+        Raises
+        ------
+        MalformedBinaryRecord
+            If the file is not a binary record, or is truncated.
+        MalformedChecksumFailure
+            If the 'strict' checksum mode is used, and the record failed
+            checksum validation when it was parsed.
+
+        Warns
+        -----
+        MalformedChecksumFailure
+            If the record failed checksum validation when it was parsed.
+
+        See Also
+        --------
+        save        : Save the parsed record in the binary form.
+
+        Examples
+        --------
+        >>> from pycev import CEV
+        >>> record = CEV.open_binary("./event-report.cevb")
+        >>> record.get_analog("IA")
+        [...]
+        """
+        record = cls(**kwargs)
+        record._read_binary(os.fspath(file))
+        if record.checksum_mode not in (CHECKSUM_DEFERRED, CHECKSUM_OFF):
+            record._validate_checksums()
+        return record
+
+    # Define Method to Describe the Record as a COMTRADE Configuration
+    def _comtrade_config(self, data_format, scales, limit, station_name,
+                         rec_dev_id):
+        """Prepare the Lines of the COMTRADE Configuration (*.cfg) File."""
+        def timestamp(value):
+            return value.strftime("%d/%m/%Y,%H:%M:%S.%f")
+        lines = [
+            f"{station_name},{rec_dev_id},2013",
+            f"{self.analog_count + self.status_count},"
+            f"{self.analog_count}A,{self.status_count}D",
+        ]
+        for i, (name, scale) in enumerate(
+            zip(self.analog_channel_ids, scales)
+        ):
+            lines.append(
+                f"{i + 1},{name},,,{_comtrade_unit(name)},{scale!r},0.0,0,"
+                f"{-limit},{limit},1,1,P"
+            )
+        for i, name in enumerate(self.status_channel_ids):
+            lines.append(f"{i + 1},{name},,,0")
+        sample_rate = (
+            1 / self._analog_samp_period if self._analog_samp_period else 0
+        )
+        lines += [
+            f"{self.frequency:g}",
+            "1",
+            f"{sample_rate:g},{self._sample_count}",
+            timestamp(self.time[0] if self._sample_count else
+                      self.trigger_time),
+            timestamp(self.trigger_time),
+            data_format,
+            "1",  # Timestamps are in Microseconds
+            "0,0",
+            "0,0",
+        ]
+        return lines
+
+    # Define Method to Write a Range of Samples as COMTRADE Data
+    def _write_comtrade_rows(self, file_obj, data_format, scales, limit,
+                             analogs, first, stop):
+        """Write the COMTRADE Data (*.dat) Rows for a Range of Samples."""
+        period_us = self._analog_samp_period * 1e6
+        word_count = -(-self.status_count // 16)  # 16 Status Bits per Word
+        # Unpack the Status Channels Only for the Samples of this Chunk
+        states = self._unpack_statuses(self._status_bits, first, stop)
+        if self.backend == BACKEND_NUMPY:
+            count = stop - first
+            values = np.clip(np.round(
+                analogs[:, first:stop].T / np.asarray(scales)
+            ), -limit, limit)
+            if data_format == COMTRADE_ASCII:
+                rows = np.empty(
+                    (count, 2 + self.analog_count + self.status_count),
+                    dtype=np.int64,
+                )
+                rows[:, 0] = np.arange(first + 1, stop + 1)
+                rows[:, 1] = np.round(np.arange(first, stop) * period_us)
+                rows[:, 2:2 + self.analog_count] = values
+                rows[:, 2 + self.analog_count:] = states.T
+                np.savetxt(
+                    file_obj, rows, fmt='%d', delimiter=',', newline='\r\n'
+                )
+                return
+            rows = np.empty(count, dtype=[
+                ('sample', '<u4'),
+                ('time', '<u4'),
+                ('analogs', '<i2' if data_format == COMTRADE_BINARY else '<i4',
+                 (self.analog_count,)),
+                ('statuses', '<u2', (word_count,)),
+            ])
+            rows['sample'] = np.arange(first + 1, stop + 1)
+            rows['time'] = np.round(np.arange(first, stop) * period_us)
+            rows['analogs'] = values
+            # Pack Sixteen Status Channels into Each Word, First Channel LSB
+            bits = np.zeros((word_count * 16, count), dtype=np.uint16)
+            bits[:self.status_count] = states
+            rows['statuses'] = np.tensordot(
+                bits.reshape((word_count, 16, count)).transpose(2, 0, 1),
+                (1 << np.arange(16)).astype(np.uint16),
+                axes=1,
+            )
+            file_obj.write(rows.tobytes())
+            return
+        values = [
+            [min(max(round(value / scale), -limit), limit)
+             for value in channel[first:stop]]
+            for channel, scale in zip(analogs, scales)
+        ]
+        chunk = []
+        if data_format == COMTRADE_ASCII:
+            for i in range(stop - first):
+                row = [first + i + 1, round((first + i) * period_us)]
+                row += [channel[i] for channel in values]
+                row += [channel[i] for channel in states]
+                chunk.append(",".join(str(value) for value in row) + "\r\n")
+            file_obj.write(''.join(chunk).encode('ascii'))
+            return
+        row_format = struct.Struct(
+            "<II" + ("h" if data_format == COMTRADE_BINARY else "i") *
+            self.analog_count + "H" * word_count
+        )
+        for i in range(stop - first):
+            words = [0] * word_count
+            for bit, channel in enumerate(states):
+                words[bit // 16] |= channel[i] << (bit % 16)
+            chunk.append(row_format.pack(
+                first + i + 1, round((first + i) * period_us),
+                *(channel[i] for channel in values), *words
+            ))
+        file_obj.write(b''.join(chunk))
+
+    # Define Method to Export the Record in the COMTRADE Format
+    def to_comtrade(self, basename, binary: bool = True,
+                    data_format: str = None, station_name: str = None,
+                    rec_dev_id: str = None, chunk_size: int = 4096):
+        """
+        *Export the record as a COMTRADE record*.
+
+        Use this method to write the analog and status channels of the
+        record as an IEEE C37.111-2013 (COMTRADE) configuration (*.cfg)
+        and data (*.dat) file pair. Each analog channel is scaled to the
+        integer range of the data format, and the status channels are
+        packed sixteen to a word for the binary formats. The data rows
+        are written in chunks of `chunk_size` samples, so that the data
+        file is never held in memory as a whole.
+
+        Parameters
+        ----------
+        basename:       str
+                        Path of the files to write, without extension;
+                        the '.cfg' and '.dat' extensions are appended.
+        binary:         bool, optional
+                        Control to write the data as 'BINARY' (16-bit)
+                        rather than 'ASCII', default is True.
+        data_format:    str, optional
+                        Name of the data format, one of 'ASCII',
+                        'BINARY', or 'BINARY32'; overrides `binary`.
+        station_name:   str, optional
+                        Station name, default is the name of the files.
+        rec_dev_id:     str, optional
+                        Recording device identifier, default is the
+                        relay FID.
+        chunk_size:     int, optional
+                        Number of samples written at once, default is
+                        4096.
+
+        Returns
+        -------
+        files:      tuple of str
+                    The paths of the configuration and data files.
+
+        See Also
+        --------
+        convert_to_comtrade : Convert many CEV files to COMTRADE records.
+
+        Examples
+        --------
+        >>> from pycev import CEV
+        >>> record = CEV(file="./event-report.cev")
+        >>> record.to_comtrade("./event-report", data_format="BINARY32")
+        ('./event-report.cfg', './event-report.dat')
+        """
+        if data_format is None:
+            data_format = COMTRADE_BINARY if binary else COMTRADE_ASCII
+        data_format = data_format.upper()
+        if data_format not in COMTRADE_FORMATS:
+            raise ValueError(
+                f"Unsupported COMTRADE data format {data_format!r}, expected "
+                "one of: " + ", ".join(COMTRADE_FORMATS)
+            )
+        basename = os.fspath(basename)
+        if station_name is None:
+            station_name = os.path.basename(basename)
+        if rec_dev_id is None:
+            rec_dev_id = self.fid
+        limit = COMTRADE_LIMITS[data_format]
+        # Scale Each Analog Channel by its Greatest Magnitude
+        if self.backend == BACKEND_NUMPY:
+            analogs = np.asarray(self.analog_channels, dtype=float)
+            peaks = np.abs(analogs).max(axis=1) if self._sample_count else (
+                np.zeros(self.analog_count)
+            )
+            peaks = peaks.tolist()
+        else:
+            analogs = list(self.analog_channels)
+            peaks = [
+                max((abs(value) for value in channel), default=0.0)
+                for channel in analogs
+            ]
+        scales = [peak / limit if peak else 1.0 for peak in peaks]
+
+        # Write the Configuration, then the Data in Chunks
+        cfg_file = basename + ".cfg"
+        dat_file = basename + ".dat"
+        with open(cfg_file, 'w', encoding='utf-8', newline='\r\n') as cfg:
+            cfg.write("\n".join(self._comtrade_config(
+                data_format, scales, limit, station_name, rec_dev_id
+            )) + "\n")
+        with open(dat_file, 'wb') as dat:
+            for first in range(0, self._sample_count, chunk_size):
+                self._write_comtrade_rows(
+                    dat, data_format, scales, limit, analogs,
+                    first, min(first + chunk_size, self._sample_count),
+                )
+        return cfg_file, dat_file
+
+    # Define Method to Form the Channel Heading Row
+    @staticmethod
+    def _format_channel_heading(analog_channel_ids, status_channel_ids,
+                                status_bits, status_stride):
+        """Form the Channel Heading Row from the Channel Names and Bits."""
+        digitals = ['*'] * (status_stride * 8)  # Unused Bits
+        for name, bit in zip(status_channel_ids, status_bits):
+            digitals[bit] = name
+        return ",".join(
+            [f'"{name}"' for name in analog_channel_ids] +
+            ['"TRIG"', '"' + ' '.join(digitals) + ' "']
+        )
+
+    # Define Method to Form the Header Rows of the Record
+    def _dump_header_rows(self, trig_row):
+        """Yield the Header Rows, Describing the Samples to be Written."""
+        values = {}
+        try:
+            cycles = self._sample_count / float(
+                self._properties[ANALOG_SAMPLES]
+            )
+            values["NUM_OF_CYC"] = f"{cycles:.10g}"
+        except (KeyError, ValueError, ZeroDivisionError):
+            pass  # Number of Cycles is Not Described
+        if trig_row != self._trig_row:
+            # Describe the Time of the Row Marked, to the Nearest Millisecond
+            trigger_time = self.time[trig_row]
+            trigger_time += dt.timedelta(microseconds=(
+                round(trigger_time.microsecond, -3) -
+                trigger_time.microsecond
+            ))
+            values.update({
+                "MONTH": trigger_time.month, "DAY": trigger_time.day,
+                "YEAR": trigger_time.year, "HOUR": trigger_time.hour,
+                "MIN": trigger_time.minute, "SEC": trigger_time.second,
+                "MSEC": trigger_time.microsecond // 1000,
+            })
+        rows = self.record_lines[:self._heading_row]
+        for heading, content in zip(rows[::2], rows[1::2]):
+            fields = content.split(',')
+            for i, key in enumerate(heading.replace('"', '').split(',')):
+                if key in values and i < len(fields):
+                    fields[i] = str(values[key])
+            yield heading
+            yield ','.join(fields)
+
+    # Define Method to Form the Rows of the Record
+    def _dump_rows(self):
+        """Yield Each Row of the Record, with its Checksum."""
+        # Mark the Nearest Row Written, if the Trigger was Trimmed Away
+        trig_row = self._trig_row
+        if self._sample_count:
+            trig_row = min(max(trig_row, 0), self._sample_count - 1)
+        for row in self._dump_header_rows(trig_row):
+            yield append_row_checksum(row)
+        yield append_row_checksum(self._format_channel_heading(
+            self.analog_channel_ids, self.status_channel_ids,
+            self._status_bits, self._status_stride,
+        ))
+        stride = self._status_stride
+        if self.backend == BACKEND_NUMPY:
+            samples = np.asarray(self.analog_channels).T.tolist()
+            statuses = (
+                self._status_packed[i].tobytes()
+                for i in range(self._sample_count)
+            )
+        else:
+            samples = zip(*self.analog_channels) if self.analog_count else (
+                [()] * self._sample_count
+            )
+            statuses = (
+                self._status_packed[i * stride:(i + 1) * stride]
+                for i in range(self._sample_count)
+            )
+        for i, (analogs, status) in enumerate(zip(samples, statuses)):
+            trigger = TRIGGER_KEY_CHAR if i == trig_row else ''
+            yield append_row_checksum(
+                ",".join([repr(float(value)) for value in analogs] + [
+                    f'"{trigger}"', f'"{status.hex().upper()}"'
+                ])
+            )
+
+    # Define Method to Write the Record as CEV Data
+    def dumps(self, newline: str = '\r\n'):
+        r"""
+        *Write the record as CEV data*.
+
+        Use this method to form the text of a CEV file from the record,
+        such as a record built with `from_channels`, or one which was
+        trimmed with `window`. The header rows are written as they were
+        read, while the channel heading and the sample rows are formed
+        from the channels of the record, each with its checksum. The
+        relay settings are appended as they were read.
+
+        Parameters
+        ----------
+        newline:    str, optional
+                    Characters used to terminate each row, default is
+                    '\r\n'.
+
+        Returns
+        -------
+        data:       str
+                    The full text of the CEV.
+
+        See Also
+        --------
+        dump            : Write the record as a CEV file.
+        from_channels   : Build a record from the channel samples.
+
+        Examples
+        --------
+        >>> from pycev import CEV
+        >>> record = CEV(file="./event-report.cev")
+        >>> trimmed = CEV(data=record.cycles(pre=1, post=2).dumps())
+        """
+        buffer = io.StringIO()
+        self.dump(buffer, newline=newline)
+        return buffer.getvalue()
+
+    # Define Method to Write the Record as a CEV File
+    def dump(self, file, newline: str = '\r\n'):
+        r"""
+        *Write the record as a CEV file*.
+
+        The rows are written to the file as they are formed, rather than
+        forming the full text of the CEV first; see `dumps`.
+
+        Parameters
+        ----------
+        file:       [str, file-like]
+                    String describing the relative or fully qualified path
+                    of the file which should be written, or an open text
+                    file-like object.
+        newline:    str, optional
+                    Characters used to terminate each row, default is
+                    '\r\n'.
+
+        See Also
+        --------
+        dumps           : Write the record as CEV data.
+
+        Examples
+        --------
+        >>> from pycev import CEV
+        >>> record = CEV(file="./event-report.cev")
+        >>> record.cycles(pre=1, post=2).dump("./trimmed-report.cev")
+        """
+        if not hasattr(file, "write"):
+            with open(file, 'w', encoding='utf-8', newline='') as file_obj:
+                self.dump(file_obj, newline=newline)
+            return
+        rows = self._dump_rows()
+        while True:
+            chunk = list(itertools.islice(rows, 4096))
+            if not chunk:
+                break
+            file.write(newline.join(chunk) + newline)
+        file.write(EVENT_SETTINGS_SEP + (self.settings or newline))
+
+    # Define Constructor to Build a Record from the Channel Samples
+    @classmethod
+    def from_channels(cls, analogs: dict, statuses: dict = None,
+                      trigger_time: dt.datetime = None, trigger_row: int = 0,
+                      frequency: float = 60.0, samples_per_cycle: int = 4,
+                      fid: str = "pycev", header: dict = None,
+                      settings: str = '', **kwargs):
+        """
+        *Build a record from the channel samples*.
+
+        Use this method to form a record from arrays of samples, such as
+        to generate synthetic records. The record may then be written as
+        a CEV with `dump` or `dumps`.
+
+        Parameters
+        ----------
+        analogs:            dict
+                            Map of each analog channel name to its
+                            samples.
+        statuses:           dict, optional
+                            Map of each digital (status) channel name to
+                            its samples (each 0 or 1).
+        trigger_time:       datetime, optional
+                            Time of the trigger, default is the epoch.
+        trigger_row:        int, optional
+                            Index of the sample at the trigger, default
+                            is 0.
+        frequency:          float, optional
+                            Nominal system frequency, default is 60.0.
+        samples_per_cycle:  int, optional
+                            Number of analog and digital samples per
+                            cycle, default is 4.
+        fid:                str, optional
+                            Relay firmware identification string, without
+                            the 'FID=' specifier, default is 'pycev'.
+        header:             dict, optional
+                            Additional header information, such as
+                            'EVENT' or 'TARGETS'.
+        settings:           str, optional
+                            Relay settings, as they should follow the
+                            settings separator (each row with its
+                            checksum).
+        **kwargs:           dict, optional
+                            Additional optional parameters, as accepted
+                            by `Cev` (such as `backend`).
+
+        Returns
+        -------
+        record:     Cev
+                    The record.
+
+        Examples
+        --------
+        >>> from pycev import CEV
+        >>> record = CEV.from_channels(
+        ...     analogs={"IA": [0.0, 100.0, 0.0, -100.0]},
+        ...     statuses={"TRIP": [0, 0, 1, 1]},
+        ... )
+        >>> record.dump("./synthetic-report.cev")
+        """
+        # pylint: disable=protected-access
+        statuses = statuses or {}
+        if trigger_time is None:
+            trigger_time = dt.datetime(1970, 1, 1)
+        lengths = {len(samples) for samples in analogs.values()} | {
+            len(samples) for samples in statuses.values()
+        }
+        if len(lengths) > 1:
+            raise ValueError(
+                "Every channel must have an equal number of samples"
             )
-        # Return the Validity Signal
-        return len(invalid_lines) == 0
+        sample_count = lengths.pop() if lengths else 0
+        # Form the Header Rows, then Interpret them as if they were Read
+        groups = [
+            {"FID": f"FID={fid}"},
+            {
+                "MONTH": trigger_time.month, "DAY": trigger_time.day,
+                "YEAR": trigger_time.year, "HOUR": trigger_time.hour,
+                "MIN": trigger_time.minute, "SEC": trigger_time.second,
+                "MSEC": trigger_time.microsecond // 1000,
+            },
+            {
+                FREQUENCY_KEY: float(frequency),
+                ANALOG_SAMPLES: samples_per_cycle,
+                DIGITAL_SAMPLES: samples_per_cycle,
+                "NUM_OF_CYC": sample_count // samples_per_cycle,
+                **(header or {}),
+            },
+        ]
+        record = cls(**kwargs)
+        for group in groups:
+            record.record_lines.append(",".join(f'"{key}"' for key in group))
+            record.record_lines.append(",".join(
+                f'"{value}"' if isinstance(value, str) else str(value)
+                for value in group.values()
+            ))
+        stride = -(-len(statuses) // 8)
+        record.record_lines.append(cls._format_channel_heading(
+            analogs, statuses, range(len(statuses)), stride
+        ))
+        record._parse_header(record.record_lines)
+        record._parse_channel_heading(record.record_lines[-1])
 
-    # Define Internal Test to Identify Header
-    def _is_header(self, row_data):
-        """Test Function to Evaluate Whether Row is Header."""
-        if row_data.startswith('"') and row_data.endswith('"'):
-            return True
+        # Store the Samples, Packing the Digitals Most-Significant First
+        if record.backend == BACKEND_NUMPY:
+            record.analog_channels = np.array(
+                [samples for samples in analogs.values()], dtype=float
+            ).reshape(len(analogs), sample_count)
+            bits = np.zeros((sample_count, stride * 8), dtype=np.uint8)
+            for bit, samples in enumerate(statuses.values()):
+                bits[:, bit] = samples
+            record._status_packed = np.packbits(bits, axis=1)
         else:
-            return False
+            record.analog_channels = [
+                [float(value) for value in samples]
+                for samples in analogs.values()
+            ]
+            packed = bytearray(sample_count * stride)
+            for bit, samples in enumerate(statuses.values()):
+                byte_index, mask = bit // 8, 0x80 >> (bit % 8)
+                for i, value in enumerate(samples):
+                    if value:
+                        packed[i * stride + byte_index] |= mask
+            record._status_packed = bytes(packed)
+        record.status_channels = PackedStatusChannels(record)
+        record._status_stride = stride
+        record._sample_count = sample_count
+        record._trig_row = trigger_row
+        record.settings = settings
+        record._known_invalid_lines = set()  # Every Row is Formed Validly
+        record._eval_trigger_time()
+        record._eval_frequency()
+        record._clean_fid()
+        record._eval_samples_per_cycle()
+        record._eval_timestamps()
+        return record
 
-    # Define Internal Test to Identify Data Row
-    def _is_data(self, row_data):
-        """Test Function to Evaluate Whether Row isn't Header."""
-        return not self._is_header(row_data=row_data)
 
-    # Define Primary Parsing Function
-    def _parse_record(self):
-        """Primary Parsing Function to Interpret the CEV."""
-        # Operate on "Row-Pairs" with two Rows at Once to Pair Key with Value
-        # Start with Row-Index-Zero (first row), and Assuming Header
-        iRow = 0
-        # Only Validate the First Row, Since Second Row Should Contain FID
-        header = self._is_header(self.record_lines[iRow])
+# Alias the Class: `Cev` to `CEV` for Convenience
+CEV = Cev
 
-        # Manage the Initial Record Data
-        while header:
-            # Clean and Split the Heading and Content
-            heading_row = self.record_lines[iRow].replace('"', '').split(',')
-            content_row = self.record_lines[iRow + 1]
-            content_row = content_row.replace('"', '').split(',')
-            if not len(heading_row) == len(content_row):
-                print(heading_row)
-                print(content_row)
-                raise MalformedHeadingDataMismatch(
-                    "CEV may be malformed, heading and data length don't match"
+
+# Define Compact Record, Holding Only the Parsed Channels
+class CompactCev(_RecordAccessors):
+    """
+    Compact, Parsed SEL CEV Record.
+
+    Memory-lean form of a parsed `Cev` which holds only the parsed
+    channels, timestamps, and header information in fixed slots; the
+    raw text of the record is not retained, and no per-instance
+    dictionary is allocated. The channel accessors (`get_analog`,
+    `get_status`, `window`, `cycles`, and their aliases) behave exactly
+    as those of `Cev`. Suited to holding many records in memory at once,
+    such as those returned by `load_many`.
+
+    Parameters
+    ----------
+    record:         Cev
+                    The parsed record whose channels should be held.
+    keep_settings:  bool, optional
+                    Control to retain the relay settings text of the
+                    record, default is True.
+
+    Attributes
+    ----------
+    properties:     dict
+                    Map of each header key (such as 'FID' or 'EVENT') to
+                    its value. Keys which are valid attribute names may
+                    also be accessed as lowercase attributes, as with
+                    `Cev`.
+    validity:       bool
+                    True when every row of the record passed checksum
+                    validation; None when the checksums were not
+                    evaluated.
+
+    See Also
+    --------
+    Cev.compact     : Form the compact record of a parsed record.
+
+    Examples
+    --------
+    >>> from pycev import CEV
+    >>> record = CEV(file="./event-report.cev").compact()
+    >>> print("Trigger time = {}s".format(record.trigger_time))
+    """
+
+    __slots__ = (
+        "analog_channels", "analog_channel_ids", "analog_count",
+        "status_channels", "status_channel_ids", "status_count",
+        "channels_count", "time", "digital_time", "trigger_time",
+        "frequency", "fid", "raw_fid", "settings", "settings_map",
+        "properties", "validation", "backend", "_analog_index",
+        "_status_index", "_status_bits", "_status_packed", "_status_stride",
+        "_sample_count", "_trig_row", "_analog_samp_period",
+        "_digital_samp_period", "_settings_digest",
+    )
+
+    def __init__(self, record: Cev, keep_settings: bool = True):
+        """Copy the Parsed Channels and Header Information of the Record."""
+        # Evaluate Any Deferred Checksums while the Record is Available
+        if record.checksum_mode != CHECKSUM_OFF:
+            _ = record.validity
+        self.analog_channels = record.analog_channels
+        self.analog_channel_ids = record.analog_channel_ids
+        self.analog_count = record.analog_count
+        self.status_channel_ids = record.status_channel_ids
+        self.status_count = record.status_count
+        self.channels_count = record.channels_count
+        self.time = record.time
+        self.digital_time = record.digital_time
+        self.trigger_time = record.trigger_time
+        self.frequency = record.frequency
+        self.fid = record.fid
+        self.raw_fid = record.raw_fid
+        self.settings = record.settings if keep_settings else ''
+        self.settings_map = RelaySettings(self.settings)
+        self._settings_digest = record._settings_digest
+        self.properties = dict(record._properties)
+        self.validation = record.validation
+        self.backend = record.backend
+        self._analog_index = record._analog_index
+        self._status_index = record._status_index
+        self._status_bits = record._status_bits
+        self._status_packed = record._status_packed
+        self._status_stride = record._status_stride
+        self._sample_count = record._sample_count
+        self._trig_row = record._trig_row
+        self._analog_samp_period = record._analog_samp_period
+        self._digital_samp_period = record._digital_samp_period
+        self.status_channels = PackedStatusChannels(self)
+
+    def __getattr__(self, name):
+        """Present the Header Values as Lowercase Attributes."""
+        if not name.startswith('_'):
+            try:
+                properties = object.__getattribute__(self, "properties")
+            except AttributeError:
+                properties = {}
+            for key, value in properties.items():
+                if key.lower() == name and '/' not in key and '(' not in key:
+                    return value
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def __repr__(self):
+        """Describe the Record."""
+        return (
+            f"CompactCev(fid={self.fid!r}, trigger_time="
+            f"{self.trigger_time!r}, analog_count={self.analog_count!r}, "
+            f"status_count={self.status_count!r}, "
+            f"sample_count={self._sample_count!r})"
+        )
+
+    @property
+    def validity(self):
+        """Record checksum validity, None when not evaluated."""
+        if self.validation.invalid_lines is None:
+            return None
+        return len(self.validation.invalid_lines) == 0
+
+
+# Define Push-Style Parser for Data Streamed from a Relay
+class CevStreamParser():
+    """
+    Incremental SEL CEV Stream Parser.
+
+    This class serves to parse a CEV record as it arrives in pieces,
+    such as while an event is downloaded from a relay over a slow serial
+    connection. Each chunk provided to `feed` is split into rows, its
+    checksums are validated, and its sample rows are decoded, so that
+    transfer and parsing overlap and the full text of the record is
+    never held in memory. When the 'deferred' checksum mode is used, the
+    rows are instead retained, and validated together by `close`. The
+    header information (such as `fid` and `trigger_time`) is available
+    from `record` as soon as the channel heading row has been received,
+    and `close` returns the completed `Cev`.
+
+    The completed `Cev` retains only the header rows in `record_lines`,
+    and its `data` and `record` attributes are empty; the relay settings
+    are retained in `settings`.
+
+    Parameters
+    ----------
+    encoding:   str, optional
+                Encoding used to decode chunks provided as bytes,
+                default is 'utf-8'.
+    **kwargs:   dict, optional
+                Additional optional parameters, as accepted by `Cev`
+                (such as `backend`, `checksum`, `analogs`, or
+                `digitals`).
+
+    Examples
+    --------
+    >>> from pycev import CevStreamParser
+    >>> parser = CevStreamParser()
+    >>> for chunk in connection:
+    ...     parser.feed(chunk)
+    ...     if parser.heading_received:
+    ...         print(parser.record.trigger_time)
+    >>> record = parser.close()
+    """
+
+    # pylint: disable=protected-access
+
+    def __init__(self, encoding: str = None, **kwargs):
+        """Prepare the Stream Parser."""
+        self.record = Cev(**kwargs)
+        self.heading_received = False
+        self._decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(
+            self.record._decode_opt
+        )
+        self._buffer = ''  # Incomplete Row Awaiting More Data
+        self._line_count = 0  # Number of Record Rows Received
+        self._header_lines = []
+        self._data_rows = 0  # Number of Consecutive Data Rows Received
+        self._in_settings = False
+        self._settings_parts = []
+        self._invalid_lines = set()
+        self._unvalidated = []  # Rows Awaiting Deferred Validation
+        self._blocks = []  # Decoded Sample Blocks
+        self._sample_count = 0
+        self._trig_row = None
+        self._closed = False
+
+    def feed(self, chunk: Union[str, bytes]):
+        """
+        *Provide the next chunk of the CEV data*.
+
+        Parameters
+        ----------
+        chunk:      [str, bytes]
+                    The next portion of the CEV data, of any length.
+
+        Raises
+        ------
+        MalformedChecksumFailure
+            If the 'strict' checksum mode is used, and any row of the
+            record fails checksum validation.
+        """
+        if self._closed:
+            raise ValueError("Cannot feed data to a closed CevStreamParser.")
+        if isinstance(chunk, bytes):
+            chunk = self._decoder.decode(chunk)
+        if self._in_settings:
+            self._settings_parts.append(chunk)
+            return
+        lines = (self._buffer + chunk).split('\n')
+        self._buffer = lines.pop()  # Retain the Incomplete Row
+        self._process_lines(lines)
+
+    def close(self):
+        """
+        *Complete parsing, and return the record*.
+
+        Returns
+        -------
+        record:     Cev
+                    The completed record.
+
+        Raises
+        ------
+        MalformedNoFIDFound
+            If no header information was received.
+        MalformedChecksumFailure
+            If the 'strict' checksum mode is used, and any row of the
+            record fails checksum validation.
+
+        Warns
+        -----
+        MalformedChecksumFailure
+            If any of the CEV line-wise checksums do not evaluate
+            successfully.
+        """
+        if self._closed:
+            return self.record
+        tail = self._buffer + self._decoder.decode(b'', final=True)
+        self._buffer = ''
+        if self._in_settings:
+            self._settings_parts.append(tail)
+        else:
+            self._process_lines([tail])
+        if not self.heading_received:
+            if not self._header_lines:
+                raise MalformedNoFIDFound("No CEV data was received")
+            self._parse_heading()
+        self._decode_pending()
+        self._closed = True
+        record = self.record
+        # Assemble the Decoded Sample Blocks
+        if record.backend == BACKEND_NUMPY:
+            record.analog_channels = np.concatenate(
+                [block.analogs for block in self._blocks], axis=1
+            ) if self._blocks else np.empty((record.analog_count, 0))
+            record._status_packed = np.concatenate(
+                [block.status for block in self._blocks], axis=0
+            ) if self._blocks else None
+        else:
+            record.analog_channels = [[] for _ in range(record.analog_count)]
+            status = bytearray()
+            for block in self._blocks:
+                for channel, samples in zip(record.analog_channels,
+                                            block.analogs):
+                    channel.extend(samples)
+                status.extend(block.status)
+            record._status_packed = bytes(status)
+        if self._blocks:
+            record._status_stride = self._blocks[0].status_stride
+        else:
+            record._size_empty_status()
+        self._blocks = []
+        record.status_channels = PackedStatusChannels(record)
+        record._sample_count = self._sample_count
+        record._trig_row = self._trig_row or 0
+        record._check_samples(trigger_found=self._trig_row is not None)
+        record.settings = ''.join(self._settings_parts)
+        record._eval_timestamps()
+        # Report Checksum Failures
+        if record.checksum_mode == CHECKSUM_DEFERRED:
+            # Validate the Retained Rows Together, Reporting on Access
+            self._invalid_lines = validate_record_checksums(
+                '\n'.join(self._unvalidated)
+            )
+            self._unvalidated = []
+        if record.checksum_mode != CHECKSUM_OFF:
+            record._known_invalid_lines = self._invalid_lines
+            if record.checksum_mode != CHECKSUM_DEFERRED:
+                record._validate_checksums()
+        record._release_raw()
+        record._share_settings()
+        return record
+
+    def _process_lines(self, lines):
+        """Validate, then Interpret Each Complete Row of the Record."""
+        for i, line in enumerate(lines):
+            if line.startswith(EVENT_SETTINGS_SEP):
+                # Retain All Remaining Data as Relay Settings
+                self._settings_parts.append('\n'.join(
+                    [line[len(EVENT_SETTINGS_SEP):]] + lines[i + 1:] +
+                    [self._buffer]
+                ))
+                self._buffer = ''
+                self._in_settings = True
+                lines = lines[:i]
+                break
+        # Evaluate the Checksums of the Complete Rows Together
+        if self.record.checksum_mode == CHECKSUM_DEFERRED:
+            self._unvalidated.extend(lines)  # Validated Once Closed
+        elif self.record.checksum_mode != CHECKSUM_OFF:
+            invalid = validate_record_checksums('\n'.join(lines))
+            invalid = {number + self._line_count for number in invalid}
+            if invalid and self.record.checksum_mode == CHECKSUM_STRICT:
+                raise MalformedChecksumFailure(
+                    "Record data appears to be malformed, and fails checksum "
+                    f"validation for line: {min(invalid)}"
                 )
-            # Load the Data into Class Keys
-            for key, value in zip(heading_row, content_row):
-                # Verify Attribute and Load
-                key_lower = key.lower()
-                if key_lower in self._keys():
-                    if callable(self.__dict__[key_lower]):
-                        continue  # Don't Overwrite a Callable!
-                if (key.find('/') == -1) and (key.find('(') == -1):
-                    # Valid Class Variable Name, Load Directly
-                    self.__dict__[key_lower] = value
-                # Store the Data as a Property
-                self._properties[key] = value
+            self._invalid_lines.update(invalid)
+        self._line_count += len(lines)
+        # Interpret the Rows
+        for line in lines:
+            line = line.replace('\r', '')
+            if line == '' or line == ' ':
+                continue
+            content = _strip_checksum(line)
+            self._header_lines.append(content)
+            if not self.heading_received:
+                # Only the Sample Rows Follow One Another without a Header
+                if self.record._is_data(content):
+                    self._data_rows += 1
+                else:
+                    self._data_rows = 0
+                if self._data_rows == 2:
+                    self._parse_heading()
+        if self.heading_received:
+            self._decode_pending()
 
-            # Check Next Group
-            header = (
-                self._is_header(self.record_lines[iRow + 2]) and
-                self._is_data(self.record_lines[iRow + 3]) and
-                self._is_header(self.record_lines[iRow + 4])
+    def _parse_heading(self):
+        """Interpret the Header Information and Channel Heading."""
+        record = self.record
+        iRow = record._parse_header(self._header_lines)
+        record._parse_channel_heading(self._header_lines[iRow])
+        record._eval_trigger_time()
+        record._eval_frequency()
+        record._clean_fid()
+        record._eval_samples_per_cycle()
+        record.record_lines = self._header_lines[:iRow + 1]
+        # Any Remaining Rows are Samples Awaiting Decoding
+        self._header_lines = self._header_lines[iRow + 1:]
+        self.heading_received = True
+
+    def _decode_pending(self):
+        """Decode the Sample Rows Received Since the Last Decode."""
+        if not self._header_lines:
+            return
+        record = self.record
+        block = decode_data_block(
+            self._header_lines,
+            analog_count=record._analog_column_count,
+            use_numpy=(record.backend == BACKEND_NUMPY),
+            analog_columns=record._analog_columns,
+            status_columns=record._status_columns,
+        )
+        if self._trig_row is None and block.trigger_row is not None:
+            self._trig_row = self._sample_count + block.trigger_row
+        self._sample_count += len(self._header_lines)
+        self._blocks.append(block)
+        self._header_lines = []
+
+
+# Define Reusable Parser, Sharing the Channel Layout of Each Relay
+class CevParser():
+    """
+    Reusable SEL CEV Parser.
+
+    Records from the same relay model and firmware share the same
+    channel heading row, so the layout of their columns (the analog
+    channel names, the packed bit position of each status channel, and
+    the ignored columns) need only be resolved once. This class caches
+    each resolved `ChannelLayout`, keyed by the relay FID and the text
+    of the channel heading, so that the second and later records from a
+    relay proceed directly from the header to decoding the samples.
+
+    The cache is shared by every record parsed with `parse`, or by any
+    `Cev` (or `CevStreamParser`, or `load_many` when loading serially)
+    given this parser with the `parser` option. Records parsed in
+    worker processes each use a copy of the cache.
+
+    Parameters
+    ----------
+    max_layouts:    int, optional
+                    Maximum number of layouts cached; the earliest cached
+                    layout is discarded beyond this number, default
+                    is 256.
+    **kwargs:       dict, optional
+                    Additional optional parameters, as accepted by `Cev`,
+                    used for every record parsed with `parse`.
+
+    Attributes
+    ----------
+    hits:       int
+                Number of channel headings whose layout was cached.
+    misses:     int
+                Number of channel headings which were resolved.
+
+    Examples
+    --------
+    >>> from pycev import CevParser
+    >>> parser = CevParser(backend="numpy")
+    >>> records = [parser.parse(path) for path in paths]
+    >>> print(parser.hits, parser.misses)
+    """
+
+    def __init__(self, max_layouts: int = 256, **kwargs):
+        """Prepare the Parser."""
+        if "parser" in kwargs:
+            raise ValueError(
+                "CevParser cannot be given a 'parser' option; records are "
+                "always parsed with the CevParser itself."
             )
-            # Increment Row Index
-            iRow += 2
+        self.max_layouts = max_layouts
+        self.options = kwargs
+        self.hits = 0
+        self.misses = 0
+        self._layouts = {}
 
-        # Following the Primary Header Content, a Single Header Remains
-        # with the Analog and Digital Channel Names.
-        # Split on either a comma (',') or a space (' ')
-        channels = re.split(r',| ', self.record_lines[iRow])
-        is_analog = True  # First Channel from Left is Analog
-
-        # Identify Channel Names as Analog or Digital
-        for i, channel in enumerate(channels):
-            # Check if Trig Channel
-            if '"TRIG"' == channel:
-                is_analog = False
-                self._ignored_channels.append(i)
-                self._trig_column = i
-                continue  # Don't Track the TRIP Channel
-            elif '*' == channel:
-                self._ignored_channels.append(i)
-                continue  # Don't Track Unused Channels
-            elif '' == channel:
-                continue  # Don't Track Empty Channel Names
-            # Remove Double Quotes
-            channel = channel.replace('"', '')
-            # Channel Must be Valid, Append Name to Either Analog or Digital
-            if is_analog:
-                self.analog_channel_ids.append(channel)
-            else:
-                self.status_channel_ids.append(channel)
+    def __len__(self):
+        """Return the Number of Cached Layouts."""
+        return len(self._layouts)
 
-        iRow += 1  # Increment Past the Data Heading Column
+    def channel_layout(self, fid: str, heading: str):
+        """
+        *Resolve the layout of a channel heading, from the cache if known*.
 
-        # Characterize Number of Channels
-        self.analog_count = len(self.analog_channel_ids)
-        self.status_count = len(self.status_channel_ids)
+        Parameters
+        ----------
+        fid:        str
+                    The relay firmware identification string.
+        heading:    str
+                    The channel heading row, without its checksum.
+
+        Returns
+        -------
+        layout:     ChannelLayout
+                    Namedtuple of the channel heading columns, of the form:
+                    ChannelLayout('analog_channel_ids':tuple,
+                    'status_channel_ids':tuple, 'status_bits':tuple,
+                    'ignored_channels':tuple, 'trig_column':int,
+                    'analog_index':dict, 'status_index':dict), where each
+                    index maps a channel name to its position; the
+                    layout is shared by every record with the heading,
+                    and should not be modified.
+        """
+        # The Heading Text is Hashed (and Compared) as Part of the Key
+        key = (fid, heading)
+        layout = self._layouts.get(key)
+        if layout is not None:
+            self.hits += 1
+            return layout
+        self.misses += 1
+        layout = _channel_layout(heading)
+        if len(self._layouts) >= self.max_layouts:
+            del self._layouts[next(iter(self._layouts))]
+        self._layouts[key] = layout
+        return layout
+
+    def clear(self):
+        """Discard the Cached Layouts."""
+        self._layouts.clear()
+
+    def parse(self, file: str = None, data: Union[str, bytes] = None,
+              **kwargs):
+        """
+        *Parse a CEV record, sharing the cached channel layouts*.
+
+        Parameters
+        ----------
+        file:       [str, file-like], optional
+                    Path of the CEV file, or an open file-like object.
+        data:       [str, bytes], optional
+                    The full contents of the CEV file.
+        **kwargs:   dict, optional
+                    Additional optional parameters, as accepted by `Cev`,
+                    overriding those of the parser.
+
+        Returns
+        -------
+        record:     Cev
+                    The parsed record.
+
+        Raises
+        ------
+        ValueError
+            If a `parser` option is given, since the record is always
+            parsed with this parser.
+        """
+        if "parser" in kwargs:
+            raise ValueError(
+                "CevParser.parse cannot be given a 'parser' option; the "
+                "record is always parsed with the CevParser itself."
+            )
+        return Cev(file=file, data=data, **dict(
+            self.options, parser=self, **kwargs
+        ))
+
+
+# Define Function to Load a Single File, Capturing Failures and Warnings
+def _load_result(path, kwargs):
+    """Load One CEV File, Capturing Any Exception and Warnings."""
+    record = None
+    error = None
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        try:
+            record = Cev(file=path, **kwargs)
+        except Exception as err:  # pylint: disable=broad-except
+            error = err
+    return LoadResult(
+        path=path,
+        record=record,
+        error=error,
+        warnings=[
+            warning.category(str(warning.message)) for warning in caught
+        ],
+    )
+
+
+# Define Function to Identify the CEV Files to Load
+def _expand_paths(paths):
+    """Expand Directories to the CEV Files they Contain."""
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    for path in paths:
+        path = os.fspath(path)
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for directory, _, files in sorted(os.walk(path)):
+            for file in sorted(files):
+                # Binary Records ('.cevb') are Not CEV Files
+                if os.path.splitext(file)[1].upper() == '.CEV':
+                    yield os.path.join(directory, file)
+
+
+# Define Function to Apply a Function to Many Files, Optionally in Parallel
+def _map_files(function, arguments, workers, ordered):
+    """Call the Function with Each Set of Arguments, Yielding Results."""
+    if not arguments:
+        return
+    if workers and workers > 1:
+        # Every File Shares the Same Options, so Check Only the First
+        try:
+            pickle.dumps((function, arguments[0]))
+        except (pickle.PicklingError, TypeError, AttributeError) as err:
+            _warn(
+                "Options cannot be sent to worker processes "
+                f"({err}), loading the files serially instead.",
+                SerialLoadFallback,
+            )
+            workers = None
+    if not workers or workers <= 1:
+        for args in arguments:
+            yield function(*args)
+        return
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        if ordered:
+            yield from pool.map(function, *zip(*arguments))
+            return
+        futures = [pool.submit(function, *args) for args in arguments]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+
+# Define Function to Load Many CEV Files in Parallel
+def load_many(paths, workers: int = None, ordered: bool = True, **kwargs):
+    """
+    Load many CEV files, optionally in parallel.
+
+    This function parses each of the CEV files in a pool of worker
+    processes, yielding the result for each file as it is available.
+    Failures to load a file (such as `MalformedHeadingDataMismatch` or
+    `MalformedNoFIDFound`) and any warnings (such as
+    `MalformedChecksumFailure`) are captured in the result for that file,
+    rather than aborting the batch. Each result is returned as a
+    namedtuple of the form:
+    LoadResult('path':str, 'record':Cev, 'error':Exception, 'warnings':list)
+
+    Parameters
+    ----------
+    paths:      [str, list of str]
+                Path(s) of the CEV files which should be loaded; any
+                directory is expanded to the CEV files within it.
+    workers:    int, optional
+                Number of worker processes used to parse the files,
+                default is to parse the files serially in this process;
+                options which cannot be pickled (such as a lambda
+                `profile_hook`) are warned of with `SerialLoadFallback`,
+                and the files are parsed serially instead.
+    ordered:    bool, optional
+                Control to yield the results in the order the paths
+                were provided; otherwise results are yielded in the order
+                they are completed, default is True.
+    **kwargs:   dict, optional
+                Additional optional parameters, as accepted by `Cev`;
+                a `settings_store` is shared by the records of every
+                worker, as each result is yielded.
+
+    Yields
+    ------
+    result:     namedtuple
+                The LoadResult for each file, where 'record' is the
+                loaded `Cev` (or None if the file failed to load),
+                'error' is the exception raised (or None), and
+                'warnings' is the list of warnings raised while loading.
+
+    See Also
+    --------
+    CevCollection   : Load many CEV files as a collection.
+
+    Examples
+    --------
+    >>> import pycev
+    >>> for result in pycev.load_many("./events", workers=4):
+    ...     if result.error is None:
+    ...         print(result.record.trigger_time)
+    """
+    paths = list(_expand_paths(paths))
+    # Share the Settings Here, as Each Worker Would Hold a Copy of the Store
+    store = kwargs.pop("settings_store", None)
+    for result in _map_files(
+        _load_result, [(path, kwargs) for path in paths], workers, ordered
+    ):
+        if store is not None and result.record is not None:
+            store.share(result.record)
+        yield result
+
+
+# Define Function to Convert a Single File, Capturing Failures and Warnings
+def _convert_result(path, basename, options, kwargs):
+    """Convert One CEV File to COMTRADE, Capturing Any Exception."""
+    files = None
+    error = None
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        try:
+            os.makedirs(os.path.dirname(basename) or '.', exist_ok=True)
+            files = Cev(file=path, **kwargs).to_comtrade(basename, **options)
+        except Exception as err:  # pylint: disable=broad-except
+            error = err
+    return ConvertResult(
+        path=path,
+        files=files,
+        error=error,
+        warnings=[
+            warning.category(str(warning.message)) for warning in caught
+        ],
+    )
+
+
+# Define Function to Convert Many CEV Files to COMTRADE in Parallel
+def convert_to_comtrade(paths, directory, workers: int = None,
+                        ordered: bool = True,
+                        data_format: str = COMTRADE_BINARY, **kwargs):
+    """
+    Convert many CEV files to COMTRADE records, optionally in parallel.
+
+    This function loads each of the CEV files, and writes it as a
+    COMTRADE record (see `Cev.to_comtrade`) in the `directory`, in a pool
+    of worker processes. The files are named as the CEV files were, and
+    the structure of the directories which were provided is retained.
+    Failures to convert a file are captured in the result for that file,
+    rather than aborting the batch. Each result is returned as a
+    namedtuple of the form:
+    ConvertResult('path':str, 'files':tuple, 'error':Exception,
+                  'warnings':list)
+
+    Parameters
+    ----------
+    paths:          [str, list of str]
+                    Path(s) of the CEV files which should be converted;
+                    any directory is expanded to the CEV files within it.
+    directory:      str
+                    Path of the directory in which the COMTRADE records
+                    should be written.
+    workers:        int, optional
+                    Number of worker processes used to convert the files,
+                    default is to convert the files serially in this
+                    process.
+    ordered:        bool, optional
+                    Control to yield the results in the order the paths
+                    were provided; otherwise results are yielded in the
+                    order they are completed, default is True.
+    data_format:    str, optional
+                    Name of the COMTRADE data format, one of 'ASCII',
+                    'BINARY' (default), or 'BINARY32'.
+    **kwargs:       dict, optional
+                    Additional optional parameters, as accepted by `Cev`.
+
+    Yields
+    ------
+    result:     namedtuple
+                The ConvertResult for each file, where 'files' are the
+                paths of the configuration and data files written (or
+                None if the file failed to convert), 'error' is the
+                exception raised (or None), and 'warnings' is the list of
+                warnings raised while converting.
+
+    See Also
+    --------
+    load_many   : Load many CEV files, optionally in parallel.
+
+    Examples
+    --------
+    >>> import pycev
+    >>> for result in pycev.convert_to_comtrade("./events", "./comtrade",
+    ...                                         workers=4):
+    ...     if result.error is not None:
+    ...         print(result.path, result.error)
+    """
+    paths = list(_expand_paths(paths))
+    if not paths:
+        return
+    # Name Each Record Relative to the Directories which Hold the Files
+    root = os.path.commonpath(
+        [os.path.dirname(os.path.abspath(path)) for path in paths]
+    )
+    arguments = [
+        (
+            path,
+            os.path.join(directory, os.path.splitext(
+                os.path.relpath(os.path.abspath(path), root)
+            )[0]),
+            {"data_format": data_format},
+            kwargs,
+        )
+        for path in paths
+    ]
+    yield from _map_files(_convert_result, arguments, workers, ordered)
+
+
+# Define Collection of Many CEV Records
+class CevCollection(Sequence):
+    """
+    Collection of Many SEL CEV Records.
+
+    This class serves to load a batch of CEV files (such as a directory
+    of event records) using `load_many`, and to present the records which
+    were loaded successfully as a sequence, in the order the paths were
+    provided. The files which failed to load are retained separately.
+
+    Parameters
+    ----------
+    paths:      [str, list of str]
+                Path(s) of the CEV files which should be loaded; any
+                directory is expanded to the CEV files within it.
+    workers:    int, optional
+                Number of worker processes used to parse the files,
+                default is to parse the files serially in this process.
+    **kwargs:   dict, optional
+                Additional optional parameters, as accepted by `Cev`.
+
+    Attributes
+    ----------
+    settings_store: SettingsStore
+                The store of the distinct relay settings of the records;
+                the `settings_store` provided, or otherwise a new store.
+    results:    list of LoadResult
+                The result of loading each of the files.
+    records:    list of Cev
+                The records which were loaded successfully.
+    failures:   list of LoadResult
+                The results for the files which failed to load.
+
+    Examples
+    --------
+    >>> from pycev import CevCollection
+    >>> events = CevCollection("./events", workers=4)
+    >>> for failure in events.failures:
+    ...     print(failure.path, failure.error)
+    >>> trigger_times = [record.trigger_time for record in events]
+    """
+
+    def __init__(self, paths, workers: int = None, **kwargs):
+        """Load the Collection."""
+        self.settings_store = kwargs.pop("settings_store", None)
+        if self.settings_store is None:
+            self.settings_store = SettingsStore()
+        self.results = list(load_many(
+            paths, workers=workers, settings_store=self.settings_store,
+            **kwargs
+        ))
+        self.records = [
+            result.record for result in self.results if result.error is None
+        ]
+        self.failures = [
+            result for result in self.results if result.error is not None
+        ]
+
+    def __len__(self):
+        """Return the Number of Records Loaded Successfully."""
+        return len(self.records)
+
+    def __getitem__(self, index):
+        """Return the Record(s) at the Index."""
+        return self.records[index]
+
+
+# Define Function to Form the Catalog Row of a File
+def _catalog_values(path, size, mtime_ns, record, error=None):
+    """Form the Catalog Row from the Header of the Record (or the Error)."""
+    # pylint: disable=protected-access
+    if record is None:
+        return (path, size, mtime_ns) + (None,) * 10 + (
+            f"{type(error).__name__}: {error}",
+        )
+    properties = record._properties
+    return (
+        path, size, mtime_ns, record.fid,
+        record.trigger_time.isoformat(sep=' ', timespec='microseconds'),
+        record.frequency,
+        properties.get(ANALOG_SAMPLES), properties.get(DIGITAL_SAMPLES),
+        properties.get("NUM_OF_CYC"), properties.get("EVENT"),
+        json.dumps(record.analog_channel_ids),
+        json.dumps(record.status_channel_ids),
+        None if record.validity is None else int(record.validity),
+        None,
+    )
+
+
+# Define Function to Scan a Single File for the Catalog
+def _catalog_row(path, size, mtime_ns, kwargs):
+    """Scan the Header of One CEV File, Forming its Catalog Row."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # Failures are Catalogued Instead
+        try:
+            record = Cev.scan(path, **kwargs)
+        except Exception as err:  # pylint: disable=broad-except
+            return _catalog_values(path, size, mtime_ns, None, err)
+    return _catalog_values(path, size, mtime_ns, record)
 
-        # Build the Channel Lists According to Sizes
-        self.analog_channels = [[] for x in range(self.analog_count)]
-        self.status_channels = [[] for x in range(self.status_count)]
-
-        # Iterate over Data Rows to Load Channels
-        numRows = len(self.record_lines)
-        initRow = iRow
-        while iRow < numRows:
-            channels = self.record_lines[iRow].split(',')
-            # Track Analog Quantities
-            k = 0
-            for i in range(0, self.analog_count):
-                value = float(channels[i])
-                # Verify that Channel Index Shouldn't be Ignored
-                if i not in self._ignored_channels:
-                    self.analog_channels[i].append(value)
-                k = i + 2
-
-            # Identify Trigger Data Row
-            if TRIGGER_KEY_CHAR in channels[k-1]:
-                self._trig_row = iRow - initRow
-
-            # Format the Digitals
-            digital_string = channels[k].replace('"', '')
-            digitals = []
-            # Iteratively Process the Hex String
-            while len(digital_string) > 0:
-                hex_byte = digital_string[:2]
-                digital_string = digital_string[2:]
-                # Identify the Bits
-                binary_byte = bin(int(hex_byte, base=16))
-                # Use zfill to pad the string with zeros as we want
-                # all 8 digits of the byte.
-                bits_string = binary_byte[2:].zfill(8)
-                digitals.extend([int(bit) for bit in bits_string])
-
-            # Track Digital Quantities
-            for i in range(0, self.status_count):
-                # Verify that Channel Index (Offset by the TRIG channel)
-                # Shouldn't be Ignored
-                if (i + self._trig_column) not in self._ignored_channels:
-                    self.status_channels[i].append(digitals[i])
-
-            iRow += 1  # Increment Row Index
 
-    # Define Event Trigger Time Evaluator
-    def _eval_trigger_time(self):
-        """Use Time Information to Identify Trigger Time."""
-        usec = int(self.msec) * 1000
-        self.trigger_time = dt.datetime(
-            year=int(self.year),
-            month=int(self.month),
-            day=int(self.day),
-            hour=int(self.hour),
-            minute=int(self.min),
-            second=int(self.sec),
-            microsecond=usec
+# Define Function to Ingest a Single File, Unless its Content is Unchanged
+def _ingest_result(path, content_hash, kwargs):
+    """Hash One CEV File, and Load it Only if its Content has Changed."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as file_obj:
+            for block in iter(lambda: file_obj.read(1 << 20), b''):
+                digest.update(block)
+    except OSError as err:
+        return path, content_hash, LoadResult(
+            path=path, record=None, error=err, warnings=[]
         )
+    if digest.hexdigest() == content_hash:
+        return path, content_hash, None  # Only the File Status has Changed
+    return path, digest.hexdigest(), _load_result(path, kwargs)
 
-    # Define Frequency Identifier
-    def _eval_frequency(self):
-        """Identify and load the system nominal frequency."""
-        self.frequency = float(self._properties.get(FREQUENCY_KEY, 60.0))
 
-    # Define FID Cleaner
-    def _clean_fid(self):
-        """Store the 'raw' FID in a New Variable, and Clean Existing FID."""
-        try:
-            self.raw_fid = self.fid
-            self.fid = self.fid.split('=')[1]
-        except Exception as err:
-            raise MalformedNoFIDFound(
-                "Failed to load relay FID from CEV"
-            ) from err
+# Define Entry of the Catalog, Loading its Record Lazily
+class CatalogEntry():
+    """
+    Catalogued CEV File.
 
-    # Define Samples-Per-Cycle Evaluator
-    def _eval_samples_per_cycle(self):
-        """Identify the Samples/Cycle Indicators, Calculate the Deltas."""
-        try:
-            # Extract the Number of Samples per Cycle, Evaluate Milliseconds
-            ms_per_cyc = 1000 / self.frequency
-            analog_ms = ms_per_cyc / float(self._properties[ANALOG_SAMPLES])
-            digital_ms = ms_per_cyc / float(self._properties[DIGITAL_SAMPLES])
-        except KeyError as err:
-            raise MalformedNoSampleNumberFound(
-                "Failed to identify number of samples per cycle"
-            ) from err
-        # Prepare the TimeDeltas
-        self._analog_samp_timedelta = dt.timedelta(milliseconds=analog_ms)
-        self._digital_samp_timedelta = dt.timedelta(milliseconds=digital_ms)
+    The header information of a CEV file as indexed by a `Catalog`; the
+    file itself is loaded only when `record` is first accessed.
 
-    # Define Timestamp Loader
-    def _eval_timestamps(self):
-        """Evaluate event timestamps."""
-        # Calculate the first timestamp
-        initTimeDelta = self._analog_samp_timedelta * self._trig_row
-        self.time = [self.trigger_time - initTimeDelta]
-        # Iteratively Calculate Remaining Timestamps
-        for _ in range(1, len(self.analog_channels[0])):
-            # Add Timedelta to Most Recent Time Value
-            self.time.append(self.time[-1] + self._analog_samp_timedelta)
+    Attributes
+    ----------
+    path:                   str
+                            Path of the CEV file.
+    size:                   int
+                            Size of the file (in bytes) when catalogued.
+    mtime_ns:               int
+                            Modification time of the file (in nanoseconds)
+                            when catalogued.
+    fid:                    str
+                            Relay firmware identification string.
+    trigger_time:           datetime
+                            Trigger time of the event.
+    frequency:              float
+                            Nominal frequency of the record.
+    analog_samples:         str
+                            Analog samples per cycle ('SAM/CYC_A').
+    digital_samples:        str
+                            Digital samples per cycle ('SAM/CYC_D').
+    cycles:                 str
+                            Number of cycles recorded ('NUM_OF_CYC').
+    event:                  str
+                            The event type ('EVENT').
+    analog_channel_ids:     list of str
+                            Names of the analog channels.
+    status_channel_ids:     list of str
+                            Names of the status (digital) channels.
+    validity:               bool
+                            Checksum validity of the header rows which were
+                            scanned; None when checksums were not evaluated.
+    """
 
-    # Define File Loader Method
-    def load(self, file: str, encoding: str = None):
-        """
-        *CEV File Loader Method*.
+    def __init__(self, row, options):
+        """Prepare the Entry from its Catalog Row."""
+        (self.path, self.size, self.mtime_ns, self.fid, trigger_time,
+         self.frequency, self.analog_samples, self.digital_samples,
+         self.cycles, self.event, analog_channel_ids, status_channel_ids,
+         validity) = row
+        self.trigger_time = dt.datetime.fromisoformat(trigger_time)
+        self.analog_channel_ids = json.loads(analog_channel_ids)
+        self.status_channel_ids = json.loads(status_channel_ids)
+        self.validity = None if validity is None else bool(validity)
+        self._options = options
+        self._record = None
 
-        Use this method to load a CEV file, and parse its contents into the
-        valuable class attributes and structure.
+    def __repr__(self):
+        """Describe the Entry."""
+        return (
+            f"CatalogEntry(path={self.path!r}, fid={self.fid!r}, "
+            f"trigger_time={self.trigger_time!r})"
+        )
 
-        Parameters
-        ----------
-        file:       str
-                    String describing the relative or fully qualified path to
-                    the CEV file that should be read. Optionally used during
-                    class initialization, may also be loaded using the `load`
-                    method.
-        encoding:   str, optional
-                    String specifying the encoding format (if required) in
-                    which the file is stored. This may be used for files of
-                    format 'utf-8', for example.
+    @property
+    def record(self):
+        """The Record, Loaded from the File upon First Access."""
+        if self._record is None:
+            self._record = Cev(file=self.path, **self._options)
+        return self._record
 
-        See Also
-        --------
-        load_data       : Load data which has already been read from a file,
-                          or is presented as a stream.
 
-        Raises
-        ------
-        FileNotFoundError
-            If the file cannot be located on the system
-        MalformedHeadingDataMismatch
-            If the file contains a header and content row pair which do not
-            share an equal number of columns.
+# Define SQLite Catalog of the Header Information of Many CEV Files
+class Catalog():
+    """
+    SQLite Catalog of CEV Files.
 
-        Warns
-        -----
-        UnexpectedFileExtension
-            If the uppercase-cast file extension is not ".CEV"
-        MalformedChecksumFailure
-            If any of the CEV line-wise checksums do not evaluate successfully
+    This class serves to maintain a local SQLite index of the header
+    information of an archive of CEV files (such as the trigger time,
+    FID, frequency, sample rates, channel names, and checksum status),
+    so that the archive may be searched without parsing every file.
+    Files are catalogued with `Cev.scan`, reading only their header
+    rows, and `update` re-scans only the files whose size or
+    modification time have changed since they were catalogued. The
+    entries found by `query` load their full record only upon access.
+    Alternatively, `ingest` loads (and catalogues) only the files which
+    are new or changed since they were last ingested, such as when
+    polling the folders into which relays deliver their events.
 
-        Examples
-        --------
-        >>> from pycev import CEV
-        >>> # Load a file and parse, directly.
-        >>> record = CEV() # Create the parser instance
-        >>> record.load(file="./event-report.cev")
-        >>> print("Trigger time = {}s".format(record.trigger_time))
-        """
-        # Switch between Handling File-Path, or File-Like-Object
-        if isinstance(file, str):
-            # Validate file Extension
-            self._validate_extension(file)
-            # Read File with Encoding
-            with open(file, 'r', encoding=encoding) as file_obj:
-                self.data = file_obj.read()  # Gather ALL Data From File
-        elif hasattr(file, "read"):
-            self.data = file.read()
-        # Process the Data and Load Record
-        self.load_data(data=None)
+    Parameters
+    ----------
+    database:   str, optional
+                Path of the SQLite database file, created if required,
+                default is ':memory:' to hold the catalog in memory.
+    **kwargs:   dict, optional
+                Additional optional parameters, as accepted by `Cev`,
+                used to scan the files and to load the records.
 
-    # Define Data Loader Method
-    def load_data(self, data: Union[str, bytes], encoding: str = None):
-        """
-        *CEV Data Loader Method*.
+    Examples
+    --------
+    >>> import datetime as dt
+    >>> from pycev import Catalog
+    >>> with Catalog("./events.sqlite") as catalog:
+    ...     catalog.update("./events", workers=4)
+    ...     for entry in catalog.query(
+    ...         start=dt.datetime(2023, 1, 1), end=dt.datetime(2023, 2, 1),
+    ...         fid="SEL-351S-7-R514-V0-Z103103-D20140408",
+    ...     ):
+    ...         print(entry.path, entry.record.frequency)
+    """
 
-        Use this method to load the data from a CEV file which has already been
-        read, or data which is being streamed to the class (i.e., an active
-        connection to a relay). This method will parse the data and load the
-        class attributes and structures appropriately.
+    _SCHEMA_VERSION = 1
+    _COLUMNS = (
+        "path", "size", "mtime_ns", "fid", "trigger_time", "frequency",
+        "analog_samples", "digital_samples", "cycles", "event",
+        "analog_channel_ids", "status_channel_ids", "validity", "error",
+    )
 
-        Parameters
-        ----------
-        data:       [str, bytes]
-                    String of the full file content.
-        encoding:   str, optional
-                    String specifying the encoding format (if required) in
-                    which the file is stored. This may be used for files of
-                    format 'utf-8', for example.
+    def __init__(self, database: str = ":memory:", **kwargs):
+        """Open (or Create) the Catalog."""
+        self.database = os.fspath(database)
+        self._options = kwargs
+        self._connection = sqlite3.connect(self.database)
+        version = self._connection.execute("PRAGMA user_version").fetchone()
+        if version[0] not in (0, self._SCHEMA_VERSION):
+            self._connection.close()
+            raise ValueError(
+                f"Catalog {self.database!r} has an unsupported schema "
+                f"version {version[0]}"
+            )
+        with self._connection:
+            self._connection.executescript(f"""
+                CREATE TABLE IF NOT EXISTS records (
+                    path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER,
+                    fid TEXT, trigger_time TEXT, frequency REAL,
+                    analog_samples TEXT, digital_samples TEXT, cycles TEXT,
+                    event TEXT, analog_channel_ids TEXT,
+                    status_channel_ids TEXT, validity INTEGER, error TEXT
+                );
+                CREATE INDEX IF NOT EXISTS records_trigger_time
+                    ON records (trigger_time);
+                CREATE INDEX IF NOT EXISTS records_fid
+                    ON records (fid, trigger_time);
+                CREATE TABLE IF NOT EXISTS ingested (
+                    path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER,
+                    content_hash TEXT
+                );
+                PRAGMA user_version = {self._SCHEMA_VERSION};
+            """)
 
-        See Also
-        --------
-        load            : Load data from a CEV file.
+    def __enter__(self):
+        """Use the Catalog as a Context Manager."""
+        return self
 
-        Raises
-        ------
-        MalformedHeadingDataMismatch
-            If the file contains a header and content row pair which do not
-            share an equal number of columns.
+    def __exit__(self, *exc_info):
+        """Close the Catalog."""
+        self.close()
 
-        Warns
-        -----
-        MalformedChecksumFailure
-            If any of the CEV line-wise checksums do not evaluate successfully
+    def __len__(self):
+        """Return the Number of Files Catalogued."""
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM records"
+        ).fetchone()[0]
 
-        Examples
-        --------
-        >>> from pycev import CEV
-        >>> # Load a file and parse, directly.
-        >>> record = CEV() # Create the parser instance
-        >>> with open("./event-report.cev", 'r') as file:
-        ...     data = file.read()
-        >>> record.load_data(data=data)
-        >>> print("Trigger time = {}s".format(record.trigger_time))
-        """
-        # Method is Called Internally with `data=None`
-        # Don't Try Loading in this Case
-        if data is not None:
-            # Decode Data As Needed
-            self.data = self._decode(data, encoding=encoding)
-        # Prepare Record Information
-        self._prepare_and_validate_record()
-        # Parse the Record
-        self._parse_record()
-        # Determine the Trigger Time
-        self._eval_trigger_time()
-        # Identify Nominal System Frequency
-        self._eval_frequency()
-        # Clean FID
-        self._clean_fid()
-        # Rationalize Number of Samples per Cycle
-        self._eval_samples_per_cycle()
-        # Evaluate the Timestamps
-        self._eval_timestamps()
+    def close(self):
+        """Close the Catalog Database."""
+        self._connection.close()
 
-    # Define Method to Access the Analog Channel by Name
-    def get_analog(self, channel_name: str):
+    def update(self, paths, workers: int = None):
         """
-        *Extract an analog channel by name*.
+        *Catalog new or changed CEV files*.
 
-        Use this method to return the list of analog values
-        associated with the particular analog channel with
-        the specified name.
+        Each file whose path, size, and modification time match its
+        existing entry is skipped; every other file is scanned and
+        (re-)catalogued. Files which fail to scan are catalogued with
+        their error (see `failures`), so they are not re-scanned until
+        they change; files whose status cannot be read are catalogued
+        with their error, and are scanned again by the next update.
 
         Parameters
         ----------
-        channel_name:   str
-                        Name of the analog channel which
-                        should be extracted.
+        paths:      [str, list of str]
+                    Path(s) of the CEV files which should be catalogued;
+                    any directory is expanded to the CEV files within it.
+        workers:    int, optional
+                    Number of worker processes used to scan the files,
+                    default is to scan the files serially in this process.
 
         Returns
         -------
-        channel:    list of float
-                    The analog channel values in a zero-based
-                    list.
+        count:      int
+                    Number of files which were (re-)catalogued.
+        """
+        known = {
+            path: (size, mtime_ns) for path, size, mtime_ns in
+            self._connection.execute(
+                "SELECT path, size, mtime_ns FROM records"
+            )
+        }
+        arguments = []
+        unreadable = []
+        for path in _expand_paths(paths):
+            path = os.path.abspath(path)
+            try:
+                status = os.stat(path)
+            except OSError as err:  # Such as Removed, or Not Permitted
+                unreadable.append(_catalog_values(path, None, None, None, err))
+                continue
+            if known.get(path) != (status.st_size, status.st_mtime_ns):
+                arguments.append((
+                    path, status.st_size, status.st_mtime_ns, self._options
+                ))
+        with self._connection:
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO records ({', '.join(self._COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(self._COLUMNS))})",
+                itertools.chain(unreadable, _map_files(
+                    _catalog_row, arguments, workers, ordered=False
+                )),
+            )
+        return len(unreadable) + len(arguments)
 
-        See Also
-        --------
-        get_status  : Collect the digital channel status for a
-                      specified name.
-        get_digital : Collect the digital channel status for a
-                      specified name.
+    def ingest(self, paths, workers: int = None, ordered: bool = True,
+               **kwargs):
+        """
+        *Load only the CEV files which are new or changed*.
+
+        The path, size, modification time, and SHA-256 content hash of
+        each file ingested are retained in the catalog. On later calls,
+        files whose size and modification time are unchanged are skipped
+        without being read, and files whose status has changed are hashed
+        but loaded only if their content has changed. Each file loaded is
+        also (re-)catalogued from its full record. A file is marked as
+        ingested once the consumer requests the result which follows it,
+        so a file whose result was not consumed is ingested again. Files
+        which cannot be read yield a result with their `OSError`, and
+        are not marked as ingested, so they are retried by the next call.
+
+        Parameters
+        ----------
+        paths:      [str, list of str]
+                    Path(s) of the CEV files which should be ingested; any
+                    directory is expanded to the CEV files within it.
+        workers:    int, optional
+                    Number of worker processes used to hash and load the
+                    files, default is to load the files serially in this
+                    process.
+        ordered:    bool, optional
+                    Control to yield the results in the order of the
+                    paths; otherwise results are yielded in the order
+                    they are completed, default is True.
+        **kwargs:   dict, optional
+                    Additional optional parameters, as accepted by `Cev`,
+                    overriding those of the catalog.
+
+        Yields
+        ------
+        result:     namedtuple
+                    The LoadResult for each new or changed file, as with
+                    `load_many`.
 
         Examples
         --------
-        >>> from pycev import CEV
-        >>> # Load a file and parse, directly.
-        >>> record = CEV() # Create the parser instance
-        >>> record.load(file="./event-report.cev")
-        >>> record.get_analog("FREQ")
-        [...]
+        >>> from pycev import Catalog
+        >>> with Catalog("./events.sqlite") as catalog:
+        ...     for result in catalog.ingest("./events", workers=4):
+        ...         if result.error is None:
+        ...             print(result.record.trigger_time)
         """
-        # Identify the Analog Channel Index
-        channel_index = self.analog_channel_ids.index(channel_name)
-        # Return the Analog Channel
-        return self.analog_channels[channel_index]
+        options = dict(self._options, **kwargs)
+        # Share the Settings Here, as Each Worker Would Hold a Copy
+        store = options.pop("settings_store", None)
+        known = {
+            path: (size, mtime_ns, content_hash)
+            for path, size, mtime_ns, content_hash in
+            self._connection.execute(
+                "SELECT path, size, mtime_ns, content_hash FROM ingested"
+            )
+        }
+        statuses = {}
+        arguments = []
+        for path in _expand_paths(paths):
+            path = os.path.abspath(path)
+            try:
+                status = os.stat(path)
+            except OSError as err:  # Such as Removed, or Not Permitted
+                yield LoadResult(
+                    path=path, record=None, error=err, warnings=[]
+                )
+                continue
+            size, mtime_ns, content_hash = known.get(path, (None,) * 3)
+            if (size, mtime_ns) != (status.st_size, status.st_mtime_ns):
+                statuses[path] = status
+                arguments.append((path, content_hash, options))
+        for path, content_hash, result in _map_files(
+            _ingest_result, arguments, workers, ordered
+        ):
+            if result is not None:
+                if store is not None and result.record is not None:
+                    store.share(result.record)
+                yield result
+                if isinstance(result.error, OSError):
+                    continue  # Not Read, so Retried by the Next Ingest
+            self._mark_ingested(path, statuses[path], content_hash, result)
 
-    # Define Method to Access the Digital Channel by Name
-    def get_status(self, channel_name: str):
-        """
-        *Extract an digital channel by name*.
+    def _mark_ingested(self, path, status, content_hash, result):
+        """Retain the Status and Hash of an Ingested File, and Catalog it."""
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO ingested "
+                "(path, size, mtime_ns, content_hash) VALUES (?, ?, ?, ?)",
+                (path, status.st_size, status.st_mtime_ns, content_hash),
+            )
+            if result is not None:
+                self._connection.execute(
+                    f"INSERT OR REPLACE INTO records "
+                    f"({', '.join(self._COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(self._COLUMNS))})",
+                    _catalog_values(
+                        path, status.st_size, status.st_mtime_ns,
+                        result.record, result.error,
+                    ),
+                )
 
-        Use this method to return the list of digital values
-        associated with the particular digital channel with
-        the specified name.
+    def prune(self):
+        """
+        *Remove the entries of files which no longer exist*.
 
-        Parameters
-        ----------
-        channel_name:   str
-                        Name of the digital channel which
-                        should be extracted.
+        The record of each ingested file which no longer exists is also
+        removed.
 
         Returns
         -------
-        channel:    list of bool
-                    The digital channel values in a zero-based
-                    list.
+        count:      int
+                    Number of entries removed.
+        """
+        missing = [
+            (path,) for (path,) in self._connection.execute(
+                "SELECT path FROM records UNION SELECT path FROM ingested"
+            )
+            if not os.path.exists(path)
+        ]
+        with self._connection:
+            for table in ("records", "ingested"):
+                self._connection.executemany(
+                    f"DELETE FROM {table} WHERE path = ?", missing
+                )
+        return len(missing)
 
-        See Also
-        --------
-        get_analog  : Collect the analog channel status for a
-                      specified name.
-        get_status  : Collect the digital channel status for a
-                      specified name.
-        get_digital : Collect the digital channel status for a
-                      specified name.
+    @property
+    def failures(self):
+        """List of the (Path, Error) of Each File which Failed to Scan."""
+        return self._connection.execute(
+            "SELECT path, error FROM records WHERE error IS NOT NULL "
+            "ORDER BY path"
+        ).fetchall()
 
-        Examples
-        --------
-        >>> from pycev import CEV
-        >>> # Load a file and parse, directly.
-        >>> record = CEV() # Create the parser instance
-        >>> record.load(file="./event-report.cev")
-        >>> record.get_status("TRIPLED")
-        [...]
-        >>> record.get_digital("TRIPLED")
-        [...]
+    def query(self, start: dt.datetime = None, end: dt.datetime = None,
+              fid: str = None, directory: str = None, validity: bool = None):
         """
-        # Identify the Digital Channel Index
-        channel_index = self.status_channel_ids.index(channel_name)
-        # Return the Digital Channel
-        return self.status_channels[channel_index]
+        *Find the catalogued records*.
 
-    # Alias `get_status` to `get_digital`
-    get_digital = get_status
+        Every criterion is optional; the entries which satisfy all the
+        criteria provided are returned, in order of their trigger time.
 
+        Parameters
+        ----------
+        start:      datetime, optional
+                    Earliest trigger time (inclusive) of the records.
+        end:        datetime, optional
+                    Latest trigger time (exclusive) of the records.
+        fid:        str, optional
+                    Relay firmware identification string of the records,
+                    without the 'FID=' specifier.
+        directory:  str, optional
+                    Directory within which the records are stored.
+        validity:   bool, optional
+                    Checksum validity of the header rows of the records.
 
-# Alias the Class: `Cev` to `CEV` for Convenience
-CEV = Cev
+        Returns
+        -------
+        entries:    list of CatalogEntry
+                    The entries of the matching records, whose `record`
+                    is loaded upon first access.
+        """
+        clauses = ["error IS NULL"]
+        parameters = []
+        if start is not None:
+            clauses.append("trigger_time >= ?")
+            parameters.append(
+                start.isoformat(sep=' ', timespec='microseconds')
+            )
+        if end is not None:
+            clauses.append("trigger_time < ?")
+            parameters.append(end.isoformat(sep=' ', timespec='microseconds'))
+        if fid is not None:
+            clauses.append("fid = ?")
+            parameters.append(fid)
+        if directory is not None:
+            # Compare the Path Prefix, so the Directory Name is Not a Pattern
+            prefix = os.path.join(os.path.abspath(directory), '')
+            clauses.append("substr(path, 1, ?) = ?")
+            parameters.extend([len(prefix), prefix])
+        if validity is not None:
+            clauses.append("validity = ?")
+            parameters.append(int(validity))
+        rows = self._connection.execute(
+            f"SELECT {', '.join(self._COLUMNS[:-1])} FROM records "
+            f"WHERE {' AND '.join(clauses)} ORDER BY trigger_time, path",
+            parameters,
+        )
+        return [CatalogEntry(row, self._options) for row in rows]
 
 
 # END
@@ -0,0 +1,38 @@
+################################################################################
+"""PyCEV Tests - Shared Fixtures of the Unit Tests."""
+################################################################################
+
+import sys
+from pathlib import Path
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pycev  # pylint: disable=wrong-import-position, import-error
+
+# Define the Synthetic Record Shared by the Tests
+SYNTHETIC_CEV = str(Path(__file__).parent / "synthetic-event.CEV")
+with open(SYNTHETIC_CEV, encoding="utf-8", newline="") as file:
+    RELAY_DATA = file.read()
+
+# Define the Channel Storage Backends, Skipping NumPy when Not Installed
+BACKENDS = [
+    "list",
+    pytest.param("numpy", marks=pytest.mark.skipif(
+        pycev.np is None, reason="NumPy is not installed"
+    )),
+]
+
+
+def write_cev(path, data=RELAY_DATA):
+    """Write the CEV Data to the Path, Retaining its Line Endings."""
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        file.write(data)
+
+
+@pytest.fixture
+def event_file(tmp_path):
+    """Prepare a Copy of the Synthetic CEV File."""
+    path = tmp_path / "event.CEV"
+    write_cev(path)
+    return str(path)
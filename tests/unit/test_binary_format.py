@@ -0,0 +1,76 @@
+################################################################################
+"""PyCEV Tests - Validate the Binary Columnar Record Format."""
+################################################################################
+# pylint: disable=import-error, redefined-outer-name
+
+import io
+import pytest
+
+import pycev
+from conftest import BACKENDS, RELAY_DATA
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_round_trip(tmp_path, backend):
+    """Records Opened from the Binary Form Match those which are Parsed."""
+    parsed = pycev.Cev(data=RELAY_DATA, backend=backend)
+    parsed.save(tmp_path / "event.cevb")
+    record = pycev.Cev.open_binary(tmp_path / "event.cevb", backend=backend)
+    assert record.fid == parsed.fid
+    assert record.raw_fid == parsed.raw_fid
+    assert record.frequency == parsed.frequency
+    assert record.trigger_time == parsed.trigger_time
+    assert record.settings == parsed.settings
+    assert record.record_lines[-1].startswith('"IA"')
+    assert list(record.time) == list(parsed.time)
+    assert record.analog_channel_ids == parsed.analog_channel_ids
+    assert record.status_channel_ids == parsed.status_channel_ids
+    assert [list(channel) for channel in record.analog_channels] == [
+        list(channel) for channel in parsed.analog_channels
+    ]
+    assert [list(channel) for channel in record.status_channels] == [
+        list(channel) for channel in parsed.status_channels
+    ]
+    assert list(record.cycles(pre=1, post=1).get_analog("IA")) == list(
+        parsed.cycles(pre=1, post=1).get_analog("IA")
+    )
+
+
+def test_channels_read_lazily(tmp_path):
+    """Analog Channels are Read from the Mapped File as Indexed."""
+    pycev.Cev(data=RELAY_DATA).save(tmp_path / "event.cevb")
+    record = pycev.Cev.open_binary(tmp_path / "event.cevb")
+    assert isinstance(record.analog_channels, pycev.MappedAnalogChannels)
+    assert record.analog_channels[-1] == record.get_analog("FREQ")
+    assert record.analog_channels[1:3] == record.get_analogs(["IB", "IC"])
+
+
+def test_numpy_channels_view_mapped_file(tmp_path):
+    """NumPy Channels are Read-Only Views of the Mapped File."""
+    pytest.importorskip("numpy")
+    pycev.Cev(data=RELAY_DATA).save(tmp_path / "event.cevb")
+    record = pycev.Cev.open_binary(tmp_path / "event.cevb", backend="numpy")
+    assert record.analog_channels.shape == (5, 12)
+    assert not record.analog_channels.flags.writeable
+
+
+def test_checksum_failures_retained(tmp_path):
+    """Checksum Failures of the Parsed Record are Retained."""
+    with pytest.warns(pycev.MalformedChecksumFailure):
+        parsed = pycev.Cev(data=RELAY_DATA.replace("1000.0,", "1001.0,", 1))
+    buffer = io.BytesIO()
+    parsed.save(buffer)
+    (tmp_path / "event.cevb").write_bytes(buffer.getvalue())
+    with pytest.warns(pycev.MalformedChecksumFailure):
+        record = pycev.Cev.open_binary(tmp_path / "event.cevb")
+    assert record.invalid_lines == [17]
+    with pytest.raises(pycev.MalformedChecksumFailure):
+        pycev.Cev.open_binary(tmp_path / "event.cevb", checksum="strict")
+
+
+@pytest.mark.parametrize("content", [b"", b"PYCEVBIN\xff", RELAY_DATA.encode()])
+def test_malformed_binary_record(tmp_path, content):
+    """Files which are Not Binary Records are Rejected."""
+    (tmp_path / "event.cevb").write_bytes(content)
+    with pytest.raises(pycev.MalformedBinaryRecord):
+        pycev.Cev.open_binary(tmp_path / "event.cevb")
@@ -0,0 +1,90 @@
+################################################################################
+"""PyCEV Tests - Validate the SQLite Catalog of CEV Files."""
+################################################################################
+# pylint: disable=import-error, redefined-outer-name
+
+import os
+import datetime as dt
+from pathlib import Path
+import pytest
+
+import pycev
+from conftest import RELAY_DATA, write_cev
+
+FID = "SEL-351S-7-R514-V0-Z103103-D20140408"
+
+
+def event_data(day, fid=FID):
+    """Form an Event Triggered on Another Day, or by Another Relay."""
+    lines = RELAY_DATA.split('\r\n')
+    lines[1] = pycev.append_row_checksum(f'"FID={fid}"')
+    lines[3] = pycev.append_row_checksum(f"1,{day},2023,10,20,30,125")
+    return '\r\n'.join(lines)
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """Prepare an Archive of Events from Two Relays."""
+    for relay, fid in (("relay-1", FID), ("relay-2", "SEL-451-R320")):
+        (tmp_path / relay).mkdir()
+        for day in (10, 16, 20):
+            write_cev(tmp_path / relay / f"event-{day}.CEV",
+                      event_data(day, fid))
+    write_cev(tmp_path / "relay-2" / "truncated.CEV", RELAY_DATA[:60])
+    return tmp_path
+
+
+def test_query(archive):
+    """Records are Found by Trigger Time, FID, and Directory."""
+    with pycev.Catalog(archive / "catalog.sqlite") as catalog:
+        assert catalog.update(archive) == 7
+        assert len(catalog) == 7
+        assert [Path(path).name for path, _ in catalog.failures] == [
+            "truncated.CEV"
+        ]
+        entries = catalog.query(
+            start=dt.datetime(2023, 1, 16), end=dt.datetime(2023, 1, 20),
+            fid=FID,
+        )
+        assert [Path(entry.path).name for entry in entries] == [
+            "event-16.CEV"
+        ]
+        entry = entries[0]
+        assert entry.trigger_time == dt.datetime(2023, 1, 16, 10, 20, 30,
+                                                 125000)
+        assert entry.validity
+        assert entry.analog_samples == "4"
+        assert "TRIP" in entry.status_channel_ids
+        assert entry.record.get_analog("IA") == pycev.Cev(
+            data=RELAY_DATA
+        ).get_analog("IA")
+        assert len(catalog.query(directory=archive / "relay-2")) == 3
+        assert len(catalog.query(fid="SEL-451-R320",
+                                 start=dt.datetime(2023, 1, 12))) == 2
+
+
+def test_incremental_update(archive):
+    """Only New or Changed Files are Scanned Again."""
+    database = archive / "catalog.sqlite"
+    with pycev.Catalog(database) as catalog:
+        catalog.update(archive)
+    changed = archive / "relay-1" / "event-10.CEV"
+    write_cev(changed, event_data(12))
+    os.utime(changed, ns=(0, 0))
+    (archive / "relay-1" / "event-16.CEV").unlink()
+    with pycev.Catalog(database) as catalog:
+        assert catalog.update(archive) == 1
+        assert catalog.query(fid=FID)[0].trigger_time.day == 12
+        assert catalog.prune() == 1
+        assert len(catalog.query(fid=FID)) == 2
+        assert catalog.update(archive) == 0
+
+
+def test_unreadable_file_reported(archive):
+    """Files whose Status Cannot be Read are Reported, then Retried."""
+    missing = archive / "relay-1" / "missing.CEV"
+    with pycev.Catalog() as catalog:
+        assert catalog.update([archive, missing]) == 8
+        failures = dict(catalog.failures)
+        assert failures[str(missing)].startswith("FileNotFoundError")
+        assert catalog.update([archive, missing]) == 1
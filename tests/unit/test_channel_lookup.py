@@ -0,0 +1,46 @@
+################################################################################
+"""PyCEV Tests - Validate Channel Retrieval by Name."""
+################################################################################
+# pylint: disable=import-error
+
+import pytest
+
+import pycev
+from conftest import SYNTHETIC_CEV
+
+
+def test_get_many_channels():
+    """Retrieve Many Channels in the Requested Order."""
+    record = pycev.CEV(file=SYNTHETIC_CEV)
+    assert record.get_analogs(["IC", "IA"]) == [
+        record.get_analog("IC"), record.get_analog("IA"),
+    ]
+    assert record.get_statuses(["TRGTR", "TRIP"]) == [
+        record.get_status("TRGTR"), record.get_status("TRIP"),
+    ]
+    assert record.get_digitals([]) == []
+
+
+def test_get_many_channels_with_numpy():
+    """Retrieve Many Channels as 2-D Arrays."""
+    np = pytest.importorskip("numpy")
+    record = pycev.CEV(file=SYNTHETIC_CEV, backend="numpy")
+    adjacent = record.get_analogs(["IB", "IC"])
+    assert adjacent.shape == (2, 12)
+    assert np.shares_memory(adjacent, record.analog_channels)
+    assert np.array_equal(record.get_analogs(["IC", "IA"])[1],
+                          record.get_analog("IA"))
+    statuses = record.get_statuses(["TRIP", "IN101", "TRGTR"])
+    assert statuses.shape == (3, 12)
+    assert np.array_equal(statuses[2], record.get_status("TRGTR"))
+
+
+def test_unknown_channel_name():
+    """Unknown Channel Names Fail as with `list.index`."""
+    record = pycev.CEV(file=SYNTHETIC_CEV)
+    with pytest.raises(ValueError):
+        record.get_analog("VB(kV)")
+    with pytest.raises(ValueError):
+        record.get_statuses(["TRIP", "52A"])
+
+# END
@@ -0,0 +1,43 @@
+################################################################################
+"""PyCEV Tests - Validate Parsing of Selected Channels."""
+################################################################################
+# pylint: disable=import-error
+
+import pytest
+
+import pycev
+from conftest import SYNTHETIC_CEV
+
+
+def test_selected_channels_match_full_parse():
+    """Selected Channels Carry the Same Samples as a Full Parse."""
+    full = pycev.CEV(file=SYNTHETIC_CEV)
+    record = pycev.CEV(
+        file=SYNTHETIC_CEV,
+        analogs=["IC", "IA"],
+        digitals=["TRGTR", "TRIP"],
+    )
+    assert record.analog_channel_ids == ["IC", "IA"]
+    assert record.status_channel_ids == ["TRGTR", "TRIP"]
+    assert record.analog_channels == [full.get_analog("IC"),
+                                      full.get_analog("IA")]
+    assert record.get_status("TRGTR") == full.get_status("TRGTR")
+    assert record.get_status("TRIP") == full.get_status("TRIP")
+    assert len(record.time) == len(full.time)
+
+
+def test_selected_digitals_retain_only_required_bytes():
+    """Only the Packed Bytes Holding Selected Digitals are Kept."""
+    record = pycev.CEV(file=SYNTHETIC_CEV, analogs=[], digitals=["TRGTR"])
+    assert record.analog_count == 0
+    assert record._status_stride == 1  # pylint: disable=protected-access
+    assert len(record.status_channels[0]) == 12
+    assert record.get_status("TRGTR") == [0] * 9 + [1] * 3
+
+
+def test_unknown_channel_selection():
+    """Selecting Channels Missing from the Record Fails."""
+    with pytest.raises(ValueError):
+        pycev.CEV(file=SYNTHETIC_CEV, analogs=["IA", "VB(kV)"])
+
+# END
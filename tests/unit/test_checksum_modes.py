@@ -0,0 +1,55 @@
+################################################################################
+"""PyCEV Tests - Validate Checksum Validation Modes."""
+################################################################################
+# pylint: disable=import-error
+
+import warnings
+import pytest
+
+import pycev
+from conftest import RELAY_DATA
+
+CORRUPTED_DATA = RELAY_DATA.replace("1000.0,", "1001.0,", 1)
+
+
+def test_default_mode_warns():
+    """Checksum Failures Warn by Default."""
+    with pytest.warns(pycev.MalformedChecksumFailure):
+        record = pycev.CEV(data=CORRUPTED_DATA)
+    assert record.validity is False
+    assert record.invalid_lines == [17]
+
+
+def test_strict_mode_raises():
+    """Checksum Failures Raise in Strict Mode."""
+    with pytest.raises(pycev.MalformedChecksumFailure):
+        pycev.CEV(data=CORRUPTED_DATA, checksum="strict")
+    assert pycev.CEV(data=RELAY_DATA, checksum="strict").validity
+
+
+def test_deferred_mode_validates_on_access():
+    """Checksums are Evaluated upon First Access in Deferred Mode."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        record = pycev.CEV(data=CORRUPTED_DATA, checksum="deferred")
+    with pytest.warns(pycev.MalformedChecksumFailure):
+        assert record.validity is False
+    assert record.invalid_lines == [17]
+
+
+def test_off_mode_skips_validation():
+    """Checksums are Never Evaluated when Validation is Off."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        record = pycev.CEV(data=CORRUPTED_DATA, checksum="off")
+        assert record.validity is None
+        assert not record.invalid_lines
+    assert record.get_analog("IA")[9] == 1001.0
+
+
+def test_unknown_checksum_mode():
+    """Unknown Checksum Modes are Rejected."""
+    with pytest.raises(ValueError):
+        pycev.CEV(checksum="sometimes")
+
+# END
@@ -0,0 +1,68 @@
+################################################################################
+"""PyCEV Tests - Validate the Memory-Lean Record Forms."""
+################################################################################
+# pylint: disable=import-error, redefined-outer-name
+
+import copy
+import pytest
+
+import pycev
+from conftest import BACKENDS, RELAY_DATA
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_without_raw_text(backend):
+    """Records Parsed without Retaining the Raw Text Remain Usable."""
+    full = pycev.Cev(data=RELAY_DATA, backend=backend)
+    record = pycev.Cev(data=RELAY_DATA, backend=backend, keep_raw=False)
+    assert record.data == '' and record.record == ''
+    assert len(record.record_lines) < len(full.record_lines)
+    assert record.settings == full.settings
+    assert record.validity
+    assert list(record.get_analog("IA")) == list(full.get_analog("IA"))
+    assert record.dumps() == full.dumps()
+
+
+def test_deferred_checksums_without_raw_text():
+    """Deferred Checksums are Evaluated Before the Raw Text is Dropped."""
+    lines = RELAY_DATA.split('\n')
+    lines[8] = lines[8].replace('"', "'", 1)
+    corrupt = '\n'.join(lines)
+    record = pycev.Cev(data=corrupt, checksum="deferred", keep_raw=False)
+    with pytest.warns(pycev.MalformedChecksumFailure):
+        assert not record.validity
+    assert record.invalid_lines == [9]
+
+
+def test_without_settings():
+    """The Relay Settings are Dropped on Request."""
+    record = pycev.Cev(data=RELAY_DATA, keep_settings=False)
+    assert record.settings == ''
+    assert record.record != ''
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_compact(backend):
+    """The Compact Record Shares the Accessors of the Full Record."""
+    full = pycev.Cev(data=RELAY_DATA, backend=backend)
+    record = full.compact()
+    assert isinstance(record, pycev.CompactCev)
+    assert not hasattr(record, "__dict__")
+    assert record.validity
+    assert record.fid == full.fid
+    assert record.event == full.event
+    assert record.properties["FID"] == full.raw_fid
+    assert record.settings == full.settings
+    for name in full.analog_channel_ids:
+        assert list(record.get_analog(name)) == list(full.get_analog(name))
+    for name in full.status_channel_ids:
+        assert list(record.get_digital(name)) == list(full.get_status(name))
+    window = record.window(-0.005, 0.010)
+    assert isinstance(window, pycev.CompactCev)
+    assert list(window.get_analog("IA")) == list(
+        full.window(-0.005, 0.010).get_analog("IA")
+    )
+    assert copy.copy(record).fid == full.fid
+    assert full.compact(keep_settings=False).settings == ''
+    with pytest.raises(AttributeError):
+        _ = record.missing_attribute
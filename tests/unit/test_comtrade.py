@@ -0,0 +1,112 @@
+################################################################################
+"""PyCEV Tests - Validate the COMTRADE Export."""
+################################################################################
+# pylint: disable=import-error, redefined-outer-name
+
+import struct
+from pathlib import Path
+import pytest
+
+import pycev
+from conftest import BACKENDS, RELAY_DATA, write_cev
+
+
+def read_comtrade(cfg_file, dat_file):
+    """Read the Scaled Analogs and Status Channels of a COMTRADE Record."""
+    lines = Path(cfg_file).read_text().splitlines()
+    analog_count = int(lines[1].split(',')[1][:-1])
+    status_count = int(lines[1].split(',')[2][:-1])
+    scales = [
+        float(line.split(',')[5]) for line in lines[2:2 + analog_count]
+    ]
+    data_format = lines[2 + analog_count + status_count + 5]
+    data = Path(dat_file).read_bytes()
+    if data_format == "ASCII":
+        rows = [
+            [int(value) for value in line.split(',')]
+            for line in data.decode().splitlines()
+        ]
+    else:
+        word_count = -(-status_count // 16)
+        row_format = struct.Struct(
+            "<II" + ("h" if data_format == "BINARY" else "i") * analog_count +
+            "H" * word_count
+        )
+        rows = []
+        for fields in row_format.iter_unpack(data):
+            words = fields[2 + analog_count:]
+            rows.append(list(fields[:2 + analog_count]) + [
+                (words[bit // 16] >> (bit % 16)) & 1
+                for bit in range(status_count)
+            ])
+    analogs = [
+        [row[2 + i] * scale for row in rows] for i, scale in enumerate(scales)
+    ]
+    statuses = [
+        [row[2 + analog_count + i] for row in rows]
+        for i in range(status_count)
+    ]
+    return lines, analogs, statuses
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("data_format", ["ASCII", "BINARY", "BINARY32"])
+def test_to_comtrade(tmp_path, backend, data_format):
+    """The COMTRADE Record Holds the Channels of the CEV."""
+    record = pycev.Cev(data=RELAY_DATA, backend=backend)
+    files = record.to_comtrade(
+        tmp_path / "event", data_format=data_format, chunk_size=5
+    )
+    assert files == (str(tmp_path / "event.cfg"), str(tmp_path / "event.dat"))
+    lines, analogs, statuses = read_comtrade(*files)
+    assert lines[0].endswith(",2013")
+    assert lines[1] == "13,5A,8D"
+    assert "16/01/2023,10:20:30.125000" in lines
+    for name, channel in zip(record.analog_channel_ids, analogs):
+        expected = list(record.get_analog(name))
+        resolution = max(abs(value) for value in expected) / 32767
+        assert channel == pytest.approx(expected, abs=resolution)
+    for name, channel in zip(record.status_channel_ids, statuses):
+        assert channel == list(record.get_status(name))
+
+
+def test_statuses_unpacked_by_chunk(tmp_path, monkeypatch):
+    """Status Channels are Unpacked Only for Each Chunk of Samples."""
+    ranges = []
+    unpack = pycev.Cev._unpack_statuses
+
+    def spy(record, bits, first=0, stop=None):
+        ranges.append((first, stop))
+        return unpack(record, bits, first, stop)
+
+    monkeypatch.setattr(pycev.Cev, "_unpack_statuses", spy)
+    pycev.Cev(data=RELAY_DATA).to_comtrade(tmp_path / "event", chunk_size=5)
+    assert ranges == [(0, 5), (5, 10), (10, 12)]
+
+
+def test_binary_default(tmp_path):
+    """Records are Written as 16-bit Binary, Unless ASCII is Requested."""
+    record = pycev.Cev(data=RELAY_DATA)
+    cfg_file, _ = record.to_comtrade(tmp_path / "binary")
+    assert "BINARY" in Path(cfg_file).read_text().splitlines()
+    cfg_file, _ = record.to_comtrade(tmp_path / "ascii", binary=False)
+    assert "ASCII" in Path(cfg_file).read_text().splitlines()
+    with pytest.raises(ValueError):
+        record.to_comtrade(tmp_path / "float", data_format="FLOAT64")
+
+
+def test_convert_to_comtrade(tmp_path):
+    """Many CEV Files are Converted, Retaining their Directories."""
+    (tmp_path / "relay-1").mkdir()
+    (tmp_path / "relay-2").mkdir()
+    write_cev(tmp_path / "relay-1" / "event.CEV", RELAY_DATA)
+    write_cev(tmp_path / "relay-2" / "event.CEV", RELAY_DATA)
+    write_cev(tmp_path / "relay-2" / "truncated.CEV", RELAY_DATA[:300])
+    results = list(pycev.convert_to_comtrade(
+        [tmp_path / "relay-1", tmp_path / "relay-2"], tmp_path / "comtrade"
+    ))
+    assert [result.error is None for result in results] == [
+        True, True, False
+    ]
+    assert (tmp_path / "comtrade" / "relay-1" / "event.dat").exists()
+    assert (tmp_path / "comtrade" / "relay-2" / "event.cfg").exists()
@@ -0,0 +1,48 @@
+################################################################################
+"""PyCEV Tests - Validate Bulk Decoding of Record Sample Rows."""
+################################################################################
+# pylint: disable=import-error
+
+import pytest
+
+from pycev import decode_data_block, MalformedHeadingDataMismatch
+
+ROWS = [
+    '1.5,-2.0,"","80FF"',
+    '2.5,-3.0,">","0001"',
+    '3.5,-4.0,"","C000"',
+]
+
+
+def test_decode_data_block():
+    """Decode Analogs, Trigger Row, and Packed Status Together."""
+    block = decode_data_block(ROWS, analog_count=2)
+    assert block.analogs == [[1.5, 2.5, 3.5], [-2.0, -3.0, -4.0]]
+    assert block.trigger_row == 1
+    assert block.status == bytes.fromhex("80FF0001C000")
+    assert block.status_stride == 2
+
+
+def test_decode_data_block_with_numpy():
+    """Decode into Arrays when NumPy is Requested."""
+    np = pytest.importorskip("numpy")
+    block = decode_data_block(ROWS, analog_count=2, use_numpy=True)
+    assert np.array_equal(block.analogs[1], [-2.0, -3.0, -4.0])
+    assert block.status.shape == (3, 2)
+    assert block.status[2, 0] == 0xC0
+
+
+def test_decode_data_block_column_mismatch():
+    """Rows Narrower than the Heading are Malformed."""
+    with pytest.raises(MalformedHeadingDataMismatch):
+        decode_data_block(ROWS, analog_count=3)
+
+
+def test_decode_data_block_trailing_columns():
+    """Columns Following the Hex-Status are Ignored."""
+    rows = [ROWS[0] + ',"X"', ROWS[1], ROWS[2] + ',"X","Y"']
+    assert decode_data_block(rows, analog_count=2) == decode_data_block(
+        ROWS, analog_count=2
+    )
+
+# END
@@ -0,0 +1,72 @@
+################################################################################
+"""PyCEV Tests - Validate the Incremental Ingest of CEV Files."""
+################################################################################
+# pylint: disable=import-error, redefined-outer-name
+
+import os
+from pathlib import Path
+
+import pycev
+from conftest import RELAY_DATA, write_cev
+
+
+def ingested(catalog, path, **kwargs):
+    """Ingest the Path, Returning the Names of the Files Yielded."""
+    return sorted(
+        Path(result.path).name for result in catalog.ingest(path, **kwargs)
+    )
+
+
+def test_ingest_new_or_changed(tmp_path):
+    """Only Files which are New, or whose Content Changed, are Loaded."""
+    events = tmp_path / "events"
+    events.mkdir()
+    for name in ("event-1.CEV", "event-2.CEV"):
+        write_cev(events / name, RELAY_DATA)
+    database = tmp_path / "catalog.sqlite"
+    with pycev.Catalog(database) as catalog:
+        results = list(catalog.ingest(events))
+        assert all(result.error is None for result in results)
+        assert results[0].record.validity
+        assert ingested(catalog, events) == []
+        assert len(catalog.query()) == 2
+    # A New File, a Touched File, and a Changed File
+    write_cev(events / "event-3.CEV", RELAY_DATA)
+    os.utime(events / "event-1.CEV", ns=(0, 0))
+    write_cev(events / "event-2.CEV", RELAY_DATA[:300])
+    with pycev.Catalog(database) as catalog:
+        results = {
+            Path(result.path).name: result for result in catalog.ingest(
+                events, ordered=False, settings_store=pycev.SettingsStore()
+            )
+        }
+        assert sorted(results) == ["event-2.CEV", "event-3.CEV"]
+        assert results["event-2.CEV"].error is not None
+        assert [Path(path).name for path, _ in catalog.failures] == [
+            "event-2.CEV"
+        ]
+        assert ingested(catalog, events) == []
+        (events / "event-3.CEV").unlink()
+        assert catalog.prune() == 1
+        assert len(catalog) == 2
+
+
+def test_unconsumed_result_ingested_again(tmp_path):
+    """A File whose Result was Not Consumed is Ingested Again."""
+    write_cev(tmp_path / "event.CEV", RELAY_DATA)
+    with pycev.Catalog() as catalog:
+        for _ in catalog.ingest(tmp_path):
+            break
+        assert ingested(catalog, tmp_path) == ["event.CEV"]
+        assert ingested(catalog, tmp_path) == []
+
+
+def test_unreadable_file_retried(tmp_path):
+    """Files which Cannot be Read are Reported, and Ingested Again."""
+    write_cev(tmp_path / "event.CEV", RELAY_DATA)
+    missing = tmp_path / "missing.CEV"
+    with pycev.Catalog() as catalog:
+        results = list(catalog.ingest([tmp_path, missing]))
+        assert [result.error is None for result in results] == [False, True]
+        assert isinstance(results[0].error, FileNotFoundError)
+        assert ingested(catalog, [tmp_path, missing]) == ["missing.CEV"]
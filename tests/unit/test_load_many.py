@@ -0,0 +1,86 @@
+################################################################################
+"""PyCEV Tests - Validate Batch Loading of Many CEV Files."""
+################################################################################
+# pylint: disable=import-error, redefined-outer-name
+
+from pathlib import Path
+import pytest
+
+import pycev
+from conftest import RELAY_DATA, write_cev
+
+
+@pytest.fixture
+def event_directory(tmp_path):
+    """Prepare a Directory of Good, Corrupted, and Truncated Events."""
+    (tmp_path / "relay-1").mkdir()
+    write_cev(tmp_path / "relay-1" / "good.CEV", RELAY_DATA)
+    write_cev(tmp_path / "relay-1" / "corrupted.CEV",
+              RELAY_DATA.replace("1000.0,", "1001.0,", 1))
+    write_cev(tmp_path / "truncated.CEV", RELAY_DATA[:300])
+    (tmp_path / "notes.txt").write_text("Not an event.")
+    return tmp_path
+
+
+def test_load_many_reports_failures(event_directory):
+    """Failures and Warnings are Captured for Each File."""
+    results = {
+        Path(result.path).name: result
+        for result in pycev.load_many(event_directory)
+    }
+    assert sorted(results) == ["corrupted.CEV", "good.CEV", "truncated.CEV"]
+    assert results["good.CEV"].error is None
+    assert not results["good.CEV"].warnings
+    assert isinstance(results["truncated.CEV"].error, Exception)
+    assert results["truncated.CEV"].record is None
+    assert isinstance(results["corrupted.CEV"].warnings[0],
+                      pycev.MalformedChecksumFailure)
+    assert results["corrupted.CEV"].record.validity is False
+
+
+def test_load_many_skips_binary_records(event_directory):
+    """Binary Records and Cache Entries are Not Loaded as CEV Files."""
+    good = event_directory / "relay-1" / "good.CEV"
+    pycev.Cev(str(good), cache_dir=event_directory / "cache")
+    pycev.Cev(str(good)).save(str(good.with_suffix(".cevb")))
+    names = sorted(
+        Path(result.path).name
+        for result in pycev.load_many(event_directory)
+    )
+    assert names == ["corrupted.CEV", "good.CEV", "truncated.CEV"]
+
+
+def test_load_many_in_worker_processes(event_directory):
+    """Parallel Loading Matches Serial Loading in Input Order."""
+    paths = sorted(str(path) for path in event_directory.rglob("*.CEV"))
+    serial = list(pycev.load_many(paths))
+    parallel = list(pycev.load_many(paths, workers=2))
+    assert [result.path for result in parallel] == paths
+    for expected, result in zip(serial, parallel):
+        assert type(result.error) is type(expected.error)
+        if result.record is not None:
+            assert result.record.analog_channels == \
+                expected.record.analog_channels
+
+
+def test_unpicklable_options_loaded_serially(event_directory):
+    """Options which Cannot be Sent to Workers Fall Back to Serial Loading."""
+    with pytest.warns(pycev.SerialLoadFallback):
+        results = list(pycev.load_many(
+            event_directory, workers=2,
+            analogs={"IA": None}.keys(),  # Views Cannot be Pickled
+        ))
+    assert [result.error is None for result in results] == [
+        False, True, True
+    ]
+    assert results[1].record.analog_channel_ids == ["IA"]
+
+
+def test_collection(event_directory):
+    """Collections Present the Records which Loaded Successfully."""
+    events = pycev.CevCollection(event_directory, checksum="off")
+    assert len(events) == 2
+    assert len(events.failures) == 1
+    assert all(record.fid.startswith("SEL-351S") for record in events)
+
+# END
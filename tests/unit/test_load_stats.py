@@ -0,0 +1,73 @@
+################################################################################
+"""PyCEV Tests - Validate the Profiling of Each Stage of a Load."""
+################################################################################
+# pylint: disable=import-error
+
+import tracemalloc
+
+import pycev
+from conftest import SYNTHETIC_CEV
+
+STAGES = ["read", "split", "checksum", "header", "samples", "timestamps"]
+
+
+def test_not_profiled_by_default():
+    """No Measurements are Made Unless Requested."""
+    assert not pycev.Cev(SYNTHETIC_CEV).load_stats
+
+
+def test_load_stats():
+    """Each Stage of the Load is Measured."""
+    record = pycev.Cev(SYNTHETIC_CEV, profile=True)
+    assert list(record.load_stats) == STAGES
+    for stage, stats in record.load_stats.items():
+        assert stats.stage == stage
+        assert stats.seconds >= 0
+        assert stats.peak_memory is None
+    assert record.load_stats["split"].lines == 19
+    assert record.load_stats["header"].lines == 7
+    assert record.load_stats["samples"].lines == 12
+    assert record.load_stats["header"].bytes == sum(
+        map(len, record.record_lines[:7])
+    )
+    assert record.load_stats["read"].bytes == len(record.data)
+
+
+def test_checksum_stage_skipped():
+    """Stages which are Skipped are Not Measured."""
+    record = pycev.Cev(SYNTHETIC_CEV, profile=True, checksum="off")
+    assert "checksum" not in record.load_stats
+
+
+def test_profile_hook_and_memory():
+    """The Hook is Called as Each Stage Completes, with Memory Measured."""
+    completed = []
+    record = pycev.Cev(
+        SYNTHETIC_CEV, profile_hook=completed.append, profile_memory=True
+    )
+    assert [stats.stage for stats in completed] == STAGES
+    assert completed == list(record.load_stats.values())
+    assert all(stats.peak_memory >= 0 for stats in completed)
+
+
+def test_memory_without_reset_peak(monkeypatch):
+    """Memory is Measured where the Peak Cannot be Reset (Python 3.8)."""
+    monkeypatch.delattr(tracemalloc, "reset_peak", raising=False)
+    tracemalloc.start()
+    try:
+        record = pycev.Cev(SYNTHETIC_CEV, profile_memory=True)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    assert all(
+        stats.peak_memory >= 0 for stats in record.load_stats.values()
+    )
+
+
+def test_cached_load_stats(tmp_path):
+    """Loads from the Cache Do Not Read the File."""
+    pycev.Cev(SYNTHETIC_CEV, cache_dir=tmp_path)
+    record = pycev.Cev(SYNTHETIC_CEV, cache_dir=tmp_path, profile=True)
+    assert list(record.load_stats) == ["cache"]
+    assert record.data  # Read Only when Accessed, and Not Measured
+    assert list(record.load_stats) == ["cache"]
@@ -0,0 +1,36 @@
+################################################################################
+"""PyCEV Tests - Validate the NumPy Analog Storage Backend."""
+################################################################################
+# pylint: disable=import-error
+
+import pytest
+
+import pycev
+from conftest import SYNTHETIC_CEV
+
+np = pytest.importorskip("numpy")
+
+
+def test_numpy_backend_matches_list_backend():
+    """Load with Both Backends and Compare the Analog Channels."""
+    listed = pycev.CEV(file=SYNTHETIC_CEV)
+    arrayed = pycev.CEV(file=SYNTHETIC_CEV, backend="numpy")
+    assert arrayed.analog_channels.shape == (5, 12)
+    assert arrayed.analog_channels.flags["C_CONTIGUOUS"]
+    assert np.array_equal(arrayed.analog_channels, listed.analog_channels)
+
+
+def test_numpy_backend_get_analog_is_view():
+    """Analog Channels Extracted by Name are Views, not Copies."""
+    record = pycev.CEV(file=SYNTHETIC_CEV, backend="numpy")
+    channel = record.get_analog("IA")
+    assert np.shares_memory(channel, record.analog_channels)
+    assert channel[9] == 1000.0
+
+
+def test_unknown_backend():
+    """Unknown Backends are Rejected."""
+    with pytest.raises(ValueError):
+        pycev.CEV(backend="pandas")
+
+# END
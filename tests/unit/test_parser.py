@@ -0,0 +1,75 @@
+################################################################################
+"""PyCEV Tests - Validate the Reusable Parser and its Layout Cache."""
+################################################################################
+# pylint: disable=import-error, redefined-outer-name
+
+import pytest
+
+import pycev
+from conftest import RELAY_DATA
+
+
+def test_layout_cached():
+    """Later Records with the Same Heading Reuse the Cached Layout."""
+    parser = pycev.CevParser()
+    first = parser.parse(data=RELAY_DATA)
+    second = parser.parse(data=RELAY_DATA, digitals=["TRIP"])
+    assert (parser.hits, parser.misses, len(parser)) == (1, 1, 1)
+    expected = pycev.Cev(data=RELAY_DATA)
+    assert first.analog_channel_ids == expected.analog_channel_ids
+    assert first.status_channel_ids == expected.status_channel_ids
+    assert first.get_status("TRIP") == expected.get_status("TRIP")
+    assert second.status_channel_ids == ["TRIP"]
+    assert second.get_status("TRIP") == expected.get_status("TRIP")
+    # The Cached Layout is Not Altered by the Records which Share it
+    first.analog_channel_ids.append("EXTRA")
+    assert parser.parse(data=RELAY_DATA).analog_channel_ids == (
+        expected.analog_channel_ids
+    )
+
+
+def test_layout_index_shared():
+    """Records Sharing a Layout Reuse its Channel Index Maps As-Is."""
+    # pylint: disable=protected-access
+    parser = pycev.CevParser()
+    first = parser.parse(data=RELAY_DATA)
+    second = parser.parse(data=RELAY_DATA)
+    layout = parser.channel_layout(
+        "FID=" + first.fid, RELAY_DATA.splitlines()[6][:-7]
+    )
+    assert parser.hits == 2
+    for record in (first, second):
+        assert record._analog_index is layout.analog_index
+        assert record._status_index is layout.status_index
+    assert second.get_analog("IB") == first.get_analog("IB")
+    selected = parser.parse(data=RELAY_DATA, analogs=["IB"])
+    assert selected._analog_index == {"IB": 0}
+    assert layout.analog_index["IB"] == 1
+
+
+def test_layout_keyed_by_fid_and_heading():
+    """Records of Another Relay, or Heading, are Resolved Separately."""
+    parser = pycev.CevParser(max_layouts=2)
+    other_fid = RELAY_DATA.replace("SEL-351S", "SEL-451S", 1)
+    record = pycev.Cev(data=other_fid, parser=parser, checksum="off")
+    assert record.status_channel_ids == pycev.Cev(
+        data=RELAY_DATA
+    ).status_channel_ids
+    parser.parse(data=RELAY_DATA)
+    built = pycev.Cev.from_channels(
+        {"IA": [0.0, 1.0]}, {"OUT1": [0, 1]}, parser=parser
+    )
+    assert built.status_channel_ids == ["OUT1"]
+    assert (parser.hits, parser.misses, len(parser)) == (0, 3, 2)
+    parser.clear()
+    assert len(parser) == 0
+
+
+def test_parser_option_rejected():
+    """A Parser Cannot be Given Another Parser to Parse With."""
+    parser = pycev.CevParser()
+    with pytest.raises(ValueError, match="'parser' option"):
+        parser.parse(data=RELAY_DATA, parser=pycev.CevParser())
+    with pytest.raises(ValueError, match="'parser' option"):
+        pycev.CevParser(parser=parser)
+    assert (parser.hits, parser.misses) == (0, 0)
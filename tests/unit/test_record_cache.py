@@ -0,0 +1,166 @@
+################################################################################
+"""PyCEV Tests - Validate the Content-Addressed Cache of Parsed Records."""
+################################################################################
+# pylint: disable=import-error, redefined-outer-name
+
+import os
+import warnings
+import pytest
+
+import pycev
+from conftest import BACKENDS, RELAY_DATA, write_cev
+
+
+def entries(cache_dir):
+    """List the Records Stored in the Cache."""
+    return sorted(
+        name for name in os.listdir(cache_dir) if name.endswith(".cevb")
+    )
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_warm_load_matches_parse(event_file, tmp_path, backend):
+    """Records Loaded from the Cache Match those which are Parsed."""
+    cache_dir = tmp_path / "cache"
+    parsed = pycev.Cev(event_file, backend=backend)
+    cold = pycev.Cev(event_file, backend=backend, cache_dir=cache_dir)
+    warm = pycev.Cev(event_file, backend=backend, cache_dir=cache_dir)
+    assert len(entries(cache_dir)) == 1
+    for record in (cold, warm):
+        assert record.fid == parsed.fid
+        assert record.trigger_time == parsed.trigger_time
+        assert record.analog_channel_ids == parsed.analog_channel_ids
+        assert record.status_channel_ids == parsed.status_channel_ids
+        assert record.settings == parsed.settings
+        assert list(record.time) == list(parsed.time)
+        for name in parsed.analog_channel_ids:
+            assert list(record.get_analog(name)) == list(
+                parsed.get_analog(name)
+            )
+        for name in parsed.status_channel_ids:
+            assert list(record.get_status(name)) == list(
+                parsed.get_status(name)
+            )
+
+
+def test_cache_is_keyed_on_content(event_file, tmp_path):
+    """A Copy of the Same Content Shares the Cached Record."""
+    cache_dir = tmp_path / "cache"
+    copy = tmp_path / "copy.CEV"
+    write_cev(copy, RELAY_DATA)
+    pycev.Cev(event_file, cache_dir=cache_dir)
+    pycev.Cev(str(copy), cache_dir=cache_dir)
+    assert len(entries(cache_dir)) == 1
+    # Channel Selections are Cached Separately
+    record = pycev.Cev(event_file, cache_dir=cache_dir, analogs=["IB"])
+    assert record.analog_channel_ids == ["IB"]
+    assert len(entries(cache_dir)) == 2
+
+
+def test_warm_load_keeps_raw_text(event_file, tmp_path):
+    """Raw Text is Restored for Cached Records, Unless Released."""
+    cache_dir = tmp_path / "cache"
+    parsed = pycev.Cev(event_file)
+    pycev.Cev(event_file, cache_dir=cache_dir)
+    warm = pycev.Cev(event_file, cache_dir=cache_dir)
+    assert warm.data == parsed.data
+    assert warm.record == parsed.record
+    assert warm.record_lines == parsed.record_lines
+    warm = pycev.Cev(event_file, cache_dir=cache_dir, keep_raw=False)
+    assert warm.data == ''
+    assert warm.record_lines == parsed.record_lines[:7]
+    # The Raw Text is Read Only when Accessed, from an Unchanged File
+    warm = pycev.Cev(event_file, cache_dir=cache_dir)
+    os.remove(event_file)
+    assert warm.record_lines == parsed.record_lines[:7]
+    assert warm.data == warm.record == ''
+
+
+def test_cache_is_keyed_on_decode_option(tmp_path):
+    """Records Decoded with Another Option are Not Served from the Cache."""
+    cache_dir = tmp_path / "cache"
+    path = tmp_path / "event.CEV"
+    path.write_bytes(
+        RELAY_DATA.encode("utf-8").replace(b"FEEDER 1", b"FEEDER \xff")
+    )
+    record = pycev.Cev(
+        str(path), cache_dir=cache_dir, encoding="utf-8",
+        decode_opt="replace", checksum="off",
+    )
+    assert "FEEDER \ufffd" in record.settings
+    with pytest.raises(UnicodeDecodeError):
+        pycev.Cev(
+            str(path), cache_dir=cache_dir, encoding="utf-8", checksum="off"
+        )
+
+
+def test_checksum_failures_reported_when_cached(tmp_path):
+    """Checksum Failures are Reported for Warm Loads as Well."""
+    cache_dir = tmp_path / "cache"
+    path = tmp_path / "corrupted.CEV"
+    write_cev(path, RELAY_DATA.replace("1000.0,", "1001.0,", 1))
+    for _ in range(2):
+        with pytest.warns(pycev.MalformedChecksumFailure):
+            record = pycev.Cev(str(path), cache_dir=cache_dir)
+        assert record.invalid_lines == [17]
+    with pytest.raises(pycev.MalformedChecksumFailure):
+        pycev.Cev(str(path), cache_dir=cache_dir, checksum="strict")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        record = pycev.Cev(str(path), cache_dir=cache_dir, checksum="deferred")
+    with pytest.warns(pycev.MalformedChecksumFailure):
+        assert record.validity is False
+
+
+def test_corrupted_entry_is_replaced(event_file, tmp_path):
+    """An Unreadable Entry is Parsed Again, and Replaced."""
+    cache_dir = tmp_path / "cache"
+    pycev.Cev(event_file, cache_dir=cache_dir)
+    entry = cache_dir / entries(cache_dir)[0]
+    entry.write_bytes(b"")
+    record = pycev.Cev(event_file, cache_dir=cache_dir)
+    assert record.get_analog("IA")[0] == pycev.Cev(event_file).get_analog(
+        "IA"
+    )[0]
+    assert entry.stat().st_size > 0
+
+
+def test_least_recently_used_evicted(tmp_path):
+    """Entries and References Beyond the Size Limit are Evicted."""
+    cache_dir = tmp_path / "cache"
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"event-{i}.CEV"
+        write_cev(path, RELAY_DATA.replace("TRIP", f"TR{i:02d}"))
+        paths.append(str(path))
+    pycev.Cev(paths[0], cache_dir=cache_dir, checksum="off")
+    size = sum(path.stat().st_size for path in cache_dir.iterdir())
+    first = entries(cache_dir)[0]
+    os.utime(cache_dir / first, (1, 1))  # Least Recently Used
+    for path in paths[1:]:
+        pycev.Cev(
+            path, cache_dir=cache_dir, checksum="off", cache_size=2 * size
+        )
+    assert len(entries(cache_dir)) == 2
+    assert first not in entries(cache_dir)
+    assert sum(path.stat().st_size for path in cache_dir.iterdir()) <= (
+        2 * size
+    )
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_parallel_load_from_warm_cache(event_file, tmp_path, backend):
+    """Records Loaded from the Cache are Returned from Worker Processes."""
+    cache_dir = tmp_path / "cache"
+    list(pycev.load_many([event_file], cache_dir=cache_dir, backend=backend))
+    results = list(pycev.load_many(
+        [event_file, event_file], workers=2, cache_dir=cache_dir,
+        backend=backend,
+    ))
+    parsed = pycev.Cev(event_file, backend=backend)
+    for result in results:
+        assert result.error is None
+        for name in parsed.analog_channel_ids:
+            assert list(result.record.get_analog(name)) == list(
+                parsed.get_analog(name)
+            )
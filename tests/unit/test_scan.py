@@ -0,0 +1,48 @@
+################################################################################
+"""PyCEV Tests - Validate Header-Only Scanning of CEV Files."""
+################################################################################
+# pylint: disable=import-error
+
+import io
+import datetime as dt
+import pytest
+
+import pycev
+from conftest import RELAY_DATA, SYNTHETIC_CEV
+
+
+def test_scan_matches_full_load():
+    """Scanning Provides the Same Metadata as a Full Load."""
+    scanned = pycev.Cev.scan(SYNTHETIC_CEV)
+    loaded = pycev.Cev(file=SYNTHETIC_CEV)
+    assert scanned.header_only
+    for attribute in ("fid", "raw_fid", "trigger_time", "frequency",
+                      "analog_channel_ids", "status_channel_ids"):
+        assert getattr(scanned, attribute) == getattr(loaded, attribute)
+    assert scanned.trigger_time == dt.datetime(2023, 1, 16, 10, 20, 30, 125000)
+    assert scanned.analog_channels == []
+    assert len(scanned.time) == 0
+
+
+def test_scan_stops_after_channel_heading():
+    """Scanning a Stream Reads No Further than the Channel Heading."""
+    with open(SYNTHETIC_CEV, encoding="utf-8") as file:
+        data = file.read()
+    stream = io.StringIO(data)
+    record = pycev.CEV(file=stream, header_only=True)
+    assert stream.tell() < data.index(pycev.EVENT_SETTINGS_SEP)
+    assert record.record_lines[-1].startswith('"IA","IB","IC"')
+
+
+def test_scan_reports_physical_lines():
+    """Checksum Failures are Reported by Line, Counting Blank Lines."""
+    data = RELAY_DATA.replace("\r\n", "\r\n\r\n", 1).replace(
+        "1,16,2023", "1,17,2023"
+    )
+    with pytest.warns(pycev.MalformedChecksumFailure):
+        loaded = pycev.CEV(data=data)
+    with pytest.warns(pycev.MalformedChecksumFailure):
+        scanned = pycev.CEV(file=io.StringIO(data), header_only=True)
+    assert scanned.invalid_lines == loaded.invalid_lines == [5]
+
+# END
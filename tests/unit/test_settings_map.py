@@ -0,0 +1,67 @@
+################################################################################
+"""PyCEV Tests - Validate the Indexed Relay Settings."""
+################################################################################
+# pylint: disable=import-error, redefined-outer-name
+
+import warnings
+import pytest
+
+import pycev
+from conftest import RELAY_DATA
+
+
+def test_settings_lookup():
+    """Settings are Found by Name, or by Group and Name."""
+    record = pycev.Cev(data=RELAY_DATA)
+    settings = record.settings_map
+    assert settings is record.settings_map
+    assert settings.groups == ["INFO", "1", "2"]
+    assert settings["51PP"] == "1.50"
+    assert settings["2", "51PP"] == "2.00"
+    assert settings["RID"] == "FEEDER 1"
+    assert settings["RELAYTYPE"] == "0351S"
+    assert list(settings) == ["RELAYTYPE", "FID", "RID", "CTR", "51PP"]
+    assert settings.group("2") == {"RID": "FEEDER 1", "51PP": "2.00"}
+    assert "CTR" in settings and ("2", "CTR") not in settings
+    with pytest.raises(KeyError):
+        _ = settings["50P1P"]
+    assert settings.invalid_lines == []
+
+
+def test_quoted_values():
+    """Quotes Doubled within a Value are Restored."""
+    settings = pycev.RelaySettings('\r\n'.join([
+        pycev.append_row_checksum('"[1]"'),
+        pycev.append_row_checksum('"RID,""SUB ""A"", FEEDER 1"""'),
+        pycev.append_row_checksum('"TID,"""""'),
+    ]))
+    assert settings["RID"] == 'SUB "A", FEEDER 1'
+    assert settings["TID"] == ''
+
+
+@pytest.mark.parametrize("mode", ["warn", "strict", "deferred"])
+def test_settings_checksums(mode):
+    """Corrupt Settings Rows are Reported as the Record Rows are."""
+    corrupt = RELAY_DATA.replace('"CTR,""120""","02A0"',
+                                 '"CTR,""600""","02A0"')
+    record = pycev.Cev(data=corrupt, checksum=mode)
+    if mode == "strict":
+        with pytest.raises(pycev.MalformedChecksumFailure):
+            _ = record.settings_map
+    elif mode == "warn":
+        with pytest.warns(pycev.MalformedChecksumFailure):
+            assert record.settings_map["CTR"] == "600"
+    else:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert record.settings_map["CTR"] == "600"
+    assert pycev.RelaySettings(record.settings).invalid_lines == [7]
+
+
+def test_compact_settings():
+    """The Compact Record Presents the Same Settings."""
+    record = pycev.Cev(data=RELAY_DATA).compact()
+    assert record.settings_map["CTR"] == "120"
+    assert len(pycev.Cev(data=RELAY_DATA).compact(
+        keep_settings=False
+    ).settings_map) == 0
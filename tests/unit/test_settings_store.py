@@ -0,0 +1,61 @@
+################################################################################
+"""PyCEV Tests - Validate the Deduplicated Settings Store."""
+################################################################################
+# pylint: disable=import-error, redefined-outer-name
+
+import pycev
+from conftest import RELAY_DATA, write_cev
+
+CHANGED_DATA = RELAY_DATA.replace('"51PP,""2.00""","02EA"',
+                                  '"51PP,""2.50""","02EF"')
+
+
+def test_records_share_settings():
+    """Records with Identical Settings Reference a Single Copy."""
+    store = pycev.SettingsStore()
+    first = pycev.Cev(data=RELAY_DATA, settings_store=store)
+    second = pycev.Cev(data=RELAY_DATA, settings_store=store)
+    changed = pycev.Cev(data=CHANGED_DATA, settings_store=store)
+    assert changed.settings_map.invalid_lines == []
+    assert len(store) == 2
+    assert first.settings is second.settings
+    assert first.settings_digest == second.settings_digest
+    assert first.settings_digest != changed.settings_digest
+    assert store[changed.settings_digest] == changed.settings
+    assert first.compact().settings_digest == first.settings_digest
+
+
+def test_digest_without_store():
+    """The Digest is Evaluated for Records without a Store."""
+    record = pycev.Cev(data=RELAY_DATA)
+    assert record.settings_digest == pycev.SettingsStore.digest(
+        record.settings
+    )
+    record.settings = ''
+    assert record.settings_digest == pycev.SettingsStore.digest('')
+
+
+def test_digest_of_undecodable_settings(tmp_path):
+    """Settings Decoded with Escaped Bytes are Hashed and Saved."""
+    record = pycev.Cev(data=RELAY_DATA)
+    record.settings = b'SID="BUS \xb0"'.decode('utf-8', 'surrogateescape')
+    assert record.settings_digest == pycev.SettingsStore.digest(
+        'SID="BUS \udcb0"'
+    )
+    record.save(tmp_path / "event.cevb")
+    restored = pycev.Cev.open_binary(tmp_path / "event.cevb")
+    assert restored.settings == record.settings
+    assert restored.settings_digest == record.settings_digest
+
+
+def test_collection_shares_settings(tmp_path):
+    """A Collection Holds One Copy of Each Distinct Settings."""
+    for i in range(4):
+        write_cev(tmp_path / f"event-{i}.CEV",
+                  CHANGED_DATA if i == 3 else RELAY_DATA)
+    events = pycev.CevCollection(tmp_path)
+    assert len(events) == 4
+    assert len(events.settings_store) == 2
+    assert events[0].settings is events[2].settings
+    digests = [record.settings_digest for record in events]
+    assert digests[0] == digests[1] == digests[2] != digests[3]
@@ -0,0 +1,62 @@
+################################################################################
+"""PyCEV Tests - Validate Packed Status (Digital) Channel Access."""
+################################################################################
+# pylint: disable=import-error
+
+import pytest
+
+import pycev
+from conftest import BACKENDS, RELAY_DATA, SYNTHETIC_CEV
+
+
+def test_status_channel_names_skip_unused_bits():
+    """Unused ('*') Bits are not Presented as Channels."""
+    record = pycev.CEV(file=SYNTHETIC_CEV)
+    assert record.status_channel_ids == [
+        "TRIP", "50P1", "IN101", "IN102", "OUT101", "51PT", "51P", "TRGTR",
+    ]
+    assert record.digital_count == record.status_count == 8
+
+
+def test_status_channel_bits_align_with_names():
+    """Each Named Channel Unpacks its Own Bit Position."""
+    record = pycev.CEV(file=SYNTHETIC_CEV)
+    assert record.get_status("TRIP") == [0] * 8 + [1] * 4
+    assert record.get_digital("IN101") == [1] * 12
+    assert record.get_status("IN102") == [0] * 12
+    assert record.get_status("TRGTR") == [0] * 9 + [1] * 3
+
+
+def test_status_channels_sequence():
+    """The Status Channel Sequence Unpacks Channels on Demand."""
+    record = pycev.CEV(file=SYNTHETIC_CEV)
+    assert len(record.status_channels) == 8
+    assert record.status_channels[0] == record.get_status("TRIP")
+    assert record.digital_channels[-1] == record.get_status("TRGTR")
+    assert list(record.status_channels)[1] == record.get_status("50P1")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_status_channels_without_samples(backend):
+    """Records without Samples Present Empty Status Channels."""
+    heading_end = RELAY_DATA.index("\n", RELAY_DATA.index('"IA"')) + 1
+    data = RELAY_DATA[:heading_end] + RELAY_DATA[
+        RELAY_DATA.index('"SETTINGS"'):
+    ]
+    stream = pycev.CevStreamParser(backend=backend)
+    stream.feed(data)
+    for record in (
+        pycev.CEV(data=data, backend=backend),
+        pycev.CEV(data=data, backend=backend, digitals=["IN101"]),
+        stream.close(),
+    ):
+        names = record.status_channel_ids
+        assert len(record.get_status(names[0])) == 0
+        assert [len(samples) for samples in record.get_statuses(names)] == [
+            0
+        ] * len(names)
+        assert [len(samples) for samples in record.status_channels] == [
+            0
+        ] * len(names)
+
+# END
@@ -0,0 +1,87 @@
+################################################################################
+"""PyCEV Tests - Validate Incremental Parsing of Streamed CEV Data."""
+################################################################################
+# pylint: disable=import-error
+
+import warnings
+import pytest
+
+import pycev
+from conftest import RELAY_DATA
+
+RELAY_BYTES = RELAY_DATA.encode("utf-8")
+
+
+def stream(parser, data, size):
+    """Feed the Data to the Parser in Chunks of the Given Size."""
+    for start in range(0, len(data), size):
+        parser.feed(data[start:start + size])
+
+
+@pytest.mark.parametrize("size", [1, 13, 4096])
+def test_stream_matches_full_load(size):
+    """Streaming in Chunks of any Size Matches a Full Load."""
+    loaded = pycev.CEV(data=RELAY_DATA)
+    parser = pycev.CevStreamParser()
+    stream(parser, RELAY_BYTES, size)
+    record = parser.close()
+    assert record.fid == loaded.fid
+    assert record.trigger_time == loaded.trigger_time
+    assert record.analog_channels == loaded.analog_channels
+    assert record.get_statuses(["TRIP", "TRGTR"]) == \
+        loaded.get_statuses(["TRIP", "TRGTR"])
+    assert list(record.time) == list(loaded.time)
+    assert record.settings == loaded.settings
+    assert record.validity
+
+
+def test_heading_available_before_samples():
+    """Header Information is Available Once the Heading Arrives."""
+    parser = pycev.CevStreamParser()
+    heading_end = RELAY_BYTES.index(b'"IA","IB"')
+    heading_end = RELAY_BYTES.index(b"\n", heading_end) + 1
+    parser.feed(RELAY_BYTES[:heading_end])
+    assert not parser.heading_received
+    # The Heading is Known to be Complete Once Sample Rows Follow It
+    sample_end = RELAY_BYTES.index(b"\n", heading_end) + 1
+    sample_end = RELAY_BYTES.index(b"\n", sample_end) + 1
+    parser.feed(RELAY_BYTES[heading_end:sample_end])
+    assert parser.heading_received
+    assert parser.record.fid == "SEL-351S-7-R514-V0-Z103103-D20140408"
+    assert "TRGTR" in parser.record.status_channel_ids
+
+
+def test_stream_checksum_failures():
+    """Checksum Failures are Reported as the Data Arrives."""
+    corrupted = RELAY_BYTES.replace(b"1000.0,", b"1001.0,", 1)
+    parser = pycev.CevStreamParser(checksum="strict")
+    with pytest.raises(pycev.MalformedChecksumFailure):
+        stream(parser, corrupted, 64)
+    parser = pycev.CevStreamParser()
+    stream(parser, corrupted, 64)
+    with pytest.warns(pycev.MalformedChecksumFailure):
+        record = parser.close()
+    assert record.invalid_lines == [17]
+
+
+def test_stream_deferred_checksums(monkeypatch):
+    """Deferred Checksums are Validated Together, Once Closed."""
+    corrupted = RELAY_BYTES.replace(b"1000.0,", b"1001.0,", 1)
+    validated = []
+    validate = pycev.validate_record_checksums
+    monkeypatch.setattr(
+        pycev, "validate_record_checksums",
+        lambda record: validated.append(record) or validate(record),
+    )
+    parser = pycev.CevStreamParser(checksum="deferred")
+    stream(parser, corrupted, 64)
+    assert not validated
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        record = parser.close()
+    assert len(validated) == 1
+    with pytest.warns(pycev.MalformedChecksumFailure):
+        assert record.validity is False
+    assert record.invalid_lines == [17]
+
+# END
@@ -0,0 +1,68 @@
+################################################################################
+"""PyCEV Tests - Validate the Lazy Time Axis."""
+################################################################################
+# pylint: disable=import-error
+
+import datetime as dt
+import pytest
+
+import pycev
+from conftest import RELAY_DATA, SYNTHETIC_CEV
+
+# Record the Digitals at Half the Analog Sample Rate
+HALF_RATE_DATA = RELAY_DATA.replace('60.00,4,4,3,"AG T","TRIP 50","05DF"',
+                                    '60.00,4,2,3,"AG T","TRIP 50","05DD"')
+
+
+def test_time_axis_indexing():
+    """Timestamps are Evaluated from their Index."""
+    axis = pycev.TimeAxis(dt.datetime(2023, 1, 16), period=0.001, count=4)
+    assert len(axis) == 4
+    assert axis[-1] == dt.datetime(2023, 1, 16, 0, 0, 0, 3000)
+    assert list(axis[1::2]) == [
+        dt.datetime(2023, 1, 16, 0, 0, 0, 1000),
+        dt.datetime(2023, 1, 16, 0, 0, 0, 3000),
+    ]
+    with pytest.raises(IndexError):
+        axis[4]  # pylint: disable=pointless-statement
+
+def test_record_time_axis_is_anchored_at_trigger():
+    """The Trigger Sample Lands Exactly on the Trigger Time."""
+    record = pycev.CEV(file=SYNTHETIC_CEV)
+    assert len(record.time) == 12
+    assert record.time[8] == record.trigger_time
+    assert record.time[0] == dt.datetime(2023, 1, 16, 10, 20, 30, 91667)
+    assert record.time[1:][7] == record.trigger_time
+    assert len(record.digital_time) == 12
+
+
+def test_digital_time_axis_at_lower_rate():
+    """Digital Samples Span the Analog Rows at their Own Sample Rate."""
+    record = pycev.CEV(data=HALF_RATE_DATA)
+    assert len(record.time) == 12
+    assert len(record.digital_time) == 6
+    assert record.digital_time[0] == record.time[0]
+    assert record.digital_time[4] == record.trigger_time
+    assert record.digital_time[5] == record.time[10]
+    # Slices Retain the Digital Samples within the Same Span of Time
+    window = record.window(-5 / 240, 2 / 240)
+    assert list(window.time) == list(record.time[3:10])
+    assert list(window.digital_time) == [
+        record.time[4], record.time[6], record.time[8]
+    ]
+    window = window.window(-3 / 240, 0)
+    assert list(window.digital_time) == [record.time[6]]
+
+
+def test_record_time_axis_as_arrays():
+    """The Time Axis can be Evaluated as Arrays on Demand."""
+    np = pytest.importorskip("numpy")
+    record = pycev.CEV(file=SYNTHETIC_CEV)
+    stamps = record.time.to_numpy()
+    assert stamps.dtype == np.dtype("datetime64[ns]")
+    assert stamps[8] == np.datetime64(record.trigger_time, "ns")
+    seconds = record.time.to_seconds(origin=record.trigger_time)
+    assert seconds[8] == pytest.approx(0.0)
+    assert seconds[9] == pytest.approx(1 / 240)
+
+# END
@@ -0,0 +1,69 @@
+################################################################################
+"""PyCEV Tests - Validate the Structured Validation Report."""
+################################################################################
+# pylint: disable=import-error
+
+import warnings
+import pytest
+
+import pycev
+from conftest import RELAY_DATA, write_cev
+
+
+def test_valid_record():
+    """Records without Problems Report None."""
+    record = pycev.Cev(data=RELAY_DATA)
+    assert record.validation.ok
+    assert record.validation.invalid_lines == []
+    assert record.validation.extension is None
+    assert record.validation.anomalies == []
+
+
+def test_invalid_lines_reported():
+    """Checksum Failures are Reported, and Warned of by the Caller."""
+    with pytest.warns(pycev.MalformedChecksumFailure) as caught:
+        record = pycev.Cev(data=RELAY_DATA.replace("1000.0,", "1001.0,", 1))
+    assert caught[0].filename == __file__
+    assert not record.validation.ok
+    assert record.validation.invalid_lines == [17]
+
+
+def test_invalid_lines_deferred():
+    """Deferred Checksums are Reported Once they are Evaluated."""
+    record = pycev.Cev(
+        data=RELAY_DATA.replace("1000.0,", "1001.0,", 1),
+        checksum="deferred",
+        ignore_warnings=True,
+    )
+    assert record.validation.invalid_lines is None
+    assert record.validity is False
+    assert record.validation.invalid_lines == [17]
+
+
+def test_extension_reported(tmp_path):
+    """Unexpected File Extensions are Reported."""
+    path = tmp_path / "event.txt"
+    write_cev(path, RELAY_DATA)
+    with pytest.warns(pycev.UnexpectedFileExtension) as caught:
+        record = pycev.Cev(str(path))
+    assert caught[0].filename == __file__
+    assert record.validation.extension == ".txt"
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        record = pycev.Cev(str(path), ignore_warnings=True)
+    assert record.validation.extension == ".txt"
+
+
+def test_anomalies_reported():
+    """Samples which Disagree with the Header are Reported."""
+    # Remove the Final Sample Row, and the Trigger Marker
+    data = [
+        pycev.append_row_checksum(line[:-8].replace('">"', '""')) + '\r'
+        if '">"' in line else line
+        for line in RELAY_DATA.split('\n') if not line.startswith('-1000.0')
+    ]
+    record = pycev.Cev(data='\n'.join(data))
+    assert record.validation.invalid_lines == []
+    assert len(record.validation.anomalies) == 2
+    assert "trigger" in record.validation.anomalies[0]
+    assert "11 samples" in record.validation.anomalies[1]
@@ -0,0 +1,40 @@
+################################################################################
+"""PyCEV Tests - Validate Time-Window and Trigger-Relative Slicing."""
+################################################################################
+# pylint: disable=import-error
+
+import pytest
+
+import pycev
+from conftest import SYNTHETIC_CEV
+
+
+def test_cycles_surrounding_trigger():
+    """Extract One Cycle Before to Half a Cycle After the Trigger."""
+    record = pycev.CEV(file=SYNTHETIC_CEV)
+    fault = record.cycles(pre=1, post=0.5)
+    assert len(fault.time) == 6
+    assert fault.time[4] == record.trigger_time
+    assert fault.get_analog("IA") == record.get_analog("IA")[4:10]
+    assert fault.get_status("TRIP") == [0, 0, 0, 0, 1, 1]
+    # The Original Record is Left Untouched
+    assert len(record.time) == 12
+
+
+def test_window_by_datetime_is_clipped():
+    """Windows Extending Beyond the Record are Clipped to the Samples."""
+    record = pycev.CEV(file=SYNTHETIC_CEV)
+    window = record.window(record.time[10], 1.0)
+    assert len(window.time) == 2
+    assert window.get_status("TRGTR") == [1, 1]
+
+
+def test_window_is_view_with_numpy():
+    """Windows Share Memory with the Record when Using NumPy."""
+    np = pytest.importorskip("numpy")
+    record = pycev.CEV(file=SYNTHETIC_CEV, backend="numpy")
+    fault = record.cycles(pre=2, post=1)
+    assert fault.analog_channels.shape == (5, 12)
+    assert np.shares_memory(fault.get_analog("IA"), record.analog_channels)
+
+# END
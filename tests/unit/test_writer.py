@@ -0,0 +1,115 @@
+################################################################################
+"""PyCEV Tests - Validate Writing and Building CEV Records."""
+################################################################################
+# pylint: disable=import-error, redefined-outer-name
+
+import datetime as dt
+import warnings
+import pytest
+
+import pycev
+from conftest import BACKENDS, RELAY_DATA
+
+
+def test_append_row_checksum():
+    """Rows Formed with their Checksum Validate Successfully."""
+    for line in RELAY_DATA.splitlines():
+        if line:
+            row = pycev.append_row_checksum(line[:-7])
+            assert row == line
+            assert pycev.row_wise_checksum(row).validity
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_round_trip(backend):
+    """Records Written as CEV Data are Read Back Unchanged."""
+    record = pycev.Cev(data=RELAY_DATA, backend=backend)
+    data = record.dumps()
+    assert pycev.validate_record_checksums(data) == set()
+    assert data.splitlines()[:6] == RELAY_DATA.splitlines()[:6]
+    assert data.split(pycev.EVENT_SETTINGS_SEP)[1] == record.settings
+    reread = pycev.Cev(data=data, backend=backend)
+    assert reread.validity
+    assert reread.trigger_time == record.trigger_time
+    assert list(reread.time) == list(record.time)
+    for name in record.analog_channel_ids:
+        assert list(reread.get_analog(name)) == list(record.get_analog(name))
+    for name in record.status_channel_ids:
+        assert list(reread.get_status(name)) == list(record.get_status(name))
+
+
+def test_dump_trimmed_record(tmp_path):
+    """Trimmed Records, and Selected Channels, are Written Consistently."""
+    record = pycev.Cev(data=RELAY_DATA, digitals=["51P", "TRIP"])
+    record.window(-0.005, 0.010).dump(tmp_path / "trimmed.CEV")
+    trimmed = pycev.Cev(str(tmp_path / "trimmed.CEV"))
+    assert trimmed.validity
+    assert trimmed.status_channel_ids == ["TRIP", "51P"]
+    assert trimmed.get_analog("IA") == [-100.0, -0.0, 1000.0, 0.0]
+    assert trimmed.get_status("TRIP") == [0, 1, 1, 1]
+    assert trimmed.trigger_time == record.trigger_time
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("start, end", [
+    (-0.005, 0.010),  # Surrounding the Trigger
+    (0.004, 0.020),  # Following the Trigger
+    (-0.030, -0.010),  # Preceding the Trigger
+])
+def test_round_trip_window(backend, start, end):
+    """Windows of a Record are Read Back with their Timestamps."""
+    record = pycev.Cev(data=RELAY_DATA, backend=backend).window(start, end)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        reread = pycev.Cev(data=record.dumps(), backend=backend)
+    assert reread.validity
+    assert not reread.validation.anomalies
+    assert len(reread.time) == len(record.time)
+    for written, read in zip(record.time, reread.time):
+        assert abs((read - written).total_seconds()) <= 0.0005
+    assert list(reread.get_analog("IA")) == list(record.get_analog("IA"))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_round_trip_cycles(backend):
+    """Cycles of a Record are Read Back, Describing their Number."""
+    record = pycev.Cev(data=RELAY_DATA, backend=backend).cycles(
+        pre=1, post=1
+    )
+    reread = pycev.Cev(data=record.dumps(), backend=backend)
+    assert not reread.validation.anomalies
+    assert reread.num_of_cyc == "2"
+    assert reread.trigger_time == record.trigger_time
+    assert list(reread.time) == list(record.time)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_from_channels(backend):
+    """Records are Built from the Channel Samples."""
+    trigger_time = dt.datetime(2024, 2, 29, 12, 30, 15, 250000)
+    record = pycev.Cev.from_channels(
+        analogs={"IA": [0.0, 100.0, 0.0, -100.0], "VA(kV)": [1, 2, 3, 4]},
+        statuses={f"OUT{i}": [i % 2, 1, 0, 1] for i in range(10)},
+        trigger_time=trigger_time,
+        trigger_row=2,
+        frequency=50,
+        fid="SEL-TEST",
+        header={"EVENT": "AG T"},
+        backend=backend,
+    )
+    for built in (record, pycev.Cev(data=record.dumps(), backend=backend)):
+        assert built.validity
+        assert built.fid == "SEL-TEST"
+        assert built.event == "AG T"
+        assert built.frequency == 50.0
+        assert built.trigger_time == trigger_time
+        assert built.time[2] == trigger_time
+        assert list(built.get_analog("VA(kV)")) == [1.0, 2.0, 3.0, 4.0]
+        assert list(built.get_status("OUT9")) == [1, 1, 0, 1]
+        assert list(built.get_status("OUT0")) == [0, 1, 0, 1]
+
+
+def test_from_channels_unequal_lengths():
+    """Channels of Unequal Length are Rejected."""
+    with pytest.raises(ValueError):
+        pycev.Cev.from_channels({"IA": [0.0, 1.0], "IB": [0.0]})